@@ -14,6 +14,7 @@ test_requirements = [
     "pytest>=7.0.0",
     "pytest-cov>=4.0.0",
     "mock>=5.0.0",
+    "httpx>=0.27.0",
 ]
 
 setup(
@@ -50,9 +51,11 @@ setup(
         "Topic :: Software Development :: Libraries",
     ],
     python_requires=">=3.10",
-    install_requires=["requests>=2.32", "six", "backoff>=2.2.1", "pyjwt>=2.8.0"],
+    install_requires=["requests>=2.32", "six", "pyjwt>=2.8.0"],
     tests_require=test_requirements,
     extras_require={
+        "async": ["httpx>=0.27.0"],
+        "orjson": ["orjson>=3.8"],
         "test": test_requirements,
         "dev": test_requirements + ["black", "isort", "flake8"],
     },
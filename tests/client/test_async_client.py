@@ -0,0 +1,308 @@
+import asyncio
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+import mock
+
+import urbanairship as ua
+from tests import TEST_KEY, TEST_SECRET, TEST_TOKEN
+from urbanairship.async_client import (
+    AsyncBasicAuthClient,
+    AsyncBearerTokenClient,
+    AsyncOAuthClient,
+)
+from urbanairship.token_store import token_cache_key
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+def mock_transport(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.requests = []
+        self.airship = AsyncBasicAuthClient(TEST_KEY, TEST_SECRET, retries=1)
+
+        def handler(request):
+            self.requests.append(request)
+            return httpx.Response(
+                200, json={"ok": True, "push_ids": ["0492662a-1b52-4343-a1f9-c6b0c72931c0"]}
+            )
+
+        auth = self.airship.session.auth
+        await self.airship.session.aclose()
+        self.airship.session = mock_transport(handler)
+        self.airship.session.auth = auth
+
+    async def asyncTearDown(self):
+        await self.airship.aclose()
+
+    def test_client_settings(self):
+        self.assertEqual(self.airship.retries, 1)
+        self.assertEqual(
+            self.airship.urls.get("push_url"), "https://go.urbanairship.com/api/push/"
+        )
+
+    async def test_push_send_async(self):
+        push = ua.Push(self.airship)
+        push.audience = ua.all_
+        push.notification = ua.notification(alert="Hello")
+        push.device_types = ua.all_
+
+        response = await push.send_async()
+
+        self.assertEqual(response.push_ids, ["0492662a-1b52-4343-a1f9-c6b0c72931c0"])
+        request = self.requests[0]
+        self.assertEqual(str(request.url), "https://go.urbanairship.com/api/push/")
+        self.assertEqual(request.headers["Content-type"], "application/json")
+        self.assertEqual(
+            request.headers["Accept"], "application/vnd.urbanairship+json; version=3;"
+        )
+        self.assertTrue(request.headers["Authorization"].startswith("Basic "))
+        self.assertEqual(json.loads(request.content)["audience"], "all")
+
+    async def test_channel_tags_send_async(self):
+        tags = ua.ChannelTags(self.airship)
+        tags.set_audience(ios="ios_channel")
+        tags.add("group", ["tag1"])
+
+        self.assertEqual(await tags.send_async(), {"ok": True, "push_ids": mock.ANY})
+        self.assertEqual(
+            json.loads(self.requests[0].content),
+            {"audience": {"ios_channel": "ios_channel"}, "add": {"group": ["tag1"]}},
+        )
+
+    async def test_custom_event_send_async(self):
+        event = ua.CustomEvent(self.airship, name="purchase", user={"channel": "abc"})
+
+        await event.send_async()
+
+        self.assertEqual(
+            str(self.requests[0].url), "https://go.urbanairship.com/api/custom-events/"
+        )
+
+    async def test_large_body_compressed(self):
+        self.airship.compress_threshold = 256
+        push = ua.Push(self.airship)
+        push.audience = ua.or_(
+            *[ua.channel("0492662a-1b52-4343-a1f9-%012d" % i) for i in range(20)]
+        )
+        push.notification = ua.notification(alert="Hello")
+        push.device_types = ua.all_
+
+        await push.send_async()
+
+        request = self.requests[0]
+        self.assertEqual(request.headers["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(request.content)), push.payload)
+
+    async def test_retry_then_failure(self):
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            return httpx.Response(500, json={"ok": False, "error": "boom"})
+
+        await self.airship.session.aclose()
+        self.airship.session = mock_transport(handler)
+
+        with mock.patch("asyncio.sleep", new=mock.AsyncMock()):
+            with self.assertRaises(ua.AirshipFailure):
+                await self.airship.request("GET", None, self.airship.urls.get("push_url"))
+
+        self.assertEqual(len(attempts), 2)
+
+    async def test_unauthorized(self):
+        await self.airship.session.aclose()
+        self.airship.session = mock_transport(lambda request: httpx.Response(401))
+
+        with self.assertRaises(ua.Unauthorized):
+            await self.airship.request("GET", None, self.airship.urls.get("push_url"))
+
+    async def test_connection_failure(self):
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        await self.airship.session.aclose()
+        self.airship.session = mock_transport(handler)
+
+        with mock.patch("asyncio.sleep", new=mock.AsyncMock()):
+            with self.assertRaises(ua.ConnectionFailure):
+                await self.airship.request("GET", None, self.airship.urls.get("push_url"))
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncAuthClients(unittest.IsolatedAsyncioTestCase):
+    async def test_bearer_token_headers(self):
+        async with AsyncBearerTokenClient(TEST_KEY, TEST_TOKEN) as airship:
+            self.assertEqual(airship.session.headers["Authorization"], f"Bearer {TEST_TOKEN}")
+            self.assertEqual(airship.session.headers["X-UA-Appkey"], TEST_KEY)
+
+    async def test_oauth_token_fetched_before_request(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            if request.url.host == "oauth2.asnapius.com":
+                return httpx.Response(200, json={"access_token": "abc", "expires_in": 3600})
+            return httpx.Response(200, json={"ok": True})
+
+        airship = AsyncOAuthClient(key=TEST_KEY, client_id=TEST_KEY, private_key="key")
+        await airship.aclose()
+        airship.session = mock_transport(handler)
+        airship.token_session = mock_transport(handler)
+
+        with mock.patch("urbanairship.async_client._oauth_assertion", return_value="jwt"):
+            await airship.request("GET", None, airship.urls.get("push_url"))
+            await airship.request("GET", None, airship.urls.get("push_url"))
+
+        await airship.aclose()
+
+        self.assertEqual(
+            [r.url.host for r in seen],
+            ["oauth2.asnapius.com", "api.asnapius.com", "api.asnapius.com"],
+        )
+        self.assertEqual(seen[1].headers["Authorization"], "Bearer abc")
+
+    async def test_pool_limits(self):
+        async with AsyncBasicAuthClient(
+            TEST_KEY, TEST_SECRET, pool_maxsize=50, pool_block=True
+        ) as airship:
+            pool = airship.session._transport._pool
+            self.assertEqual(pool._max_connections, 50)
+            self.assertEqual(pool._max_keepalive_connections, 50)
+
+    async def test_oauth_single_flight_refresh(self):
+        token_requests = []
+
+        async def token_handler(request):
+            token_requests.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"access_token": "abc", "expires_in": 3600})
+
+        airship = AsyncOAuthClient(key=TEST_KEY, client_id=TEST_KEY, private_key="key")
+        await airship.aclose()
+        airship.session = mock_transport(lambda request: httpx.Response(200, json={"ok": True}))
+        airship.token_session = mock_transport(token_handler)
+
+        with mock.patch("urbanairship.async_client._oauth_assertion", return_value="jwt"):
+            await asyncio.gather(
+                *(airship.request("GET", None, airship.urls.push_url) for _ in range(10))
+            )
+
+        await airship.aclose()
+        self.assertEqual(len(token_requests), 1)
+
+    async def test_oauth_background_refresh(self):
+        airship = AsyncOAuthClient(
+            key=TEST_KEY, client_id=TEST_KEY, private_key="key", background_refresh=True
+        )
+        await airship.aclose()
+        airship.session = mock_transport(lambda request: httpx.Response(200, json={"ok": True}))
+        airship.token_session = mock_transport(
+            lambda request: httpx.Response(200, json={"access_token": "abc", "expires_in": 3600})
+        )
+
+        with mock.patch("urbanairship.async_client._oauth_assertion", return_value="jwt"):
+            await airship.request("GET", None, airship.urls.push_url)
+
+        task = airship._refresh_task
+        self.assertIsNotNone(task)
+        await airship.aclose()
+        await asyncio.sleep(0)
+        self.assertTrue(task.cancelled())
+
+    async def test_oauth_token_store(self):
+        store = ua.MemoryTokenStore()
+        store.set(token_cache_key(TEST_KEY, TEST_KEY), ("stored", int(time.time()) + 3600))
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"ok": True})
+
+        airship = AsyncOAuthClient(
+            key=TEST_KEY, client_id=TEST_KEY, private_key="key", token_store=store
+        )
+        await airship.aclose()
+        airship.session = mock_transport(handler)
+        airship.token_session = mock_transport(handler)
+
+        await airship.request("GET", None, airship.urls.push_url)
+        await airship.aclose()
+
+        self.assertEqual([r.url.host for r in seen], ["api.asnapius.com"])
+        self.assertEqual(seen[0].headers["Authorization"], "Bearer stored")
+
+    async def test_oauth_file_token_store_single_fetch(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        store = ua.FileTokenStore(os.path.join(directory, "tokens.json"))
+        token_requests = []
+
+        async def token_handler(request):
+            token_requests.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"access_token": "abc", "expires_in": 3600})
+
+        airships = []
+        for _ in range(2):
+            airship = AsyncOAuthClient(
+                key=TEST_KEY, client_id=TEST_KEY, private_key="key", token_store=store
+            )
+            await airship.aclose()
+            airship.session = mock_transport(
+                lambda request: httpx.Response(200, json={"ok": True})
+            )
+            airship.token_session = mock_transport(token_handler)
+            airships.append(airship)
+
+        with mock.patch("urbanairship.async_client._oauth_assertion", return_value="jwt"):
+            await asyncio.gather(
+                *(airship.request("GET", None, airship.urls.push_url) for airship in airships)
+            )
+
+        for airship in airships:
+            await airship.aclose()
+        self.assertEqual(len(token_requests), 1)
+        self.assertEqual([airship.token for airship in airships], ["abc", "abc"])
+
+    async def test_oauth_token_store_off_event_loop(self):
+        threads = []
+
+        class RecordingStore(ua.MemoryTokenStore):
+            def get(self, cache_key):
+                threads.append(threading.get_ident())
+                return super().get(cache_key)
+
+            def set(self, cache_key, token):
+                threads.append(threading.get_ident())
+                super().set(cache_key, token)
+
+        airship = AsyncOAuthClient(
+            key=TEST_KEY, client_id=TEST_KEY, private_key="key", token_store=RecordingStore()
+        )
+        await airship.aclose()
+        airship.session = mock_transport(lambda request: httpx.Response(200, json={"ok": True}))
+        airship.token_session = mock_transport(
+            lambda request: httpx.Response(200, json={"access_token": "abc", "expires_in": 3600})
+        )
+
+        with mock.patch("urbanairship.async_client._oauth_assertion", return_value="jwt"):
+            await airship.request("GET", None, airship.urls.push_url)
+        await airship.aclose()
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.get_ident(), threads)
@@ -1,4 +1,11 @@
+import gzip
+import json
+import logging
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import mock
+import requests
 
 from tests import TEST_KEY, TEST_SECRET
 from urbanairship.client import BasicAuthClient
@@ -41,3 +48,199 @@ class TestBasicClient(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             BasicAuthClient(key=TEST_KEY, secret=TEST_SECRET, location=invalid_location)
+
+
+class TestBasicClientRequest(unittest.TestCase):
+    def setUp(self):
+        self.airship = BasicAuthClient(key=TEST_KEY, secret=TEST_SECRET)
+
+    def _ok_response(self):
+        response = requests.Response()
+        response._content = b'{"ok": true}'
+        response.status_code = 200
+        return response
+
+    def test_request_headers_not_set_on_session(self):
+        session_headers = dict(self.airship.session.headers)
+
+        with mock.patch.object(self.airship.session, "request") as mock_request:
+            mock_request.return_value = self._ok_response()
+            self.airship.request(
+                "POST", "{}", self.airship.urls.get("push_url"), "application/json", 3
+            )
+
+        self.assertEqual(dict(self.airship.session.headers), session_headers)
+        headers = mock_request.call_args.kwargs["headers"]
+        self.assertEqual(headers["Content-type"], "application/json")
+        self.assertEqual(headers["Accept"], "application/vnd.urbanairship+json; version=3;")
+
+    def test_concurrent_requests_keep_their_headers(self):
+        seen = []
+
+        def fake_request(method, url, **kwargs):
+            seen.append(
+                (kwargs["headers"].get("Content-type"), kwargs["headers"].get("Content-Encoding"))
+            )
+            return self._ok_response()
+
+        def send(i):
+            if i % 2:
+                self.airship.request(
+                    "PUT", "a,b", "https://example.com", "text/csv", 3, None, "gzip"
+                )
+            else:
+                self.airship.request("POST", "{}", "https://example.com", "application/json", 3)
+
+        with mock.patch.object(self.airship.session, "request", side_effect=fake_request):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(send, range(40)))
+
+        self.assertEqual(sorted(set(seen)), [("application/json", None), ("text/csv", "gzip")])
+        self.assertNotIn("Content-Encoding", self.airship.session.headers)
+
+    def test_pool_settings(self):
+        airship = BasicAuthClient(
+            key=TEST_KEY, secret=TEST_SECRET, pool_connections=4, pool_maxsize=64, pool_block=True
+        )
+
+        adapter = airship.session.get_adapter("https://go.urbanairship.com/api/")
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 64)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(airship.session.headers["Connection"], "keep-alive")
+
+    def test_keep_alive_disabled(self):
+        airship = BasicAuthClient(key=TEST_KEY, secret=TEST_SECRET, keep_alive=False)
+
+        self.assertEqual(airship.session.headers["Connection"], "close")
+
+
+class TestBasicClientLogging(unittest.TestCase):
+    def setUp(self):
+        self.airship = BasicAuthClient(key=TEST_KEY, secret=TEST_SECRET)
+        self.response = requests.Response()
+        self.response._content = b'{"ok": true, "push_ids": ["a", "b", "c"]}'
+        self.response.status_code = 200
+        self.response.headers["Set-Cookie"] = "session=abc"
+
+    def _send(self, headers):
+        with mock.patch.object(self.airship.session, "request", return_value=self.response):
+            with mock.patch.object(self.airship, "_request_headers", return_value=headers):
+                self.airship.request("POST", '{"audience": "all"}', "https://example.com")
+
+    def test_nothing_formatted_when_debug_disabled(self):
+        logger = logging.getLogger("urbanairship")
+        with mock.patch.object(logger, "isEnabledFor", return_value=False):
+            with mock.patch.object(self.airship, "_format_headers") as format_headers:
+                with mock.patch.object(self.airship, "_format_body") as format_body:
+                    self._send({"Authorization": "Bearer secret"})
+
+        format_headers.assert_not_called()
+        format_body.assert_not_called()
+
+    def test_secrets_redacted(self):
+        with self.assertLogs("urbanairship", level="DEBUG") as logs:
+            self._send({"Authorization": "Bearer secret", "Accept": "application/json"})
+
+        output = "\n".join(logs.output)
+        self.assertNotIn("secret", output)
+        self.assertNotIn("session=abc", output)
+        self.assertIn("Authorization: [REDACTED]", output)
+        self.assertIn("Accept: application/json", output)
+
+    def test_redaction_disabled(self):
+        self.airship.log_redact = False
+
+        with self.assertLogs("urbanairship", level="DEBUG") as logs:
+            self._send({"Authorization": "Bearer secret"})
+
+        self.assertIn("Authorization: Bearer secret", "\n".join(logs.output))
+
+    def test_bodies_truncated(self):
+        self.airship.log_body_limit = 10
+
+        with self.assertLogs("urbanairship", level="DEBUG") as logs:
+            self._send({})
+
+        request_log, response_log = logs.output
+        self.assertIn("""'{"audience'... [9 more]""", request_log)
+        self.assertIn("""b'{"ok": tru'... [31 more]""", response_log)
+
+
+class TestBasicClientCompression(unittest.TestCase):
+    def setUp(self):
+        self.airship = BasicAuthClient(key=TEST_KEY, secret=TEST_SECRET, compress_threshold=1024)
+        self.body = json.dumps({"audience": {"channel": ["%036d" % i for i in range(100)]}})
+        self.response = requests.Response()
+        self.response._content = b'{"ok": true}'
+        self.response.status_code = 200
+
+    def _send(self, body, content_type="application/json", encoding=None):
+        with mock.patch.object(
+            self.airship.session, "request", return_value=self.response
+        ) as mock_request:
+            self.airship.request(
+                "POST", body, self.airship.urls.push_url, content_type, 3, None, encoding
+            )
+        return mock_request.call_args.kwargs
+
+    def test_large_json_body_compressed(self):
+        sent = self._send(self.body)
+
+        self.assertEqual(sent["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(sent["headers"]["Content-type"], "application/json")
+        self.assertLess(len(sent["data"]), len(self.body))
+        self.assertEqual(gzip.decompress(sent["data"]).decode("utf-8"), self.body)
+
+    def test_compression_level(self):
+        self.airship.compress_level = 1
+        fast = self._send(self.body)["data"]
+        self.airship.compress_level = 9
+        small = self._send(self.body)["data"]
+
+        self.assertEqual(gzip.decompress(fast), gzip.decompress(small))
+        self.assertLessEqual(len(small), len(fast))
+
+    def test_small_body_not_compressed(self):
+        sent = self._send('{"audience": "all"}')
+
+        self.assertNotIn("Content-Encoding", sent["headers"])
+        self.assertEqual(sent["data"], b'{"audience": "all"}')
+
+    def test_non_json_body_not_compressed(self):
+        csv = "channel_id\n" * 500
+
+        self.assertEqual(self._send(csv, "text/csv")["data"], csv)
+        self.assertEqual(self._send(csv, "text/csv", "gzip")["data"], csv)
+
+    def test_disabled_by_default(self):
+        self.airship.compress_threshold = None
+
+        sent = self._send(self.body)
+
+        self.assertNotIn("Content-Encoding", sent["headers"])
+        self.assertEqual(sent["data"], self.body)
+
+    def test_retries_resend_compressed_body(self):
+        self.airship.retries = 1
+        failure = requests.Response()
+        failure._content = b'{"ok": false}'
+        failure.status_code = 500
+        sent = []
+
+        def fake_request(method, url, **kwargs):
+            sent.append(kwargs["data"])
+            return failure if len(sent) == 1 else self.response
+
+        with mock.patch.object(self.airship.session, "request", side_effect=fake_request):
+            with mock.patch("time.sleep"):
+                self.airship.request("POST", self.body, self.airship.urls.push_url)
+
+        self.assertEqual(len(sent), 2)
+        self.assertIs(sent[0], sent[1])
+
+    def test_compressed_body_not_logged(self):
+        with self.assertLogs("urbanairship", level="DEBUG") as logs:
+            sent = self._send(self.body)
+
+        self.assertIn("[gzip, %d bytes]" % len(sent["data"]), logs.output[0])
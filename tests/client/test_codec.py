@@ -0,0 +1,129 @@
+import datetime
+import json
+import unittest
+
+import mock
+import requests
+
+import urbanairship as ua
+from tests import TEST_KEY, TEST_SECRET
+from urbanairship.client import BasicAuthClient
+from urbanairship.codec import default_codec
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _response(status_code, content):
+    response = requests.Response()
+    response._content = content
+    response.status_code = status_code
+    return response
+
+
+class RecordingCodec(ua.StdlibJsonCodec):
+    def __init__(self):
+        self.dumped = []
+        self.loaded = []
+
+    def dumps(self, obj):
+        self.dumped.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.loaded.append(data)
+        return super().loads(data)
+
+
+class TestStdlibJsonCodec(unittest.TestCase):
+    def setUp(self):
+        self.codec = ua.StdlibJsonCodec()
+
+    def test_round_trip(self):
+        payload = {"audience": {"tag": ["a", "b"]}, "alert": "héllo", "count": 3}
+
+        body = self.codec.dumps(payload)
+
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(self.codec.loads(body), payload)
+        self.assertEqual(self.codec.loads(body.decode("utf-8")), payload)
+
+    def test_compact_separators(self):
+        self.assertEqual(self.codec.dumps({"a": [1, 2]}), b'{"a":[1,2]}')
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            self.codec.dumps({"when": datetime.datetime(2020, 1, 1)})
+        with self.assertRaises(ValueError):
+            self.codec.loads(b"not json")
+
+
+@unittest.skipIf(orjson is None, "orjson is not installed")
+class TestOrjsonCodec(unittest.TestCase):
+    def setUp(self):
+        self.codec = ua.OrjsonCodec()
+
+    def test_round_trip(self):
+        payload = {"audience": {"tag": ["a", "b"]}, "alert": "héllo", "count": 3}
+
+        body = self.codec.dumps(payload)
+
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(json.loads(body), payload)
+        self.assertEqual(self.codec.loads(body), payload)
+
+    def test_falls_back_to_stdlib(self):
+        # orjson rejects non-string keys and integers wider than 64 bits
+        self.assertEqual(json.loads(self.codec.dumps({1: "one"})), {"1": "one"})
+        self.assertEqual(json.loads(self.codec.dumps([2**70])), [2**70])
+
+    def test_rejects_what_stdlib_rejects(self):
+        with self.assertRaises(TypeError):
+            self.codec.dumps({"when": datetime.datetime(2020, 1, 1)})
+
+    def test_decode_error_is_value_error(self):
+        with self.assertRaises(ValueError):
+            self.codec.loads(b"not json")
+
+    def test_default_codec(self):
+        self.assertIsInstance(default_codec(), ua.OrjsonCodec)
+        self.assertIsInstance(BasicAuthClient(TEST_KEY, TEST_SECRET).codec, ua.OrjsonCodec)
+
+
+class TestClientCodec(unittest.TestCase):
+    def setUp(self):
+        self.codec = RecordingCodec()
+        self.airship = BasicAuthClient(TEST_KEY, TEST_SECRET, codec=self.codec)
+
+    def test_push_encoded_and_decoded_once(self):
+        push = ua.Push(self.airship)
+        push.audience = ua.all_
+        push.notification = ua.notification(alert="Hello")
+        push.device_types = ua.device_types("ios")
+        content = b'{"ok": true, "push_ids": ["0492662a-1b52-4343-a1f9-c6b0c72931c0"]}'
+
+        with mock.patch.object(
+            self.airship.session, "request", return_value=_response(202, content)
+        ) as request:
+            response = push.send()
+
+        self.assertEqual(response.push_ids, ["0492662a-1b52-4343-a1f9-c6b0c72931c0"])
+        self.assertEqual(response.ok, True)
+        self.assertEqual(self.codec.dumped, [push.payload])
+        self.assertEqual(self.codec.loaded, [content])
+        self.assertEqual(request.call_args[1]["data"], self.codec.dumps(push.payload))
+
+    def test_error_response_decoded_with_codec(self):
+        content = b'{"ok": false, "error": "Bad payload", "error_code": 40001}'
+
+        with mock.patch.object(
+            self.airship.session, "request", return_value=_response(400, content)
+        ):
+            with self.assertRaises(ua.AirshipFailure) as ctx:
+                self.airship.request("POST", b"{}", self.airship.urls.push_url)
+
+        self.assertEqual(self.codec.loaded, [content])
+        self.assertEqual(ctx.exception.error, "Bad payload")
+        self.assertEqual(ctx.exception.error_code, 40001)
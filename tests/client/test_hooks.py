@@ -0,0 +1,172 @@
+import unittest
+
+import mock
+import requests
+
+import urbanairship as ua
+from tests import TEST_KEY, TEST_SECRET
+from urbanairship.async_client import AsyncBasicAuthClient
+from urbanairship.client import BasicAuthClient
+from urbanairship.metrics import LatencyHistogram
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+def _response(status_code, content=b'{"ok": true}'):
+    response = requests.Response()
+    response._content = content
+    response.status_code = status_code
+    return response
+
+
+class RecordingHook(ua.RequestHook):
+    def __init__(self):
+        self.calls = []
+
+    def before_request(self, info):
+        self.calls.append(("before_request", info.endpoint, info.attempt))
+
+    def after_response(self, info, response):
+        self.calls.append(("after_response", info.endpoint, info.attempt, info.status_code))
+
+    def on_error(self, info, exc):
+        self.calls.append(("on_error", info.endpoint, info.attempt, info.status_code))
+
+    def on_retry(self, info, exc, delay):
+        self.calls.append(("on_retry", info.endpoint, info.attempt))
+
+
+class TestRequestHooks(unittest.TestCase):
+    def setUp(self):
+        self.hook = RecordingHook()
+        self.airship = BasicAuthClient(TEST_KEY, TEST_SECRET, retries=2, hooks=[self.hook])
+
+    def test_success(self):
+        with mock.patch.object(self.airship.session, "request", return_value=_response(200)):
+            self.airship.request("POST", '{"audience": "all"}', self.airship.urls.push_url)
+
+        self.assertEqual(
+            self.hook.calls,
+            [("before_request", "push_url", 1), ("after_response", "push_url", 1, 200)],
+        )
+
+    def test_retry_then_success(self):
+        responses = [_response(500), _response(200)]
+
+        with mock.patch.object(self.airship.session, "request", side_effect=responses):
+            with mock.patch("time.sleep"):
+                self.airship.request("GET", None, self.airship.urls.channel_url + "abc")
+
+        self.assertEqual(
+            self.hook.calls,
+            [
+                ("before_request", "channel_url", 1),
+                ("on_error", "channel_url", 1, 500),
+                ("on_retry", "channel_url", 1),
+                ("before_request", "channel_url", 2),
+                ("after_response", "channel_url", 2, 200),
+            ],
+        )
+
+    def test_connection_failure(self):
+        error = requests.exceptions.ConnectionError("refused")
+
+        with mock.patch.object(self.airship.session, "request", side_effect=error):
+            with mock.patch("time.sleep"):
+                with self.assertRaises(ua.ConnectionFailure):
+                    self.airship.request("GET", None, self.airship.urls.push_url)
+
+        self.assertEqual(
+            [call for call in self.hook.calls if call[0] == "on_error"],
+            [("on_error", "push_url", n, None) for n in (1, 2, 3)],
+        )
+
+    def test_failing_hook_does_not_break_request(self):
+        broken = mock.Mock(spec=ua.RequestHook)
+        broken.before_request.side_effect = RuntimeError("oops")
+        self.airship.hooks.insert(0, broken)
+
+        with mock.patch.object(self.airship.session, "request", return_value=_response(200)):
+            with self.assertLogs("urbanairship", level="ERROR"):
+                self.airship.request("GET", None, self.airship.urls.push_url)
+
+        self.assertEqual(self.hook.calls[-1], ("after_response", "push_url", 1, 200))
+
+
+class TestMetricsCollector(unittest.TestCase):
+    def setUp(self):
+        self.metrics = ua.MetricsCollector()
+        self.airship = BasicAuthClient(TEST_KEY, TEST_SECRET, retries=1, hooks=[self.metrics])
+
+    def test_counts_and_bytes(self):
+        responses = [_response(503), _response(202, b'{"ok": true, "push_ids": []}')]
+
+        with mock.patch.object(self.airship.session, "request", side_effect=responses):
+            with mock.patch("time.sleep"):
+                self.airship.request("POST", '{"audience": "all"}', self.airship.urls.push_url)
+
+        push = self.metrics.snapshot()["push_url"]
+        self.assertEqual(push["requests"], 1)
+        self.assertEqual(push["attempts"], 2)
+        self.assertEqual(push["retries"], 1)
+        self.assertEqual(push["errors"], 1)
+        self.assertEqual(push["statuses"], {503: 1, 202: 1})
+        self.assertEqual(push["bytes_sent"], 2 * len('{"audience": "all"}'))
+        self.assertEqual(push["bytes_received"], len(b'{"ok": true}{"ok": true, "push_ids": []}'))
+        self.assertIsNotNone(push["latency"]["p99"])
+
+    def test_grouped_by_endpoint(self):
+        with mock.patch.object(self.airship.session, "request", return_value=_response(200)):
+            self.airship.request("GET", None, self.airship.urls.push_url)
+            self.airship.request("GET", None, self.airship.urls.named_user_url)
+            self.airship.request("GET", None, self.airship.urls.named_user_url)
+
+        self.assertEqual(self.metrics.endpoints, ["named_user_url", "push_url"])
+        self.assertEqual(self.metrics.snapshot()["named_user_url"]["requests"], 2)
+
+        self.metrics.reset()
+        self.assertEqual(self.metrics.snapshot(), {})
+        self.assertIsNone(self.metrics.percentile("push_url", 0.5))
+
+    def test_histogram_percentiles(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 101):
+            histogram.add(ms / 1000.0)
+
+        self.assertAlmostEqual(histogram.mean, 0.0505)
+        self.assertEqual(histogram.max, 0.1)
+        # buckets are ~50% wide, so percentiles are bounded by the next bucket edge
+        self.assertTrue(0.05 <= histogram.percentile(0.5) <= 0.075)
+        self.assertTrue(0.09 <= histogram.percentile(0.9) <= 0.1)
+        self.assertEqual(histogram.percentile(1.0), 0.1)
+        self.assertIsNone(LatencyHistogram().percentile(0.5))
+
+    def test_slow_samples_beyond_last_bucket(self):
+        histogram = LatencyHistogram()
+        histogram.add(5000.0)
+
+        self.assertEqual(histogram.percentile(0.5), 5000.0)
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncRequestHooks(unittest.IsolatedAsyncioTestCase):
+    async def test_async_hooks(self):
+        metrics = ua.MetricsCollector()
+        airship = AsyncBasicAuthClient(TEST_KEY, TEST_SECRET, retries=1, hooks=[metrics])
+        responses = iter([httpx.Response(500), httpx.Response(200, json={"ok": True})])
+        await airship.session.aclose()
+        airship.session = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: next(responses))
+        )
+
+        with mock.patch("asyncio.sleep", new=mock.AsyncMock()):
+            await airship.request("GET", None, airship.urls.push_url)
+        await airship.aclose()
+
+        push = metrics.snapshot()["push_url"]
+        self.assertEqual(push["attempts"], 2)
+        self.assertEqual(push["retries"], 1)
+        self.assertEqual(push["statuses"], {500: 1, 200: 1})
@@ -0,0 +1,97 @@
+import threading
+import unittest
+
+import mock
+
+from urbanairship.ratelimit import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.now = 100.0
+        patcher = mock.patch("time.monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_then_steady_rate(self):
+        limiter = RateLimiter(rate=10, burst=3)
+
+        waits = [limiter._reserve() for _ in range(5)]
+
+        self.assertEqual(waits[:3], [0, 0, 0])
+        self.assertAlmostEqual(waits[3], 0.1)
+        self.assertAlmostEqual(waits[4], 0.2)
+
+    def test_tokens_refill_over_time(self):
+        limiter = RateLimiter(rate=2, burst=2)
+        limiter._reserve()
+        limiter._reserve()
+
+        self.now += 0.5
+
+        self.assertEqual(limiter._reserve(), 0)
+        self.assertAlmostEqual(limiter._reserve(), 0.5)
+
+    def test_refill_capped_at_burst(self):
+        limiter = RateLimiter(rate=5, burst=2)
+
+        self.now += 60
+
+        self.assertEqual([limiter._reserve() for _ in range(2)], [0, 0])
+        self.assertAlmostEqual(limiter._reserve(), 0.2)
+
+    def test_pause(self):
+        limiter = RateLimiter(rate=100)
+
+        limiter.pause(5)
+
+        self.assertEqual(limiter._reserve(), 5)
+        self.now += 5
+        self.assertEqual(limiter._reserve(), 0)
+
+    def test_acquire_sleeps(self):
+        limiter = RateLimiter(rate=4, burst=1)
+
+        with mock.patch("time.sleep") as sleep:
+            limiter.acquire()
+            limiter.acquire()
+
+        sleep.assert_called_once_with(0.25)
+
+    def test_shared_between_threads(self):
+        limiter = RateLimiter(rate=10, burst=1)
+        waits = []
+        lock = threading.Lock()
+
+        def reserve():
+            wait = limiter._reserve()
+            with lock:
+                waits.append(wait)
+
+        threads = [threading.Thread(target=reserve) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(
+            sorted(round(wait, 6) for wait in waits), [round(n / 10, 6) for n in range(20)]
+        )
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=1, burst=0)
+
+
+class TestAsyncRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_acquire_async_sleeps(self):
+        limiter = RateLimiter(rate=2, burst=1)
+
+        with mock.patch("asyncio.sleep", new=mock.AsyncMock()) as sleep:
+            await limiter.acquire_async()
+            await limiter.acquire_async()
+
+        sleep.assert_awaited_once()
+        self.assertAlmostEqual(sleep.await_args.args[0], 0.5, places=2)
@@ -0,0 +1,192 @@
+import unittest
+
+import mock
+import requests
+
+import urbanairship as ua
+from tests import TEST_KEY, TEST_SECRET
+from urbanairship.client import BasicAuthClient
+from urbanairship.retry import RetryPolicy
+
+
+def _response(status_code, headers=None):
+    response = requests.Response()
+    response._content = b'{"ok": false, "error": "boom"}'
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+def _failure(status_code, headers=None):
+    return ua.AirshipFailure.from_response(_response(status_code, headers))
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_defaults_do_not_retry(self):
+        func = mock.Mock(side_effect=ua.AirshipFailure(None, None, None, None))
+
+        with self.assertRaises(ua.AirshipFailure):
+            RetryPolicy().call(func)
+
+        self.assertEqual(func.call_count, 1)
+
+    def test_retries_until_success(self):
+        func = mock.Mock(side_effect=[ua.ConnectionFailure("down"), "ok"])
+
+        with mock.patch("time.sleep") as sleep:
+            result = RetryPolicy(max_tries=3).call(func, 1, key="value")
+
+        self.assertEqual(result, "ok")
+        self.assertEqual(func.call_count, 2)
+        func.assert_called_with(1, key="value")
+        self.assertEqual(sleep.call_count, 1)
+
+    def test_other_exceptions_are_not_retried(self):
+        func = mock.Mock(side_effect=KeyError("nope"))
+
+        with self.assertRaises(KeyError):
+            RetryPolicy(max_tries=3).call(func)
+
+        self.assertEqual(func.call_count, 1)
+
+    def test_backoff_delay_without_jitter(self):
+        policy = RetryPolicy(base_delay=0.5, max_delay=3, jitter=False)
+
+        self.assertEqual([policy.backoff_delay(n) for n in range(1, 6)], [0.5, 1, 2, 3, 3])
+
+    def test_backoff_delay_with_jitter(self):
+        policy = RetryPolicy(base_delay=2)
+
+        for _ in range(20):
+            self.assertTrue(0 <= policy.backoff_delay(2) <= 4)
+
+    def test_deadline_stops_retries(self):
+        func = mock.Mock(side_effect=ua.ConnectionFailure("down"))
+        policy = RetryPolicy(max_tries=10, base_delay=5, jitter=False, deadline=8)
+
+        with mock.patch("time.sleep") as sleep:
+            with self.assertRaises(ua.ConnectionFailure):
+                policy.call(func)
+
+        # a second wait of 10 seconds would pass the 8 second deadline
+        self.assertEqual(func.call_count, 2)
+        sleep.assert_called_once_with(5)
+
+    def test_client_errors_are_not_retried(self):
+        policy = RetryPolicy(max_tries=3)
+
+        for status in (400, 401, 403, 404):
+            func = mock.Mock(side_effect=_failure(status))
+            with self.assertRaises(ua.AirshipFailure):
+                policy.call(func)
+            self.assertEqual(func.call_count, 1, status)
+
+    def test_server_errors_are_retried(self):
+        func = mock.Mock(side_effect=[_failure(500), _failure(429), "ok"])
+
+        with mock.patch("time.sleep"):
+            self.assertEqual(RetryPolicy(max_tries=3).call(func), "ok")
+
+    def test_retry_after_seconds(self):
+        func = mock.Mock(side_effect=[_failure(429, {"Retry-After": "7"}), "ok"])
+        policy = RetryPolicy(max_tries=2, max_delay=1)
+
+        with mock.patch("time.sleep") as sleep:
+            policy.call(func)
+
+        sleep.assert_called_once_with(7.0)
+
+    def test_retry_after_date(self):
+        failure = _failure(503, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+        self.assertEqual(failure.retry_after, 0.0)
+        self.assertEqual(RetryPolicy(max_tries=2).next_delay(1, 0, failure), 0.0)
+
+    def test_retry_after_ignored_for_other_statuses(self):
+        failure = _failure(500, {"Retry-After": "30"})
+        policy = RetryPolicy(max_tries=2, base_delay=1, jitter=False)
+
+        self.assertEqual(policy.next_delay(1, 0, failure), 1)
+
+    def test_retry_after_respects_deadline(self):
+        func = mock.Mock(side_effect=_failure(429, {"Retry-After": "120"}))
+
+        with self.assertRaises(ua.AirshipFailure):
+            RetryPolicy(max_tries=3, deadline=60).call(func)
+
+        self.assertEqual(func.call_count, 1)
+
+    def test_max_tries_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_tries=0)
+
+    def test_replace_keeps_other_settings(self):
+        policy = RetryPolicy(max_tries=2, base_delay=0.1, jitter=False, deadline=30)
+
+        updated = policy.replace(max_tries=4)
+
+        self.assertEqual(updated.max_tries, 4)
+        self.assertEqual(updated.base_delay, 0.1)
+        self.assertFalse(updated.jitter)
+        self.assertEqual(updated.deadline, 30)
+        self.assertEqual(policy.max_tries, 2)
+
+
+class TestClientRetryPolicy(unittest.TestCase):
+    def test_retries_builds_policy(self):
+        airship = BasicAuthClient(TEST_KEY, TEST_SECRET, retries=2)
+
+        self.assertEqual(airship.retry_policy.max_tries, 3)
+
+    def test_retry_policy_argument(self):
+        policy = RetryPolicy(max_tries=4, deadline=10)
+
+        airship = BasicAuthClient(TEST_KEY, TEST_SECRET, retry_policy=policy)
+
+        self.assertIs(airship.retry_policy, policy)
+        self.assertEqual(airship.retries, 3)
+
+    def test_setting_retries_keeps_policy_settings(self):
+        airship = BasicAuthClient(
+            TEST_KEY, TEST_SECRET, retry_policy=RetryPolicy(max_delay=5, jitter=False)
+        )
+
+        airship.retries = 2
+
+        self.assertEqual(airship.retry_policy.max_tries, 3)
+        self.assertEqual(airship.retry_policy.max_delay, 5)
+        self.assertFalse(airship.retry_policy.jitter)
+
+    def test_policy_reused_across_requests(self):
+        airship = BasicAuthClient(TEST_KEY, TEST_SECRET, retries=1)
+        policy = airship.retry_policy
+
+        with mock.patch.object(airship.session, "request", return_value=_response(500)) as req:
+            with mock.patch("time.sleep"):
+                for _ in range(3):
+                    with self.assertRaises(ua.AirshipFailure):
+                        airship.request("GET", None, airship.urls.get("push_url"))
+
+        self.assertIs(airship.retry_policy, policy)
+        self.assertEqual(req.call_count, 6)
+
+    def test_bad_request_is_not_retried(self):
+        airship = BasicAuthClient(TEST_KEY, TEST_SECRET, retries=3)
+
+        with mock.patch.object(airship.session, "request", return_value=_response(400)) as req:
+            with self.assertRaises(ua.AirshipFailure):
+                airship.request("POST", "{}", airship.urls.get("push_url"))
+
+        self.assertEqual(req.call_count, 1)
+
+    def test_retry_after_pauses_rate_limiter(self):
+        limiter = ua.RateLimiter(rate=100)
+        airship = BasicAuthClient(TEST_KEY, TEST_SECRET, rate_limiter=limiter)
+        response = _response(429, {"Retry-After": "3"})
+
+        with mock.patch.object(airship.session, "request", return_value=response):
+            with mock.patch.object(limiter, "pause") as pause:
+                with self.assertRaises(ua.AirshipFailure):
+                    airship.request("GET", None, airship.urls.get("push_url"))
+
+        pause.assert_called_once_with(3.0)
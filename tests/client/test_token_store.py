@@ -0,0 +1,200 @@
+import os
+import shutil
+import stat
+import tempfile
+import time
+import unittest
+
+import mock
+import requests
+
+import urbanairship as ua
+from tests import TEST_KEY
+from urbanairship.client import OAuthClient
+from urbanairship.token_store import token_cache_key
+
+
+def _token_response(token="fetched-token", expires_in=3600):
+    response = requests.Response()
+    response._content = ('{"access_token": "%s", "expires_in": %d}' % (token, expires_in)).encode()
+    response.status_code = 200
+    return response
+
+
+class TestTokenCacheKey(unittest.TestCase):
+    def test_scope_order_ignored(self):
+        self.assertEqual(
+            token_cache_key(TEST_KEY, "client", ["psh", "chn"]),
+            token_cache_key(TEST_KEY, "client", ["chn", "psh"]),
+        )
+
+    def test_keyed_by_client_and_scope(self):
+        keys = {
+            token_cache_key(TEST_KEY, "client"),
+            token_cache_key(TEST_KEY, "other-client"),
+            token_cache_key(TEST_KEY, "client", ["psh"]),
+        }
+        self.assertEqual(len(keys), 3)
+
+
+class TestMemoryTokenStore(unittest.TestCase):
+    def test_get_and_set(self):
+        store = ua.MemoryTokenStore()
+
+        self.assertIsNone(store.get("key"))
+        store.set("key", ("token", 123))
+        self.assertEqual(store.get("key"), ("token", 123))
+
+        with store.lock("key"):
+            pass
+
+
+class TestFileTokenStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "tokens.json")
+        self.store = ua.FileTokenStore(self.path)
+
+    def test_round_trip(self):
+        expires_at = int(time.time()) + 3600
+
+        self.assertIsNone(self.store.get("key"))
+        self.store.set("key", ("token", expires_at))
+
+        self.assertEqual(ua.FileTokenStore(self.path).get("key"), ("token", expires_at))
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+    def test_expired_tokens_pruned(self):
+        self.store.set("old", ("token", int(time.time()) - 10))
+        self.store.set("new", ("token", int(time.time()) + 3600))
+
+        self.assertIsNone(self.store.get("old"))
+        self.assertIsNotNone(self.store.get("new"))
+
+    def test_unreadable_file_ignored(self):
+        with open(self.path, "w") as token_file:
+            token_file.write("not json")
+
+        with self.assertLogs("urbanairship", level="WARNING"):
+            self.assertIsNone(self.store.get("key"))
+
+    def test_lock(self):
+        with self.store.lock("key"):
+            self.assertTrue(os.path.exists(self.path + ".lock"))
+
+    def test_other_users_files_refused(self):
+        self.store.set("key", ("token", int(time.time()) + 3600))
+
+        with mock.patch("os.getuid", return_value=os.getuid() + 1):
+            with self.assertRaises(PermissionError):
+                self.store.get("key")
+            with self.assertRaises(PermissionError):
+                with self.store.lock("key"):
+                    pass
+
+    def test_symlink_refused(self):
+        target = os.path.join(self.directory, "elsewhere.json")
+        with open(target, "w") as target_file:
+            target_file.write("{}")
+        os.symlink(target, self.path)
+
+        with self.assertRaises(OSError):
+            self.store.get("key")
+
+    def test_default_path_private(self):
+        cache_home = os.path.join(self.directory, "cache")
+
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache_home}):
+            store = ua.FileTokenStore()
+
+        directory = os.path.join(cache_home, "urbanairship")
+        self.assertEqual(store.path, os.path.join(directory, "tokens.json"))
+        self.assertEqual(stat.S_IMODE(os.stat(directory).st_mode), 0o700)
+
+
+class TestOAuthClientTokenStore(unittest.TestCase):
+    def setUp(self):
+        self.store = ua.MemoryTokenStore()
+        patcher = mock.patch("urbanairship.client._oauth_assertion", return_value="jwt")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _client(self, scope=None):
+        return OAuthClient(
+            client_id=TEST_KEY,
+            private_key="key",
+            key=TEST_KEY,
+            scope=scope,
+            token_store=self.store,
+        )
+
+    def test_stored_token_reused(self):
+        expires_at = int(time.time()) + 3600
+        self.store.set(token_cache_key(TEST_KEY, TEST_KEY), ("stored-token", expires_at))
+        client = self._client()
+
+        with mock.patch.object(client.token_session, "post") as post:
+            client._update_session_oauth_token()
+
+        post.assert_not_called()
+        self.assertEqual(client.token, "stored-token")
+        self.assertEqual(client.access_token_expires_at, expires_at)
+
+    def test_stale_stored_token_refreshed(self):
+        self.store.set(token_cache_key(TEST_KEY, TEST_KEY), ("stale-token", int(time.time()) + 10))
+        client = self._client()
+
+        with mock.patch.object(client.token_session, "post", return_value=_token_response()):
+            client._update_session_oauth_token()
+
+        self.assertEqual(client.token, "fetched-token")
+        self.assertEqual(self.store.get(token_cache_key(TEST_KEY, TEST_KEY))[0], "fetched-token")
+
+    def test_clients_share_token(self):
+        first, second, scoped = self._client(), self._client(), self._client(scope=["psh"])
+
+        with (
+            mock.patch.object(
+                first.token_session, "post", return_value=_token_response()
+            ) as first_post,
+            mock.patch.object(second.token_session, "post") as second_post,
+        ):
+            first._update_session_oauth_token()
+            second._update_session_oauth_token()
+
+        first_post.assert_called_once()
+        second_post.assert_not_called()
+        self.assertEqual(second.token, "fetched-token")
+
+        with mock.patch.object(
+            scoped.token_session, "post", return_value=_token_response("scoped-token")
+        ) as scoped_post:
+            scoped._update_session_oauth_token()
+
+        scoped_post.assert_called_once()
+
+    def test_file_store_shared(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "tokens.json")
+        first = OAuthClient(
+            client_id=TEST_KEY,
+            private_key="key",
+            key=TEST_KEY,
+            token_store=ua.FileTokenStore(path),
+        )
+        second = OAuthClient(
+            client_id=TEST_KEY,
+            private_key="key",
+            key=TEST_KEY,
+            token_store=ua.FileTokenStore(path),
+        )
+
+        with mock.patch.object(first.token_session, "post", return_value=_token_response()):
+            first._update_session_oauth_token()
+        with mock.patch.object(second.token_session, "post") as second_post:
+            second._update_session_oauth_token()
+
+        second_post.assert_not_called()
+        self.assertEqual(second.token, "fetched-token")
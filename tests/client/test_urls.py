@@ -37,3 +37,13 @@ class TestAirshipUrls(unittest.TestCase):
         urls = Urls(base_url=self.test_url)
         self.assertEqual(urls.base_url, self.test_url)
         self.assertIn(self.test_url, urls.apid_url)
+
+    def test_endpoint_for(self):
+        urls = Urls()
+
+        self.assertEqual(urls.endpoint_for(urls.push_url), "push_url")
+        self.assertEqual(urls.endpoint_for(urls.validate_url), "validate_url")
+        self.assertEqual(urls.endpoint_for(urls.channel_url + "abc123"), "channel_url")
+        self.assertEqual(urls.endpoint_for(urls.email_tags_url), "email_tags_url")
+        self.assertEqual(urls.endpoint_for(urls.base_url + "unknown/"), "other")
+        self.assertEqual(urls.endpoint_for("https://example.com/"), "other")
@@ -205,3 +205,18 @@ class TestAttributeList(unittest.TestCase):
                 "extra": self.extra,
             },
         )
+
+
+class TestAttributeResponse(unittest.TestCase):
+    def test_decoded_lazily_once(self):
+        response = requests.Response()
+        response._content = b'{"ok": true, "warning": "slow down"}'
+        codec = mock.Mock(wraps=ua.StdlibJsonCodec())
+
+        attribute_response = ua.AttributeResponse(response, codec=codec)
+
+        codec.loads.assert_not_called()
+        self.assertTrue(attribute_response.ok)
+        self.assertEqual(attribute_response.warning, "slow down")
+        codec.loads.assert_called_once()
+        self.assertFalse(hasattr(attribute_response, "__dict__"))
@@ -3,7 +3,6 @@ import unittest
 
 import mock
 import requests
-from mock import Mock
 
 import urbanairship as ua
 from tests import TEST_KEY, TEST_SECRET
@@ -32,7 +31,9 @@ class TestNamedUser(unittest.TestCase):
             }
         ).encode("utf-8")
 
-        ua.Airship._request = Mock()
+        patcher = mock.patch.object(ua.Airship, "_request")
+        patcher.start()
+        self.addCleanup(patcher.stop)
         ua.Airship._request.side_effect = [
             associate_response,
             disassociate_response,
@@ -155,7 +156,9 @@ class TestNamedUserTags(unittest.TestCase):
         self.mock_response = requests.Response()
         self.mock_response._content = json.dumps([{"ok": True}]).encode("utf-8")
 
-        ua.Airship._request = mock.Mock()
+        patcher = mock.patch.object(ua.Airship, "_request")
+        patcher.start()
+        self.addCleanup(patcher.stop)
         ua.Airship._request.side_effect = [self.mock_response]
 
     def test_set_audience(self):
@@ -3,7 +3,6 @@ import unittest
 
 import mock
 import requests
-from mock import Mock
 
 import urbanairship as ua
 from tests import TEST_KEY, TEST_SECRET
@@ -53,7 +52,9 @@ class TestSegment(unittest.TestCase):
         del_response = requests.Response()
         del_response.status_code = 204
 
-        ua.Airship._request = Mock()
+        patcher = mock.patch.object(ua.Airship, "_request")
+        patcher.start()
+        self.addCleanup(patcher.stop)
         ua.Airship._request.side_effect = [
             create_response,
             id_response,
@@ -122,7 +122,9 @@ class TestStaticLists(unittest.TestCase):
             }
         ).encode("utf-8")
 
-        ua.Airship._request = mock.Mock()
+        patcher = mock.patch.object(ua.Airship, "_request")
+        patcher.start()
+        self.addCleanup(patcher.stop)
         ua.Airship._request.side_effect = [mock_response]
 
         airship = ua.Airship(TEST_KEY, TEST_SECRET)
@@ -193,7 +195,9 @@ class TestStaticLists(unittest.TestCase):
             }
         ).encode("utf-8")
 
-        ua.Airship._request = mock.Mock()
+        patcher = mock.patch.object(ua.Airship, "_request")
+        patcher.start()
+        self.addCleanup(patcher.stop)
         ua.Airship._request.side_effect = [mock_response, mock_next_response]
 
         airship = ua.Airship(TEST_KEY, TEST_SECRET)
@@ -21,7 +21,9 @@ class TestChannelTags(unittest.TestCase):
             ]
         ).encode("utf-8")
 
-        ua.Airship._request = mock.Mock()
+        patcher = mock.patch.object(ua.Airship, "_request")
+        patcher.start()
+        self.addCleanup(patcher.stop)
         ua.Airship._request.side_effect = [self.mock_response]
 
     def test_ios_audience(self):
@@ -122,7 +124,9 @@ class TestOpenChannelTags(unittest.TestCase):
         self.mock_response = requests.Response()
         self.mock_response._content = json.dumps([{"ok": True}]).encode("utf-8")
 
-        ua.Airship._request = mock.Mock()
+        patcher = mock.patch.object(ua.Airship, "_request")
+        patcher.start()
+        self.addCleanup(patcher.stop)
         ua.Airship._request.side_effect = [self.mock_response]
 
     def test_set_audience(self):
@@ -0,0 +1,154 @@
+"""Fake API endpoints for tests that send requests through a real client.
+
+Each endpoint stands in for ``session.request`` of a sync client, through
+:py:meth:`FakeEndpoint.patch`, or for the transport of an async client, through
+:py:func:`fake_async_client`, and records the requests it receives.
+"""
+
+import json
+import threading
+
+import mock
+import requests
+
+import urbanairship as ua
+from tests import TEST_KEY, TEST_SECRET
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+INVALID = {"ok": False, "error": "Invalid push", "error_code": 40001}
+NOT_FOUND = {"ok": False, "error": "Not found", "error_code": 40401}
+
+
+def json_response(status_code, payload=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    return response
+
+
+class FakeEndpoint(object):
+    """Base class; subclasses implement ``respond(method, url, body)``, returning a
+    status code and a JSON payload (None for no content).
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+
+    def __call__(self, method, url, data=None, **kwargs):
+        with self.lock:
+            return json_response(*self.respond(method, url, data))
+
+    def respond(self, method, url, body):
+        raise NotImplementedError
+
+    def patch(self, airship):
+        """Patch ``airship``'s session to send its requests here."""
+        return mock.patch.object(airship.session, "request", side_effect=self)
+
+
+async def fake_async_client(endpoint):
+    """An async client whose requests go to ``endpoint``."""
+
+    def handler(request):
+        response = endpoint(request.method, str(request.url), data=request.content)
+        return httpx.Response(response.status_code, content=response.content)
+
+    airship = ua.AsyncBasicAuthClient(TEST_KEY, TEST_SECRET)
+    await airship.session.aclose()
+    airship.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return airship
+
+
+class FakePushEndpoint(FakeEndpoint):
+    """Accepts arrays of push objects, as the push and template push endpoints do.
+
+    ``key`` picks out the value recorded for each push; a request is rejected as
+    invalid if any push's key is "bad". ``requests`` holds the keys sent in each
+    request and ``accepted`` the keys of the pushes accepted.
+    """
+
+    def __init__(self, key=lambda push: push["notification"]["alert"]):
+        super(FakePushEndpoint, self).__init__()
+        self.key = key
+        self.requests = []
+        self.accepted = []
+        self.urls = []
+        self.sizes = []
+
+    def respond(self, method, url, body):
+        keys = [self.key(push) for push in json.loads(body)]
+        self.requests.append(keys)
+        self.urls.append(url)
+        self.sizes.append(len(body))
+        if "bad" in keys:
+            return 400, INVALID
+        self.accepted.extend(keys)
+        return 202, {
+            "ok": True,
+            "operation_id": "op-%d" % len(self.requests),
+            "push_ids": ["id-%s" % (key,) for key in keys],
+        }
+
+
+class FakeCreateAndSendEndpoint(FakeEndpoint):
+    """Accepts create and send requests, failing those that include a listed msisdn.
+    ``requests`` holds the msisdns sent in each request.
+    """
+
+    def __init__(self, fail=()):
+        super(FakeCreateAndSendEndpoint, self).__init__()
+        self.fail = set(fail)
+        self.requests = []
+
+    def respond(self, method, url, body):
+        msisdns = [a["ua_msisdn"] for a in json.loads(body)["audience"]["create_and_send"]]
+        self.requests.append(msisdns)
+        if self.fail & set(msisdns):
+            return 400, {"ok": False, "error": "Bad", "error_code": 40001}
+        return 202, {"ok": True, "operation_id": "op"}
+
+
+class FakeSchedulesEndpoint(FakeEndpoint):
+    """Lists ``listed`` schedules and accepts schedule requests, failing those for
+    the urls in ``fail``. ``requests`` holds each request's method and url.
+    """
+
+    def __init__(self, schedules_url, listed=(), fail=()):
+        super(FakeSchedulesEndpoint, self).__init__()
+        self.schedules_url = schedules_url
+        self.listed = listed
+        self.fail = set(fail)
+        self.requests = []
+
+    def respond(self, method, url, body):
+        self.requests.append((method, url))
+        if method == "GET":
+            return 200, {"ok": True, "schedules": json.loads(json.dumps(self.listed))}
+        if url.replace("/pause", "").replace("/resume", "") in self.fail:
+            return 404, NOT_FOUND
+        if method in ("POST", "PUT") and body:
+            url = self.schedules_url + json.loads(body)["name"]
+            return 201, {"ok": True, "schedule_urls": [url]}
+        return 204, None
+
+
+class FakeTemplatesEndpoint(FakeEndpoint):
+    """Serves template lookups and listings from ``templates``, keyed by id.
+    ``requests`` holds the url of each request.
+    """
+
+    def __init__(self, templates):
+        super(FakeTemplatesEndpoint, self).__init__()
+        self.templates = templates
+        self.requests = []
+
+    def respond(self, method, url, body):
+        self.requests.append(url)
+        template_id = url.rsplit("/", 1)[1]
+        if template_id:
+            return 200, {"ok": True, "template": self.templates[template_id]}
+        return 200, {"ok": True, "templates": list(self.templates.values())}
@@ -245,3 +245,87 @@ class TestAttributeSelectors(unittest.TestCase):
             )
 
             self.assertEqual(err_ctx.message, "value must be an integer")
+
+
+class TestOptimizeAudience(unittest.TestCase):
+    def test_flattens_same_operator(self):
+        audience = ua.and_(ua.segment("a"), ua.and_(ua.segment("b"), ua.and_(ua.segment("c"))))
+
+        self.assertEqual(
+            ua.optimize_audience(audience),
+            {"and": [{"segment": "a"}, {"segment": "b"}, {"segment": "c"}]},
+        )
+
+    def test_keeps_other_operators(self):
+        audience = ua.and_(ua.segment("a"), ua.or_(ua.segment("b"), ua.segment("c")))
+
+        self.assertEqual(ua.optimize_audience(audience), audience)
+
+    def test_removes_duplicates(self):
+        audience = ua.and_(
+            ua.segment("a"),
+            ua.text_attribute("city", "equals", "Portland"),
+            ua.segment("a"),
+            ua.text_attribute("city", "equals", "Portland"),
+        )
+
+        self.assertEqual(
+            ua.optimize_audience(audience),
+            {
+                "and": [
+                    {"segment": "a"},
+                    {"attribute": "city", "operator": "equals", "value": "Portland"},
+                ]
+            },
+        )
+
+    def test_double_not(self):
+        self.assertEqual(ua.optimize_audience(ua.not_(ua.not_(ua.tag("a")))), {"tag": "a"})
+        self.assertEqual(
+            ua.optimize_audience(ua.not_(ua.not_(ua.not_(ua.tag("a"))))), {"not": {"tag": "a"}}
+        )
+
+    def test_merges_leaves_in_or(self):
+        audience = ua.or_(
+            ua.tag("a"),
+            ua.named_user("alice"),
+            ua.or_(ua.tag("b"), {"tag": ["c", "a"]}),
+            ua.tag_group("loyalty", "gold"),
+            ua.tag_group("loyalty", "silver"),
+            ua.tag_group("crm", "vip"),
+            ua.named_user("bob"),
+        )
+
+        self.assertEqual(
+            ua.optimize_audience(audience),
+            {
+                "or": [
+                    {"tag": ["a", "b", "c"]},
+                    {"named_user": ["alice", "bob"]},
+                    {"group": "loyalty", "tag": ["gold", "silver"]},
+                    {"group": "crm", "tag": "vip"},
+                ]
+            },
+        )
+
+    def test_leaves_not_merged_in_and(self):
+        audience = ua.and_(ua.tag("a"), ua.tag("b"))
+
+        self.assertEqual(ua.optimize_audience(audience), audience)
+
+    def test_single_child_unwrapped(self):
+        audience = ua.or_(ua.tag("a"), ua.or_(ua.tag("a")))
+
+        self.assertEqual(ua.optimize_audience(audience), {"tag": "a"})
+
+    def test_input_unchanged(self):
+        audience = ua.or_(ua.tag("a"), ua.or_(ua.tag("b")))
+        expected = ua.or_(ua.tag("a"), ua.or_(ua.tag("b")))
+
+        ua.optimize_audience(audience)
+
+        self.assertEqual(audience, expected)
+
+    def test_passes_through(self):
+        self.assertEqual(ua.optimize_audience(ua.all_), "all")
+        self.assertEqual(ua.optimize_audience(ua.segment("a")), {"segment": "a"})
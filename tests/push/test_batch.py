@@ -0,0 +1,116 @@
+import unittest
+
+import mock
+import requests
+
+import urbanairship as ua
+from tests import TEST_KEY, TEST_SECRET
+from tests.push.fakes import FakePushEndpoint, fake_async_client, httpx, json_response
+
+
+def _push(airship, alert, device_types=("ios",)):
+    push = ua.Push(airship)
+    push.audience = ua.all_
+    push.notification = ua.notification(alert=alert)
+    push.device_types = ua.device_types(*device_types)
+    return push
+
+
+class TestPushBatch(unittest.TestCase):
+    def setUp(self):
+        self.airship = ua.client.BasicAuthClient(TEST_KEY, TEST_SECRET)
+        self.endpoint = FakePushEndpoint()
+
+    def _send(self, batch):
+        with self.endpoint.patch(self.airship):
+            return batch.send()
+
+    def test_packs_pushes_into_requests(self):
+        batch = ua.PushBatch(
+            self.airship, [_push(self.airship, str(i)) for i in range(5)], max_pushes=2
+        )
+
+        responses = self._send(batch)
+
+        self.assertEqual(self.endpoint.requests, [["0", "1"], ["2", "3"], ["4"]])
+        self.assertEqual([r.push_ids for r in responses], [["id-%d" % i] for i in range(5)])
+        self.assertEqual(
+            [r.operation_id for r in responses], ["op-1", "op-1", "op-2", "op-2", "op-3"]
+        )
+        self.assertTrue(all(r.ok and r.error is None for r in responses))
+
+    def test_max_bytes(self):
+        pushes = [_push(self.airship, str(i)) for i in range(4)]
+        size = len(self.airship.codec.dumps(pushes[0].payload))
+        batch = ua.PushBatch(self.airship, pushes, max_bytes=2 * size + 3)
+
+        self._send(batch)
+
+        self.assertEqual(self.endpoint.requests, [["0", "1"], ["2", "3"]])
+
+    def test_invalid_push_isolated(self):
+        alerts = ["a", "b", "bad", "c", "d"]
+        batch = ua.PushBatch(self.airship)
+        for alert in alerts:
+            batch.add(_push(self.airship, alert))
+
+        responses = self._send(batch)
+
+        self.assertEqual(len(batch), 5)
+        self.assertEqual([r.ok for r in responses], [True, True, False, True, True])
+        self.assertEqual(responses[1].push_ids, ["id-b"])
+        self.assertEqual(responses[3].push_ids, ["id-c"])
+        failed = responses[2]
+        self.assertIsInstance(failed.error, ua.AirshipFailure)
+        self.assertEqual(failed.payload["error_code"], 40001)
+        # every push except the invalid one was accepted exactly once
+        self.assertEqual(self.endpoint.accepted, ["a", "b", "c", "d"])
+
+    def test_local_validation_errors(self):
+        email = _push(self.airship, "email", device_types=("email",))
+        batch = ua.PushBatch(self.airship, [_push(self.airship, "a"), email])
+
+        responses = self._send(batch)
+
+        self.assertEqual(self.endpoint.requests, [["a"]])
+        self.assertTrue(responses[0].ok)
+        self.assertFalse(responses[1].ok)
+        self.assertIsInstance(responses[1].error, ValueError)
+
+    def test_server_error_not_resent(self):
+        batch = ua.PushBatch(self.airship, [_push(self.airship, "a"), _push(self.airship, "b")])
+
+        with mock.patch.object(
+            self.airship.session, "request", return_value=json_response(500, {"ok": False})
+        ) as request:
+            responses = batch.send()
+
+        self.assertEqual(request.call_count, 1)
+        self.assertEqual([r.ok for r in responses], [False, False])
+        self.assertIs(responses[0].error, responses[1].error)
+
+    def test_connection_failure(self):
+        batch = ua.PushBatch(self.airship, [_push(self.airship, "a")])
+        error = requests.exceptions.ConnectionError("refused")
+
+        with mock.patch.object(self.airship.session, "request", side_effect=error):
+            (response,) = batch.send()
+
+        self.assertFalse(response.ok)
+        self.assertIsInstance(response.error, ua.ConnectionFailure)
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestPushBatchAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_send_async(self):
+        endpoint = FakePushEndpoint()
+        airship = await fake_async_client(endpoint)
+        batch = ua.PushBatch(airship, [_push(airship, a) for a in ["a", "bad", "b"]])
+
+        responses = await batch.send_async()
+        await airship.aclose()
+
+        self.assertEqual([r.ok for r in responses], [True, False, True])
+        self.assertEqual(
+            endpoint.requests, [["a", "bad", "b"], ["a"], ["bad", "b"], ["bad"], ["b"]]
+        )
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import unittest
+import uuid
+
+import urbanairship as ua
+from tests import TEST_KEY, TEST_SECRET
+from tests.push.fakes import FakePushEndpoint, fake_async_client, httpx
+
+CHANNELS = [str(uuid.UUID(int=i)) for i in range(7)]
+
+
+def _endpoint():
+    return FakePushEndpoint(key=lambda push: push["audience"]["channel"])
+
+
+class TestAudienceChunker(unittest.TestCase):
+    def setUp(self):
+        self.airship = ua.client.BasicAuthClient(TEST_KEY, TEST_SECRET)
+        self.push = ua.Push(self.airship)
+        self.push.notification = ua.notification(alert="Hello")
+        self.push.device_types = ua.device_types("ios")
+
+    def test_max_ids(self):
+        chunker = ua.AudienceChunker(self.push, max_ids=3)
+
+        chunks = [ids for ids, _ in chunker.chunks(iter(CHANNELS))]
+
+        self.assertEqual(chunks, [CHANNELS[0:3], CHANNELS[3:6], CHANNELS[6:]])
+
+    def test_pushes_match_payload(self):
+        chunker = ua.AudienceChunker(self.push, max_ids=4)
+
+        pushes = list(chunker.pushes(CHANNELS))
+
+        self.assertEqual(len(pushes), 2)
+        for push in pushes:
+            self.assertEqual(json.loads(push._encoded()), push.payload)
+        self.assertEqual(pushes[1].audience, {"channel": CHANNELS[4:]})
+        self.assertEqual(pushes[1].payload["notification"], {"alert": "Hello"})
+
+    def test_max_bytes(self):
+        chunker = ua.AudienceChunker(self.push)
+        ((_, whole),) = chunker.chunks(CHANNELS[:2])
+        chunker = ua.AudienceChunker(self.push, max_bytes=len(whole))
+
+        chunks = list(chunker.chunks(CHANNELS))
+
+        self.assertEqual([ids for ids, _ in chunks], [CHANNELS[i:][:2] for i in (0, 2, 4, 6)])
+        self.assertTrue(all(len(body) <= len(whole) for _, body in chunks))
+
+    def test_batches_respect_max_bytes(self):
+        chunker = ua.AudienceChunker(self.push, max_ids=2)
+        ((_, whole),) = chunker.chunks(CHANNELS[:2])
+        limit = 2 * len(whole) + 3
+        chunker = ua.AudienceChunker(self.push, max_ids=2, max_bytes=limit)
+        endpoint = _endpoint()
+
+        with endpoint.patch(self.airship):
+            responses = list(chunker.send(CHANNELS))
+
+        self.assertEqual(len(responses), 4)
+        self.assertEqual(len(endpoint.requests), 2)
+        self.assertTrue(all(size <= limit for size in endpoint.sizes))
+
+    def test_alias_not_a_list_selector(self):
+        with self.assertRaises(ValueError):
+            ua.AudienceChunker(self.push, selector="alias")
+
+    def test_named_user(self):
+        chunker = ua.AudienceChunker(self.push, selector="named_user")
+
+        (push,) = chunker.pushes(["alice", "bob"])
+
+        self.assertEqual(push.payload["audience"], {"named_user": ["alice", "bob"]})
+
+    def test_invalid_id(self):
+        chunker = ua.AudienceChunker(self.push, max_ids=2)
+        chunks = chunker.chunks(CHANNELS[:2] + ["not-a-channel"])
+
+        self.assertEqual(next(chunks)[0], CHANNELS[:2])
+        with self.assertRaises(ValueError):
+            next(chunks)
+
+    def test_invalid_selector(self):
+        with self.assertRaises(ValueError):
+            ua.AudienceChunker(self.push, selector="segment")
+
+    def test_send(self):
+        endpoint = _endpoint()
+        chunker = ua.AudienceChunker(self.push, max_ids=2)
+
+        with endpoint.patch(self.airship):
+            responses = list(chunker.send(iter(CHANNELS), max_pushes=3))
+
+        self.assertEqual(len(responses), 4)
+        self.assertTrue(all(r.ok for r in responses))
+        self.assertEqual(len(endpoint.requests), 2)
+        self.assertEqual(endpoint.accepted, [CHANNELS[i:][:2] for i in (0, 2, 4, 6)])
+
+    def test_send_is_lazy(self):
+        endpoint = _endpoint()
+        chunker = ua.AudienceChunker(self.push, max_ids=1)
+
+        with endpoint.patch(self.airship):
+            responses = chunker.send(CHANNELS, max_pushes=2)
+            next(responses)
+
+        self.assertEqual(len(endpoint.requests), 1)
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAudienceChunkerAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_send_async(self):
+        endpoint = _endpoint()
+        airship = await fake_async_client(endpoint)
+        push = ua.Push(airship)
+        push.notification = ua.notification(alert="Hello")
+        push.device_types = ua.device_types("ios")
+        chunker = ua.AudienceChunker(push, max_ids=1)
+
+        responses = await chunker.send_async(CHANNELS, max_pushes=2, concurrency=2)
+        await airship.aclose()
+
+        self.assertEqual(len(responses), 7)
+        self.assertEqual(len(endpoint.requests), 4)
+        self.assertEqual(sorted(endpoint.accepted), [[c] for c in CHANNELS])
+
+    async def test_send_async_invalid_id_cancels_batches(self):
+        endpoint = _endpoint()
+        airship = await fake_async_client(endpoint)
+        push = ua.Push(airship)
+        push.notification = ua.notification(alert="Hello")
+        push.device_types = ua.device_types("ios")
+        chunker = ua.AudienceChunker(push, max_ids=1)
+
+        with self.assertRaises(ValueError):
+            await chunker.send_async(CHANNELS[:3] + ["not-a-channel"], max_pushes=1, concurrency=2)
+        sent = len(endpoint.requests)
+        await asyncio.sleep(0.05)
+        await airship.aclose()
+
+        self.assertEqual(len(endpoint.requests), sent)
+        self.assertLess(sent, 3)
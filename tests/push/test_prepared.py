@@ -0,0 +1,108 @@
+import json
+import unittest
+
+import mock
+import requests
+
+import urbanairship as ua
+from tests import TEST_KEY, TEST_SECRET
+
+CHANNEL = "0492662a-1b52-4343-a1f9-c6b0c72931c0"
+
+
+class TestPreparedPush(unittest.TestCase):
+    def setUp(self):
+        self.airship = ua.client.BasicAuthClient(TEST_KEY, TEST_SECRET)
+        self.push = ua.Push(self.airship)
+        self.push.notification = ua.notification(
+            alert="Sale starts now",
+            ios=ua.ios(badge=1, extra={"sale": "spring"}),
+            android=ua.android(priority=1),
+        )
+        self.push.options = ua.options(expiry=3600)
+        self.push.device_types = ua.device_types("ios", "android")
+        self.prepared = ua.PreparedPush(self.push)
+
+    def _expected(self, audience, localizations=None):
+        push = ua.Push(self.airship)
+        push.audience = audience
+        push.notification = self.push.notification
+        push.options = self.push.options
+        push.device_types = self.push.device_types
+        if localizations is not None:
+            push.localizations = localizations
+        return push.payload
+
+    def test_encode(self):
+        audience = ua.channel(CHANNEL)
+
+        body = self.prepared.encode(audience)
+
+        self.assertEqual(json.loads(body), self._expected(audience))
+
+    def test_only_audience_encoded_per_send(self):
+        audience = ua.or_(ua.tag("a"), ua.tag("b"))
+
+        with mock.patch.object(
+            self.airship.codec, "dumps", wraps=self.airship.codec.dumps
+        ) as dumps:
+            self.prepared.encode(audience)
+
+        dumps.assert_called_once_with(audience)
+
+    def test_localizations(self):
+        localizations = [
+            ua.localization(language="fr", notification=ua.notification(alert="Soldes"))
+        ]
+
+        body = self.prepared.encode(ua.all_, localizations)
+
+        self.assertEqual(json.loads(body), self._expected(ua.all_, localizations))
+
+    def test_template_localizations_kept(self):
+        localizations = [ua.localization(language="de", notification=ua.notification(alert="X"))]
+        self.push.localizations = localizations
+        prepared = ua.PreparedPush(self.push)
+
+        self.assertEqual(json.loads(prepared.encode(ua.all_))["localizations"], localizations)
+
+    def test_template_changes_ignored(self):
+        self.push.notification = ua.notification(alert="Changed")
+
+        body = json.loads(self.prepared.encode(ua.all_))
+
+        self.assertEqual(body["notification"]["alert"], "Sale starts now")
+
+    def test_email_check_on_prepare(self):
+        self.push.device_types = ua.device_types("email")
+
+        with self.assertRaises(ValueError):
+            ua.PreparedPush(self.push)
+
+    def test_send(self):
+        response = requests.Response()
+        response._content = json.dumps({"ok": True, "push_ids": [CHANNEL]}).encode("utf-8")
+        response.status_code = 202
+
+        with mock.patch.object(
+            ua.client.BasicAuthClient, "_request", return_value=response
+        ) as mock_request:
+            push_response = self.prepared.send(ua.channel(CHANNEL))
+
+        self.assertEqual(push_response.push_ids, [CHANNEL])
+        body = mock_request.call_args.kwargs["body"]
+        self.assertEqual(json.loads(body), self._expected(ua.channel(CHANNEL)))
+
+    def test_for_audience_in_batch(self):
+        pushes = [self.prepared.for_audience(ua.tag(str(i))) for i in range(3)]
+
+        self.assertEqual(pushes[1].payload, self._expected(ua.tag("1")))
+        self.assertEqual(pushes[1]._encoded(), self.prepared.encode(ua.tag("1")))
+        batch = ua.PushBatch(self.airship, pushes)
+        with mock.patch.object(ua.client.BasicAuthClient, "_request") as mock_request:
+            mock_request.return_value.content = b'{"ok": true, "push_ids": ["a", "b", "c"]}'
+            responses = batch.send()
+
+        self.assertEqual([r.push_ids for r in responses], [["a"], ["b"], ["c"]])
+        body = json.loads(mock_request.call_args.kwargs["body"])
+        self.assertEqual([p["audience"] for p in body], [{"tag": str(i)} for i in range(3)])
@@ -1280,3 +1280,103 @@ class TestPush(unittest.TestCase):
     def test_missing_name_live_update(self):
         with self.assertRaises(ValueError):
             ua.live_update(name=None, event=LiveUpdateEvent.END)
+
+
+class TestPushEncoding(unittest.TestCase):
+    def setUp(self):
+        self.airship = ua.Airship(TEST_KEY, TEST_SECRET)
+        self.push = ua.Push(self.airship)
+        self.push.audience = ua.all_
+        self.push.notification = ua.notification(alert="Hello")
+        self.push.device_types = ua.device_types("ios")
+
+    def _send(self, *methods):
+        response = requests.Response()
+        response._content = b'{"ok": true, "push_ids": ["0492662a-1b52-4343-a1f9-c6b0c72931c0"]}'
+        response.status_code = 202
+        with mock.patch.object(ua.Airship, "_request", return_value=response) as mock_request:
+            for method in methods:
+                method()
+        return [call.kwargs["body"] for call in mock_request.call_args_list]
+
+    def test_validate_then_send_reuses_body(self):
+        with mock.patch.object(
+            self.airship.codec, "dumps", wraps=self.airship.codec.dumps
+        ) as dumps:
+            validated, sent, resent = self._send(
+                self.push.validate, self.push.send, self.push.send
+            )
+
+        dumps.assert_called_once()
+        self.assertIs(validated, sent)
+        self.assertIs(sent, resent)
+        self.assertEqual(json.loads(sent), self.push.payload)
+
+    def test_field_change_rebuilds_body(self):
+        (before,) = self._send(self.push.send)
+        self.push.notification = ua.notification(alert="Goodbye")
+        (after,) = self._send(self.push.send)
+
+        self.assertEqual(json.loads(before)["notification"], {"alert": "Hello"})
+        self.assertEqual(json.loads(after)["notification"], {"alert": "Goodbye"})
+
+    def test_in_place_change_needs_invalidate(self):
+        self._send(self.push.send)
+        self.push.notification["alert"] = "Changed"
+        self.push.invalidate()
+        (body,) = self._send(self.push.send)
+
+        self.assertEqual(json.loads(body)["notification"], {"alert": "Changed"})
+
+    def test_payload_is_a_copy(self):
+        payload = self.push.payload
+        payload["audience"] = "changed"
+
+        self.assertEqual(self.push.payload["audience"], "all")
+
+    def test_email_check_after_device_types_change(self):
+        self._send(self.push.send)
+        self.push.device_types = ua.device_types("email")
+
+        with self.assertRaises(ValueError):
+            self.push.send()
+
+
+class TestPushResponse(unittest.TestCase):
+    def _response(self, content):
+        response = requests.Response()
+        response._content = content
+        response.status_code = 202
+        return response
+
+    def test_fields(self):
+        push_response = ua.PushResponse(
+            self._response(b'{"ok": true, "push_ids": ["a"], "operation_id": "op"}')
+        )
+
+        self.assertTrue(push_response.ok)
+        self.assertEqual(push_response.push_ids, ["a"])
+        self.assertEqual(push_response.operation_id, "op")
+        self.assertEqual(push_response.localized_ids, [])
+        self.assertEqual(push_response.schedule_url, [])
+        self.assertIsNone(push_response.error)
+
+    def test_slots(self):
+        push_response = ua.PushResponse(self._response(b'{"ok": true}'))
+
+        self.assertFalse(hasattr(push_response, "__dict__"))
+
+    def test_body_decoded_lazily_once(self):
+        codec = mock.Mock(wraps=ua.StdlibJsonCodec())
+        push_response = ua.PushResponse(self._response(b'{"ok": true}'), codec=codec)
+
+        codec.loads.assert_not_called()
+        self.assertTrue(push_response.ok)
+        self.assertEqual(push_response.payload, {"ok": True})
+        codec.loads.assert_called_once_with(b'{"ok": true}')
+
+    def test_decoded_data(self):
+        push_response = ua.PushResponse(None, {"ok": False}, error=ValueError("bad"))
+
+        self.assertFalse(push_response.ok)
+        self.assertIsInstance(push_response.error, ValueError)
@@ -1,7 +1,9 @@
 import datetime
 import unittest
+from zoneinfo import ZoneInfo
 
 import urbanairship as ua
+from tests import TEST_KEY, TEST_SECRET
 
 
 class TestSchedule(unittest.TestCase):
@@ -152,3 +154,166 @@ class TestSchedule(unittest.TestCase):
     def test_recurring_schedule_raises_bad_type(self):
         with self.assertRaises(ValueError):
             ua.recurring_schedule(count=1, type="fake_type")
+
+
+class TestSchedulePlanner(unittest.TestCase):
+    def setUp(self):
+        self.planner = ua.SchedulePlanner()
+
+    def _times(self):
+        return [list(schedule.values())[0] for schedule in self.planner.schedules()]
+
+    def test_single_send(self):
+        self.planner.add(datetime.datetime(2030, 3, 1, 9))
+
+        self.assertEqual(self.planner.schedules(), [{"scheduled_time": "2030-03-01T09:00:00"}])
+
+    def test_daily_with_exclusion(self):
+        sundays = ua.schedule_exclusion(
+            start_date=datetime.datetime(2030, 1, 1),
+            end_date=datetime.datetime(2030, 12, 31),
+            days_of_week=["sunday"],
+        )
+
+        self.planner.add(
+            datetime.datetime(2030, 3, 1, 9),
+            recurring=ua.recurring_schedule(count=1, type="daily", exclusions=[sundays]),
+            end_time=datetime.datetime(2030, 3, 5, 9),
+        )
+
+        self.assertEqual(
+            self._times(),
+            [
+                "2030-03-01T09:00:00",
+                "2030-03-02T09:00:00",
+                "2030-03-04T09:00:00",
+                "2030-03-05T09:00:00",
+            ],
+        )
+
+    def test_hour_range_exclusion(self):
+        self.planner.add(
+            datetime.datetime(2030, 3, 1, 20),
+            recurring={"cadence": {"type": "hourly", "count": 2}},
+            end_time=datetime.datetime(2030, 3, 2, 8),
+            exclusions=[{"hour_range": "22-5"}],
+        )
+
+        self.assertEqual(
+            self._times(),
+            ["2030-03-01T20:00:00", "2030-03-02T06:00:00", "2030-03-02T08:00:00"],
+        )
+
+    def test_regions_collapse_to_same_instant(self):
+        for tz, hour in (("America/New_York", 9), ("Europe/London", 14)):
+            self.planner.add(
+                datetime.datetime(2030, 3, 1, hour, tzinfo=ZoneInfo(tz)),
+                recurring=ua.recurring_schedule(count=1, type="daily"),
+                end_time=datetime.datetime(2030, 3, 3, 23, tzinfo=ZoneInfo(tz)),
+            )
+
+        self.assertEqual(len(self.planner), 3)
+        self.assertEqual(
+            self._times(),
+            ["2030-03-01T14:00:00", "2030-03-02T14:00:00", "2030-03-03T14:00:00"],
+        )
+
+    def test_wall_clock_across_daylight_saving(self):
+        new_york = ZoneInfo("America/New_York")
+
+        self.planner.add(
+            datetime.datetime(2030, 3, 9, 9, tzinfo=new_york),
+            recurring=ua.recurring_schedule(count=1, type="daily"),
+            end_time=datetime.datetime(2030, 3, 10, 9, tzinfo=new_york),
+        )
+
+        self.assertEqual(self._times(), ["2030-03-09T14:00:00", "2030-03-10T13:00:00"])
+
+    def test_weekly_days(self):
+        self.planner.add(
+            datetime.datetime(2030, 3, 6, 9),
+            recurring=ua.recurring_schedule(
+                count=2, type="weekly", days_of_week=["monday", "wednesday"]
+            ),
+            end_time=datetime.datetime(2030, 3, 31),
+        )
+
+        self.assertEqual(
+            self._times(),
+            ["2030-03-06T09:00:00", "2030-03-18T09:00:00", "2030-03-20T09:00:00"],
+        )
+
+    def test_monthly_keeps_to_month_end(self):
+        self.planner.add(
+            datetime.datetime(2030, 1, 31, 9),
+            recurring=ua.recurring_schedule(
+                count=1, type="monthly", end_time=datetime.datetime(2030, 4, 30)
+            ),
+        )
+
+        self.assertEqual(
+            self._times(),
+            ["2030-01-31T09:00:00", "2030-02-28T09:00:00", "2030-03-31T09:00:00"],
+        )
+
+    def test_local_schedules(self):
+        self.planner.add(datetime.datetime(2030, 3, 1, 9), local=True)
+        self.planner.add(datetime.datetime(2030, 3, 1, 9), local=True)
+        self.planner.add(datetime.datetime(2030, 3, 1, 9))
+
+        self.assertEqual(
+            self.planner.schedules(),
+            [
+                {"local_scheduled_time": "2030-03-01T09:00:00"},
+                {"scheduled_time": "2030-03-01T09:00:00"},
+            ],
+        )
+
+    def test_invalid_windows(self):
+        aware = datetime.datetime(2030, 3, 1, tzinfo=datetime.timezone.utc)
+        with self.assertRaises(ValueError):
+            self.planner.add(aware, local=True)
+        with self.assertRaises(ValueError):
+            self.planner.add(aware, recurring=ua.recurring_schedule(count=1, type="daily"))
+
+    def test_mixed_naive_and_aware_times(self):
+        daily = ua.recurring_schedule(count=1, type="daily")
+        naive = datetime.datetime(2030, 3, 1, 9)
+        aware = naive.replace(tzinfo=datetime.timezone.utc)
+
+        with self.assertRaises(ValueError):
+            self.planner.add(aware, recurring=daily, end_time=naive + datetime.timedelta(days=2))
+        with self.assertRaises(ValueError):
+            self.planner.add(naive, recurring=daily, end_time=aware + datetime.timedelta(days=2))
+        self.assertEqual(len(self.planner), 0)
+
+    def test_max_schedules(self):
+        planner = ua.SchedulePlanner(max_schedules=24)
+
+        with self.assertRaises(ValueError):
+            planner.add(
+                datetime.datetime(2030, 3, 1),
+                recurring=ua.recurring_schedule(count=1, type="hourly"),
+                end_time=datetime.datetime(2030, 3, 2),
+            )
+        self.assertEqual(len(planner), 0)
+
+    def test_scheduled_pushes(self):
+        airship = ua.client.BasicAuthClient(TEST_KEY, TEST_SECRET)
+        push = ua.Push(airship)
+        push.audience = ua.all_
+        push.notification = ua.notification(alert="Hello")
+        push.device_types = ua.device_types("ios")
+        self.planner.add(
+            datetime.datetime(2030, 3, 1, 9),
+            recurring=ua.recurring_schedule(count=1, type="daily"),
+            end_time=datetime.datetime(2030, 3, 2, 9),
+        )
+
+        scheduled = self.planner.scheduled_pushes(airship, push, name="spring")
+
+        self.assertEqual(len(scheduled), 2)
+        self.assertEqual(
+            scheduled[1].payload["schedule"], {"scheduled_time": "2030-03-02T09:00:00"}
+        )
+        self.assertEqual(scheduled[1].payload["name"], "spring")
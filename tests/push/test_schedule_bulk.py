@@ -0,0 +1,180 @@
+import datetime
+import unittest
+
+import urbanairship as ua
+from tests import TEST_KEY, TEST_SECRET
+from tests.push.fakes import FakeSchedulesEndpoint
+
+SCHEDULES_URL = "https://go.urbanairship.com/api/schedules/"
+
+
+def _listed(name, schedule):
+    return {
+        "url": SCHEDULES_URL + name,
+        "name": name,
+        "schedule": schedule,
+        "push": {"audience": "all", "notification": {"alert": name}, "device_types": "all"},
+    }
+
+
+LISTED = [
+    _listed("sale-1", {"scheduled_time": "2030-03-01T10:00:00"}),
+    _listed("sale-2", {"local_scheduled_time": "2030-05-01T10:00:00"}),
+    _listed("sale-3", {"best_time": {"send_date": "2030-03-15"}}),
+    _listed(
+        "sale-weekly",
+        {"scheduled_time": "2030-03-01T10:00:00", "recurring": {"cadence": {"type": "weekly"}}},
+    ),
+    _listed("news-1", {"scheduled_time": "2030-03-02T10:00:00"}),
+    {
+        "url": SCHEDULES_URL + "welcome",
+        "name": "welcome",
+        "schedule": {"scheduled_time": "2030-06-01T10:00:00"},
+        "push": {
+            "audience": {"named_user": "bob"},
+            "device_types": ["ios"],
+            "merge_data": {"template_id": "t1", "substitutions": {"NAME": "Bob"}},
+        },
+    },
+]
+
+
+def _endpoint(fail=()):
+    return FakeSchedulesEndpoint(SCHEDULES_URL, LISTED, fail)
+
+
+class TestBulkSchedules(unittest.TestCase):
+    def setUp(self):
+        self.airship = ua.client.BasicAuthClient(TEST_KEY, TEST_SECRET)
+        self.bulk = ua.BulkSchedules(self.airship, concurrency=3)
+
+    def _run(self, endpoint, operation, *args, **kwargs):
+        with endpoint.patch(self.airship):
+            return list(operation(*args, **kwargs))
+
+    def _scheduled_push(self, name):
+        push = ua.Push(self.airship)
+        push.audience = ua.all_
+        push.notification = ua.notification(alert=name)
+        push.device_types = ua.device_types("ios")
+        scheduled = ua.ScheduledPush(self.airship)
+        scheduled.name = name
+        scheduled.push = push
+        scheduled.schedule = ua.scheduled_time(datetime.datetime(2030, 1, 1))
+        return scheduled
+
+    def _names(self, **filters):
+        endpoint = _endpoint()
+        return [s.name for s in self._run(endpoint, self.bulk.select, **filters)]
+
+    def test_select_by_name(self):
+        self.assertEqual(self._names(name="sale-*"), ["sale-1", "sale-2", "sale-3", "sale-weekly"])
+        self.assertEqual(self._names(name="news-1"), ["news-1"])
+
+    def test_select_by_time(self):
+        self.assertEqual(
+            self._names(
+                scheduled_after=datetime.datetime(2030, 3, 1, 10),
+                scheduled_before=datetime.datetime(2030, 4, 1),
+            ),
+            ["sale-1", "sale-3", "news-1"],
+        )
+        self.assertEqual(
+            self._names(name="sale-*", scheduled_after=datetime.datetime(2030, 4, 1)),
+            ["sale-2"],
+        )
+
+    def test_select_with_aware_times(self):
+        berlin = datetime.timezone(datetime.timedelta(hours=1))
+
+        self.assertEqual(
+            self._names(
+                name="sale-*",
+                scheduled_after=datetime.datetime(2030, 3, 1, 11, tzinfo=berlin),
+                scheduled_before=datetime.datetime(2030, 3, 1, 12, tzinfo=berlin),
+            ),
+            ["sale-1"],
+        )
+
+    def test_update_selected(self):
+        endpoint = _endpoint()
+
+        with endpoint.patch(self.airship):
+            selected = [s for n in ("sale-1", "welcome") for s in self.bulk.select(name=n)]
+            for schedule in selected:
+                schedule.schedule = ua.scheduled_time(datetime.datetime(2031, 1, 1))
+            results = self.bulk.update(selected)
+
+        self.assertEqual([s.name for s in selected], ["sale-1", "welcome"])
+        self.assertIsInstance(selected[0].push, ua.Push)
+        self.assertIsInstance(selected[1].push, ua.TemplatePush)
+        self.assertTrue(all(r.ok for r in results), results)
+        self.assertEqual(
+            [url for method, url in endpoint.requests if method == "PUT"],
+            [SCHEDULES_URL + "sale-1", SCHEDULES_URL + "welcome"],
+        )
+
+    def test_unexpected_errors_reported_per_schedule(self):
+        endpoint = _endpoint()
+        broken = self._scheduled_push("promo-broken")
+        broken.url = SCHEDULES_URL + "promo-broken"
+        broken.push = {"audience": "all"}
+        sent = self._scheduled_push("promo-sent")
+        sent.url = SCHEDULES_URL + "promo-sent"
+
+        results = self._run(endpoint, self.bulk.update, [broken, sent])
+
+        self.assertIsInstance(results[0].error, AttributeError)
+        self.assertTrue(results[1].ok)
+
+    def test_send_many(self):
+        endpoint = _endpoint()
+        schedules = [self._scheduled_push("promo-%d" % i) for i in range(5)]
+
+        results = self._run(endpoint, self.bulk.send, schedules)
+
+        self.assertEqual([r.schedule for r in results], schedules)
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual(
+            [s.url for s in schedules], [SCHEDULES_URL + "promo-%d" % i for i in range(5)]
+        )
+        self.assertEqual(len(endpoint.requests), 5)
+
+    def test_cancel_matching_continues_after_failure(self):
+        endpoint = _endpoint(fail=[SCHEDULES_URL + "sale-2"])
+
+        with endpoint.patch(self.airship):
+            results = self.bulk.cancel(self.bulk.select(name="sale-*"))
+
+        self.assertEqual([r.ok for r in results], [True, False, True, True])
+        self.assertIsInstance(results[1].error, ua.AirshipFailure)
+        deleted = sorted(url for method, url in endpoint.requests if method == "DELETE")
+        self.assertEqual(
+            deleted, [SCHEDULES_URL + n for n in ("sale-1", "sale-2", "sale-3", "sale-weekly")]
+        )
+
+    def test_pause_and_resume(self):
+        endpoint = _endpoint()
+        weekly = self._run(endpoint, self.bulk.select, name="sale-weekly")
+
+        self.assertTrue(self._run(endpoint, self.bulk.pause, weekly)[0].ok)
+        self.assertTrue(self._run(endpoint, self.bulk.resume, weekly)[0].ok)
+        self.assertEqual(
+            endpoint.requests[-2:],
+            [
+                ("POST", SCHEDULES_URL + "sale-weekly/pause"),
+                ("POST", SCHEDULES_URL + "sale-weekly/resume"),
+            ],
+        )
+
+    def test_update_without_url_reported(self):
+        endpoint = _endpoint()
+        sent = self._scheduled_push("promo-sent")
+        sent.url = SCHEDULES_URL + "promo-sent"
+        unsent = self._scheduled_push("promo-unsent")
+
+        results = self._run(endpoint, self.bulk.update, [sent, unsent])
+
+        self.assertTrue(results[0].ok)
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertEqual(endpoint.requests, [("PUT", SCHEDULES_URL + "promo-sent")])
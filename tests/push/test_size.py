@@ -0,0 +1,87 @@
+import json
+import unittest
+
+import urbanairship as ua
+from tests import TEST_KEY, TEST_SECRET
+
+
+class TestPayloadSize(unittest.TestCase):
+    def test_platform_overrides(self):
+        notification = ua.notification(
+            alert="Hello",
+            ios=ua.ios(badge=1, extra={"k": "v"}),
+            android=ua.android(alert="Hi Android"),
+            web=ua.web(title="Sale"),
+        )
+
+        sizes = ua.estimate_payload_sizes(notification)
+
+        self.assertEqual(set(sizes), {"ios", "android", "web"})
+        ios = dict(notification["ios"], alert="Hello")
+        self.assertEqual(sizes["ios"].size, len(json.dumps(ios, separators=(",", ":"))))
+        self.assertEqual(sizes["ios"].limit, 4096)
+        self.assertEqual(sizes["android"].size, len(b'{"alert":"Hi Android"}'))
+        self.assertFalse(any(size.over_limit for size in sizes.values()))
+
+    def test_counts_bytes(self):
+        sizes = ua.estimate_payload_sizes(ua.notification(android=ua.android(alert="é")))
+
+        self.assertEqual(sizes["android"].size, len('{"alert":"é"}'.encode("utf-8")))
+
+    def test_oversized(self):
+        notification = ua.notification(
+            ios=ua.ios(alert="x" * 4100),
+            android=ua.android(alert="x" * 4000),
+            amazon=ua.amazon(alert="x" * 5000),
+        )
+
+        oversized = ua.oversized_platforms(notification)
+
+        self.assertEqual([size.platform for size in oversized], ["ios"])
+        self.assertTrue(oversized[0].over_limit)
+        self.assertEqual(oversized[0].unit, "bytes")
+
+    def test_sms_characters(self):
+        sizes = ua.estimate_payload_sizes(ua.notification(sms=ua.sms(alert="x" * 1601)))
+
+        self.assertEqual(sizes["sms"].size, 1601)
+        self.assertEqual(sizes["sms"].unit, "characters")
+        self.assertTrue(sizes["sms"].over_limit)
+
+    def test_sms_template_alert(self):
+        sizes = ua.estimate_payload_sizes(
+            ua.notification(sms=ua.sms(template_alert="Hi {{name}}"))
+        )
+
+        self.assertEqual(sizes["sms"].size, len("Hi {{name}}"))
+
+    def test_mms_and_email(self):
+        notification = ua.notification(
+            sms=ua.mms(fallback_text="See", content_type="image/png", url="https://a.b/c.png"),
+            email=ua.email(
+                message_type="commercial",
+                plaintext_body="x" * 500,
+                reply_to="a@b.c",
+                sender_address="a@b.c",
+                sender_name="A",
+                subject="S",
+            ),
+        )
+
+        sizes = ua.estimate_payload_sizes(notification, limits={"email": 100})
+
+        self.assertEqual(set(sizes), {"mms", "email"})
+        self.assertIsNone(sizes["mms"].limit)
+        self.assertFalse(sizes["mms"].over_limit)
+        self.assertTrue(sizes["email"].over_limit)
+
+    def test_push_device_types(self):
+        push = ua.Push(ua.client.BasicAuthClient(TEST_KEY, TEST_SECRET))
+        push.notification = ua.notification(alert="Hello", ios=ua.ios(badge=1))
+        push.device_types = ua.device_types("ios", "android", "sms")
+
+        sizes = ua.estimate_payload_sizes(push)
+
+        self.assertEqual(sizes["android"].size, len(b'{"alert":"Hello"}'))
+        self.assertEqual(sizes["sms"].size, 5)
+        self.assertEqual(sizes["ios"].size, len(b'{"badge":1,"alert":"Hello"}'))
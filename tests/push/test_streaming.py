@@ -0,0 +1,191 @@
+import asyncio
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+import mock
+
+import urbanairship as ua
+from tests import TEST_KEY, TEST_SECRET
+from tests.push.fakes import FakeCreateAndSendEndpoint, fake_async_client, httpx
+
+OPTED_IN = "2018-02-13T11:58:59"
+
+
+def _sms(airship, count, start=0):
+    for i in range(start, start + count):
+        yield ua.Sms(airship, sender="12345", msisdn="1503555%04d" % i, opted_in=OPTED_IN)
+
+
+class TestCreateAndSendStream(unittest.TestCase):
+    def setUp(self):
+        self.airship = ua.client.BasicAuthClient(TEST_KEY, TEST_SECRET)
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def _stream(self, **kwargs):
+        kwargs.setdefault("chunk_size", 3)
+        return ua.CreateAndSendStream(
+            self.airship,
+            device_types=ua.device_types("sms"),
+            notification=ua.notification(sms=ua.sms(alert="Hello")),
+            **kwargs,
+        )
+
+    def _send(self, stream, channels, endpoint):
+        with endpoint.patch(self.airship):
+            return list(stream.send(channels))
+
+    def test_chunks_requests(self):
+        endpoint = FakeCreateAndSendEndpoint()
+
+        results = self._send(self._stream(concurrency=2), _sms(self.airship, 8), endpoint)
+
+        self.assertEqual(sorted(r.index for r in results), [0, 1, 2])
+        self.assertEqual(sorted(r.size for r in results), [2, 3, 3])
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual(sorted(len(msisdns) for msisdns in endpoint.requests), [2, 3, 3])
+
+    def test_failed_chunk_reported(self):
+        endpoint = FakeCreateAndSendEndpoint(fail=["15035550004"])
+
+        results = self._send(self._stream(), _sms(self.airship, 6), endpoint)
+
+        by_index = {r.index: r for r in results}
+        self.assertTrue(by_index[0].ok)
+        self.assertFalse(by_index[1].ok)
+        self.assertIsInstance(by_index[1].response.error, ua.AirshipFailure)
+        self.assertEqual(by_index[1].response.payload["error_code"], 40001)
+
+    def test_invalid_channel_reported(self):
+        channels = list(_sms(self.airship, 2))
+        channels[1].opted_in = None
+        endpoint = FakeCreateAndSendEndpoint()
+
+        (result,) = self._send(self._stream(), channels, endpoint)
+
+        self.assertFalse(result.ok)
+        self.assertIsInstance(result.response.error, ValueError)
+        self.assertEqual(endpoint.requests, [])
+
+    def test_stopped_early_checkpoints_sent_chunks(self):
+        endpoint = FakeCreateAndSendEndpoint()
+        checkpoint = ua.MemoryCheckpoint()
+        stream = self._stream(chunk_size=1, concurrency=2, checkpoint=checkpoint)
+        # hold the first two chunks until both are in flight
+        barrier = threading.Barrier(2, timeout=5)
+
+        def request(*args, **kwargs):
+            barrier.wait()
+            return endpoint(*args, **kwargs)
+
+        with mock.patch.object(self.airship.session, "request", side_effect=request):
+            results = stream.send(_sms(self.airship, 6))
+            next(results)
+            results.close()
+
+        self.assertEqual(len(endpoint.requests), 2)
+        self.assertEqual(checkpoint.load(), {0, 1})
+
+    def test_resume_from_checkpoint(self):
+        path = os.path.join(self.directory, "checkpoint.json")
+        failing = FakeCreateAndSendEndpoint(fail=["15035550004"])
+
+        self._send(
+            self._stream(checkpoint=ua.FileCheckpoint(path)), _sms(self.airship, 9), failing
+        )
+
+        with open(path) as checkpoint_file:
+            self.assertEqual(json.load(checkpoint_file), {"acknowledged": 1, "also": [2]})
+        retry = FakeCreateAndSendEndpoint()
+        results = self._send(
+            self._stream(checkpoint=ua.FileCheckpoint(path)), _sms(self.airship, 9), retry
+        )
+
+        self.assertEqual([r.index for r in results], [1])
+        self.assertEqual(retry.requests, [["15035550003", "15035550004", "15035550005"]])
+        self.assertEqual(ua.FileCheckpoint(path).load(), {0, 1, 2})
+
+    def test_memory_checkpoint(self):
+        checkpoint = ua.MemoryCheckpoint()
+        checkpoint.save({0, 2})
+
+        self.assertEqual(checkpoint.load(), {0, 2})
+
+    def test_chunk_size_limit(self):
+        with self.assertRaises(ValueError):
+            self._stream(chunk_size=1001)
+
+    def test_read_channels_csv(self):
+        csv_file = io.StringIO("msisdn,name\n15035550001,Ann\n15035550002,Bob\n")
+
+        channels = list(
+            ua.read_channels_csv(
+                csv_file,
+                lambda row: ua.Sms(
+                    self.airship,
+                    sender="12345",
+                    msisdn=row["msisdn"],
+                    opted_in=OPTED_IN,
+                    template_fields={"name": row["name"]},
+                ),
+            )
+        )
+
+        self.assertEqual([c.msisdn for c in channels], ["15035550001", "15035550002"])
+        self.assertEqual(channels[1].template_fields, {"name": "Bob"})
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestCreateAndSendStreamAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_send_async(self):
+        endpoint = FakeCreateAndSendEndpoint(fail=["15035550000"])
+        airship = await fake_async_client(endpoint)
+        checkpoint = ua.MemoryCheckpoint()
+        stream = ua.CreateAndSendStream(
+            airship,
+            device_types=ua.device_types("sms"),
+            notification=ua.notification(sms=ua.sms(alert="Hello")),
+            chunk_size=2,
+            concurrency=2,
+            checkpoint=checkpoint,
+        )
+
+        results = [result async for result in stream.send_async(_sms(airship, 5))]
+        await airship.aclose()
+
+        self.assertEqual(sorted(r.index for r in results), [0, 1, 2])
+        self.assertEqual(checkpoint.load(), {1, 2})
+
+    async def test_send_async_stopped_early(self):
+        started = []
+
+        async def handler(request):
+            started.append(request)
+            if len(started) > 1:
+                await asyncio.sleep(10)
+            return httpx.Response(202, content=b'{"ok": true, "operation_id": "op"}')
+
+        airship = ua.AsyncBasicAuthClient(TEST_KEY, TEST_SECRET)
+        await airship.session.aclose()
+        airship.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        stream = ua.CreateAndSendStream(
+            airship,
+            device_types=ua.device_types("sms"),
+            notification=ua.notification(sms=ua.sms(alert="Hello")),
+            chunk_size=1,
+            concurrency=3,
+        )
+
+        results = stream.send_async(_sms(airship, 5))
+        first = await results.__anext__()
+        await results.aclose()
+        await airship.aclose()
+
+        self.assertTrue(first.ok)
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        self.assertEqual(tasks, [])
@@ -7,6 +7,14 @@ import requests
 
 import urbanairship as ua
 from tests import TEST_KEY, TEST_SECRET
+from tests.push.fakes import (
+    FakePushEndpoint,
+    FakeTemplatesEndpoint,
+    fake_async_client,
+    httpx,
+)
+
+TEMPLATE_ID = "ef34a8d9-0ad7-491c-86b0-aea74da15161"
 
 
 class TestTemplatePush(unittest.TestCase):
@@ -467,3 +475,207 @@ class TestTemplate(unittest.TestCase):
             template.delete(template_id)
 
             self.assertEqual(template.template_id, template_id)
+
+
+def _endpoint():
+    return FakePushEndpoint(key=lambda push: push["merge_data"]["substitutions"]["NAME"])
+
+
+def _records(names):
+    return ((ua.named_user("user-" + name), {"NAME": name}) for name in names)
+
+
+class TestTemplateSender(unittest.TestCase):
+    def setUp(self):
+        self.airship = ua.client.BasicAuthClient(TEST_KEY, TEST_SECRET)
+        self.endpoint = _endpoint()
+
+    def _send(self, sender, records):
+        with self.endpoint.patch(self.airship):
+            return list(sender.send(records))
+
+    def test_pushes(self):
+        sender = ua.TemplateSender(self.airship, TEMPLATE_ID, ua.device_types("ios"))
+
+        (push,) = sender.pushes(_records(["ann"]))
+
+        self.assertEqual(
+            push.payload,
+            {
+                "audience": {"named_user": "user-ann"},
+                "device_types": ["ios"],
+                "merge_data": {"template_id": TEMPLATE_ID, "substitutions": {"NAME": "ann"}},
+            },
+        )
+
+    def test_send_in_order(self):
+        names = [str(i) for i in range(7)]
+        sender = ua.TemplateSender(
+            self.airship, TEMPLATE_ID, ua.device_types("ios"), max_pushes=3, concurrency=2
+        )
+
+        results = self._send(sender, _records(names))
+
+        self.assertEqual([r.push.merge_data["substitutions"]["NAME"] for r in results], names)
+        self.assertEqual([r.response.push_ids for r in results], [["id-" + n] for n in names])
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual(sorted(len(sent) for sent in self.endpoint.requests), [1, 3, 3])
+        self.assertEqual(
+            set(self.endpoint.urls), {"https://go.urbanairship.com/api/templates/push"}
+        )
+
+    def test_failed_records_isolated(self):
+        sender = ua.TemplateSender(self.airship, TEMPLATE_ID, ua.device_types("ios"))
+
+        results = self._send(sender, _records(["ann", "bad", "bob"]))
+
+        self.assertEqual([r.ok for r in results], [True, False, True])
+        self.assertIsInstance(results[1].response.error, ua.AirshipFailure)
+
+    def test_missing_audience_reported(self):
+        sender = ua.TemplateSender(self.airship, TEMPLATE_ID, ua.device_types("ios"))
+
+        results = self._send(sender, [(None, {"NAME": "ann"}), (ua.all_, {"NAME": "bob"})])
+
+        self.assertIsInstance(results[0].response.error, ValueError)
+        self.assertTrue(results[1].ok)
+        self.assertEqual(self.endpoint.requests, [["bob"]])
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestTemplateSenderAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_send_async(self):
+        airship = await fake_async_client(_endpoint())
+        sender = ua.TemplateSender(
+            airship, TEMPLATE_ID, ua.device_types("ios"), max_pushes=2, concurrency=2
+        )
+        names = ["a", "b", "bad", "c", "d"]
+
+        results = [result async for result in sender.send_async(_records(names))]
+        await airship.aclose()
+
+        self.assertEqual([r.push.merge_data["substitutions"]["NAME"] for r in results], names)
+        self.assertEqual([r.ok for r in results], [True, True, False, True, True])
+
+
+def _template_payload(template_id, alert, modified_at="2017-08-31T20:18:10.924Z"):
+    return {
+        "id": template_id,
+        "name": "Welcome Message",
+        "variables": [
+            {"key": "FIRST_NAME", "name": "First Name", "default_value": None},
+            {"key": "LAST_NAME", "name": "Last Name", "default_value": "Smith"},
+        ],
+        "created_at": "2017-08-31T20:18:10.924Z",
+        "modified_at": modified_at,
+        "push": {"notification": {"alert": alert, "ios": {"badge": 1}}},
+        "last_used": None,
+    }
+
+
+class TestTemplateRendering(unittest.TestCase):
+    def setUp(self):
+        self.template = ua.Template(
+            None,
+            variables=[
+                {"key": "FIRST_NAME", "default_value": None},
+                {"key": "TITLE", "default_value": "Friend"},
+            ],
+            push={
+                "notification": {
+                    "alert": "Hi {{TITLE}} {{ FIRST_NAME }}, {{MISSING}}welcome!",
+                    "actions": {"open": {"type": "url", "content": "https://x/{{FIRST_NAME}}"}},
+                    "ios": {"badge": 1, "category": "{{not a variable}}"},
+                }
+            },
+        )
+
+    def test_render(self):
+        rendered = ua.render_template(self.template, {"FIRST_NAME": "Bob", "TITLE": None})
+
+        self.assertEqual(
+            rendered,
+            {
+                "notification": {
+                    "alert": "Hi Friend Bob, welcome!",
+                    "actions": {"open": {"type": "url", "content": "https://x/Bob"}},
+                    "ios": {"badge": 1, "category": "{{not a variable}}"},
+                }
+            },
+        )
+
+    def test_render_merge_data(self):
+        compiled = ua.CompiledTemplate(self.template)
+        data = ua.merge_data(TEMPLATE_ID, {"FIRST_NAME": "Ann", "TITLE": "Dr"})
+
+        self.assertEqual(compiled.render(data)["notification"]["alert"], "Hi Dr Ann, welcome!")
+        self.assertEqual(
+            compiled.render({"FIRST_NAME": 7})["notification"]["alert"], "Hi Friend 7, welcome!"
+        )
+
+
+class TestTemplateCache(unittest.TestCase):
+    def setUp(self):
+        self.airship = ua.client.BasicAuthClient(TEST_KEY, TEST_SECRET)
+        self.other_id = "b8f9b663-0a3b-cf45-587a-be880946e881"
+        self.endpoint = FakeTemplatesEndpoint(
+            {
+                TEMPLATE_ID: _template_payload(TEMPLATE_ID, "Hello {{FIRST_NAME}}"),
+                self.other_id: _template_payload(self.other_id, "Bye {{LAST_NAME}}"),
+            }
+        )
+        request = self.endpoint.patch(self.airship)
+        request.start()
+        self.addCleanup(request.stop)
+        self.cache = ua.TemplateCache(self.airship)
+
+    def test_get_fetches_once(self):
+        first = self.cache.get(TEMPLATE_ID)
+        second = self.cache.get(TEMPLATE_ID)
+
+        self.assertIs(first, second)
+        self.assertEqual(first.template_id, TEMPLATE_ID)
+        self.assertEqual(len(self.endpoint.requests), 1)
+        self.assertIn(TEMPLATE_ID, self.cache)
+
+    def test_render(self):
+        for name in ("Ann", "Bob"):
+            rendered = self.cache.render(TEMPLATE_ID, {"FIRST_NAME": name})
+            self.assertEqual(rendered["notification"]["alert"], "Hello " + name)
+        self.assertEqual(
+            self.cache.render(self.other_id, {})["notification"]["alert"], "Bye Smith"
+        )
+        self.assertEqual(len(self.endpoint.requests), 2)
+
+    def test_refresh_replaces_modified(self):
+        self.cache.get(TEMPLATE_ID)
+        self.cache.get(self.other_id)
+        self.endpoint.templates[TEMPLATE_ID] = _template_payload(
+            TEMPLATE_ID, "Hi {{FIRST_NAME}}", modified_at="2017-09-01T00:00:00.000Z"
+        )
+
+        self.assertEqual(self.cache.refresh(), [TEMPLATE_ID])
+        self.assertEqual(
+            self.cache.render(TEMPLATE_ID, {"FIRST_NAME": "Ann"})["notification"]["alert"],
+            "Hi Ann",
+        )
+        self.assertEqual(self.cache.refresh(), [])
+
+    def test_refresh_drops_deleted(self):
+        self.cache.get(self.other_id)
+        del self.endpoint.templates[self.other_id]
+
+        self.assertEqual(self.cache.refresh(), [self.other_id])
+        self.assertEqual(len(self.cache), 0)
+
+    def test_put_and_invalidate(self):
+        template = self.cache.get(TEMPLATE_ID)
+
+        self.assertFalse(self.cache.put(template))
+        self.cache.invalidate(TEMPLATE_ID)
+        self.assertNotIn(TEMPLATE_ID, self.cache)
+        self.assertTrue(self.cache.put(template))
+        self.cache.invalidate()
+        self.assertEqual(len(self.cache), 0)
+        with self.assertRaises(ValueError):
+            self.cache.put(ua.Template(self.airship))
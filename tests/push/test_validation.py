@@ -0,0 +1,209 @@
+import datetime
+import unittest
+
+import mock
+
+import urbanairship as ua
+from tests import TEST_KEY, TEST_SECRET
+
+CHANNEL = "0492662a-1b52-4343-a1f9-c6b0c72931c0"
+
+
+class TestPushValidator(unittest.TestCase):
+    def setUp(self):
+        self.validator = ua.PushValidator()
+        self.airship = ua.client.BasicAuthClient(TEST_KEY, TEST_SECRET)
+        self.push = ua.Push(self.airship)
+        self.push.audience = ua.or_(
+            ua.and_(ua.tag("a"), ua.not_(ua.segment("s"))),
+            ua.channel(CHANNEL),
+            ua.tag_group("loyalty", "gold"),
+            ua.text_attribute("city", "equals", "Portland"),
+            {"named_user": ["alice", "bob"]},
+        )
+        self.push.notification = ua.notification(
+            alert="Hello", ios=ua.ios(badge=1), android=ua.android(priority=1)
+        )
+        self.push.device_types = ua.device_types("ios", "android")
+        self.push.options = ua.options(expiry=3600)
+        self.push.campaigns = ua.campaigns(categories=["sale"])
+        self.push.message = ua.message("Title", "Body")
+        self.push.localizations = [
+            ua.localization(language="fr", notification=ua.notification(alert="Bonjour"))
+        ]
+
+    def _errors(self, **changes):
+        payload = dict(self.push.payload, **changes)
+        return self.validator.errors(payload)
+
+    def test_valid_push(self):
+        self.assertEqual(self.validator.errors(self.push.payload), [])
+        self.validator.validate(self.push.payload)
+
+    def test_audience_grammar(self):
+        audience = ua.or_(
+            ua.and_(ua.tag("a"), {"tagz": "b"}),
+            {"or": []},
+            {"ios_channel": "not-a-uuid"},
+            {"tag": "a", "segment": "b"},
+            {"device_token": ["f" * 64, "nope"]},
+        )
+
+        self.assertEqual(
+            self._errors(audience=audience),
+            [
+                "audience.or[0].and[1]: unknown selector 'tagz'",
+                "audience.or[1].or: must be a non-empty list",
+                "audience.or[2].ios_channel: 'not-a-uuid' is not a UUID",
+                "audience.or[3]: a selector must have exactly one key",
+                "audience.or[4].device_token[1]: 'nope' is not a 64 character hex device token",
+            ],
+        )
+
+    def test_list_only_for_list_selectors(self):
+        errors = self._errors(audience={"segment": ["a", "b"]})
+
+        self.assertEqual(errors, ["audience.segment: must be a non-empty string"])
+
+    def test_missing_fields(self):
+        errors = self.validator.errors({"audience": "all", "device_types": []})
+
+        self.assertEqual(
+            errors,
+            [
+                "device_types: must be 'all' or a non-empty list",
+                "notification, message or in_app is required",
+            ],
+        )
+
+    def test_device_type_overrides(self):
+        errors = self._errors(device_types=["ios", "symbian"])
+
+        self.assertEqual(
+            errors,
+            [
+                "device_types: invalid device type 'symbian'",
+                "notification.android: override for a device type not in device_types",
+            ],
+        )
+
+    def test_email_override_required(self):
+        errors = self._errors(device_types=["email"], notification={"alert": "hi"})
+
+        self.assertIn("notification.email: required when email is in device_types", errors)
+
+    def test_sections(self):
+        errors = self._errors(
+            notification={"alert": "hi", "ios": "badge"},
+            options={"expiry": 1.5, "no_throttle": "yes", "priority": 1},
+            campaigns={"categories": []},
+            message={"title": "t"},
+            in_app={"alert": "hi"},
+            localizations=[{"notification": {"alert": "x"}}, {"language": "de"}],
+            extra=True,
+        )
+
+        self.assertEqual(
+            errors,
+            [
+                "unknown push key 'extra'",
+                "notification.ios: must be an object",
+                "options.expiry: must be a timestamp or seconds",
+                "options.no_throttle: must be a boolean",
+                "options: unknown key 'priority'",
+                "campaigns.categories: must be a list of 1 to 10 categories",
+                "message.body: is required",
+                "in_app.display_type: is required",
+                "localizations[0]: one of language or country is required",
+                "localizations[1]: one of notification, message or in_app is required",
+            ],
+        )
+
+    def test_unchecked_selectors(self):
+        recency = {"recency": {"last_seen": {"days": 7}}}
+
+        self.assertEqual(self._errors(audience=ua.and_(ua.tag("a"), recency)), [])
+        self.assertEqual(
+            self._errors(audience={"custom": "x"}), ["audience: unknown selector 'custom'"]
+        )
+        validator = ua.PushValidator(extra_selectors=["custom"])
+        self.assertEqual(validator.errors(dict(self.push.payload, audience={"custom": "x"})), [])
+
+    def test_create_and_send_audience(self):
+        payload = {
+            "audience": {
+                "create_and_send": [
+                    {"ua_msisdn": "15035556789", "ua_sender": "12345"},
+                    {"ua_address": "a@example.com"},
+                    {"ua_msisdn": "15035556780"},
+                    {"name": "no address"},
+                ]
+            },
+            "device_types": ["sms"],
+            "notification": {"sms": {"alert": "hi"}},
+        }
+
+        self.assertEqual(
+            self.validator.errors(payload),
+            [
+                "audience.create_and_send[2]: ua_sender is required with ua_msisdn",
+                "audience.create_and_send[3]: one of ua_address or ua_msisdn is required",
+            ],
+        )
+
+    def test_validate_raises(self):
+        with self.assertRaises(ValueError) as context:
+            self.validator.validate({"audience": {"tagz": "a"}, "device_types": ["ios"]})
+
+        self.assertIn("unknown selector 'tagz'", str(context.exception))
+
+
+class TestLocalValidate(unittest.TestCase):
+    def setUp(self):
+        self.airship = ua.client.BasicAuthClient(TEST_KEY, TEST_SECRET)
+        self.push = ua.Push(self.airship)
+        self.push.audience = ua.all_
+        self.push.notification = ua.notification(alert="Hello")
+        self.push.device_types = ua.device_types("ios")
+
+    def test_push_validate_local(self):
+        with mock.patch.object(ua.client.BasicAuthClient, "_request") as mock_request:
+            response = self.push.validate(remote=False)
+
+        mock_request.assert_not_called()
+        self.assertTrue(response.ok)
+
+    def test_push_validate_local_invalid(self):
+        self.push.audience = {"tagz": "a"}
+
+        with self.assertRaises(ValueError):
+            self.push.validate(remote=False)
+
+    def test_scheduled_push_validate_local(self):
+        sched = ua.ScheduledPush(self.airship)
+        sched.push = self.push
+        sched.schedule = ua.scheduled_time(datetime.datetime(2030, 1, 1))
+
+        with mock.patch.object(ua.client.BasicAuthClient, "_request") as mock_request:
+            self.assertTrue(sched.validate(remote=False).ok)
+
+        mock_request.assert_not_called()
+        sched.schedule = {"scheduled_time": "2030-01-01T00:00:00", "best_time": {}}
+        self.push.device_types = ["symbian"]
+        with self.assertRaises(ValueError) as context:
+            sched.validate(remote=False)
+        self.assertIn("schedule must have one of", str(context.exception))
+        self.assertIn("push.device_types: invalid device type", str(context.exception))
+
+    def test_scheduled_create_and_send_validate_local(self):
+        sms = ua.Sms(
+            self.airship, sender="12345", msisdn="15035556789", opted_in="2018-02-13T11:58:59"
+        )
+        push = ua.CreateAndSendPush(self.airship, channels=[sms])
+        push.device_types = ua.device_types("sms")
+        push.notification = ua.notification(sms=ua.sms(alert="Hello"))
+        sched = ua.ScheduledPush(self.airship)
+        sched.push = push
+        sched.schedule = ua.scheduled_time(datetime.datetime(2030, 1, 1))
+
+        self.assertTrue(sched.validate(remote=False).ok)
@@ -1,8 +1,8 @@
 import json
 import unittest
 
+import mock
 import requests
-from mock import Mock
 
 import urbanairship as ua
 from tests import TEST_KEY, TEST_SECRET
@@ -43,7 +43,9 @@ class TestExperimentsReports(unittest.TestCase):
             }
         ).encode("UTF-8")
 
-        ua.Airship._request = Mock()
+        patcher = mock.patch.object(ua.Airship, "_request")
+        patcher.start()
+        self.addCleanup(patcher.stop)
         ua.Airship._request.side_effect = [mock_response]
 
         airship = ua.Airship(TEST_KEY, TEST_SECRET)
@@ -97,7 +99,9 @@ class TestExperimentsReports(unittest.TestCase):
             }
         ).encode("UTF-8")
 
-        ua.Airship._request = Mock()
+        patcher = mock.patch.object(ua.Airship, "_request")
+        patcher.start()
+        self.addCleanup(patcher.stop)
         ua.Airship._request.side_effect = [mock_response]
 
         airship = ua.Airship(TEST_KEY, TEST_SECRET)
@@ -2,8 +2,8 @@ import json
 import unittest
 from datetime import datetime
 
+import mock
 import requests
-from mock import Mock
 
 import urbanairship as ua
 from tests import TEST_KEY, TEST_SECRET
@@ -22,7 +22,9 @@ class TestResponseStats(unittest.TestCase):
             }
         ).encode("utf-8")
 
-        ua.Airship._request = Mock()
+        patcher = mock.patch.object(ua.Airship, "_request")
+        patcher.start()
+        self.addCleanup(patcher.stop)
         ua.Airship._request.side_effect = [mock_response]
 
         airship = ua.Airship(TEST_KEY, TEST_SECRET)
@@ -73,7 +75,9 @@ class TestResponseList(unittest.TestCase):
             }
         ).encode("utf-8")
 
-        ua.Airship._request = Mock()
+        patcher = mock.patch.object(ua.Airship, "_request")
+        patcher.start()
+        self.addCleanup(patcher.stop)
         ua.Airship._request.side_effect = [mock_response]
 
         airship = ua.Airship(TEST_KEY, TEST_SECRET)
@@ -140,7 +144,9 @@ class TestResponseList(unittest.TestCase):
             }
         ).encode("utf-8")
 
-        ua.Airship._request = Mock()
+        patcher = mock.patch.object(ua.Airship, "_request")
+        patcher.start()
+        self.addCleanup(patcher.stop)
         ua.Airship._request.side_effect = [mock_response, mock_next_response]
 
         airship = ua.Airship(TEST_KEY, TEST_SECRET)
@@ -215,7 +221,9 @@ class TestDevicesReport(unittest.TestCase):
             }
         ).encode("utf-8")
 
-        ua.Airship._request = Mock()
+        patcher = mock.patch.object(ua.Airship, "_request")
+        patcher.start()
+        self.addCleanup(patcher.stop)
         ua.Airship._request.side_effect = [mock_response]
 
         airship = ua.Airship(TEST_KEY, TEST_SECRET)
@@ -262,7 +270,9 @@ class TestOptInList(unittest.TestCase):
             }
         ).encode("utf-8")
 
-        ua.Airship._request = Mock()
+        patcher = mock.patch.object(ua.Airship, "_request")
+        patcher.start()
+        self.addCleanup(patcher.stop)
         ua.Airship._request.side_effect = [mock_response]
 
         airship = ua.Airship(TEST_KEY, TEST_SECRET)
@@ -3,9 +3,11 @@
 import logging
 from typing import Any, List
 
+from .async_client import AsyncBasicAuthClient, AsyncBearerTokenClient, AsyncOAuthClient
 from .automation.core import Automation
 from .automation.pipeline import Pipeline
 from .client import BasicAuthClient, BearerTokenClient, OAuthClient
+from .codec import JsonCodec, OrjsonCodec, StdlibJsonCodec
 from .common import AirshipFailure, ConnectionFailure, Unauthorized
 from .core import Airship as _DeprecatedAirship
 from .custom_events import CustomEvent
@@ -40,14 +42,35 @@ from .devices import (
     TagList,
 )
 from .experiments import ABTest, Experiment, Variant
+from .hooks import RequestHook, RequestInfo
+from .metrics import MetricsCollector
 from .push import (
+    AudienceChunker,
+    BulkSchedules,
+    ChunkResult,
+    CompiledTemplate,
     CreateAndSendPush,
+    CreateAndSendStream,
+    FileCheckpoint,
+    MemoryCheckpoint,
+    PayloadSize,
+    PreparedPush,
     Push,
+    PushBatch,
+    PushResponse,
+    PushValidator,
     ScheduledList,
     ScheduledPush,
+    SchedulePlanner,
+    ScheduleResult,
+    SendCheckpoint,
     Template,
+    TemplateCache,
     TemplateList,
     TemplatePush,
+    TemplatePushBatch,
+    TemplatePushResult,
+    TemplateSender,
     actions,
     alias,
     all_,
@@ -64,6 +87,7 @@ from .push import (
     device_token,
     device_types,
     email,
+    estimate_payload_sizes,
     in_app,
     interactive,
     ios,
@@ -82,10 +106,14 @@ from .push import (
     number_attribute,
     open_channel,
     open_platform,
+    optimize_audience,
     options,
     or_,
+    oversized_platforms,
     public_notification,
+    read_channels_csv,
     recurring_schedule,
+    render_template,
     schedule_exclusion,
     scheduled_time,
     segment,
@@ -103,6 +131,7 @@ from .push import (
     wns,
     wns_payload,
 )
+from .ratelimit import RateLimiter
 from .reports import (
     AppOpensList,
     CustomEventsList,
@@ -117,6 +146,8 @@ from .reports import (
     TimeInAppList,
     WebResponseReport,
 )
+from .retry import RetryPolicy
+from .token_store import FileTokenStore, MemoryTokenStore, TokenStore
 
 Airship = BasicAuthClient
 
@@ -124,14 +155,35 @@ __all__: List[Any] = [
     BasicAuthClient,
     BearerTokenClient,
     OAuthClient,
+    AsyncBasicAuthClient,
+    AsyncBearerTokenClient,
+    AsyncOAuthClient,
+    RetryPolicy,
+    RateLimiter,
+    RequestHook,
+    RequestInfo,
+    MetricsCollector,
+    TokenStore,
+    MemoryTokenStore,
+    FileTokenStore,
+    JsonCodec,
+    StdlibJsonCodec,
+    OrjsonCodec,
     Airship,
     AirshipFailure,
     ConnectionFailure,
     Unauthorized,
     all_,
     Push,
+    PushBatch,
+    PreparedPush,
+    AudienceChunker,
+    PushResponse,
     ScheduledPush,
     TemplatePush,
+    TemplatePushBatch,
+    TemplateSender,
+    TemplatePushResult,
     ios_channel,
     android_channel,
     amazon_channel,
@@ -150,6 +202,11 @@ __all__: List[Any] = [
     and_,
     or_,
     not_,
+    optimize_audience,
+    estimate_payload_sizes,
+    oversized_platforms,
+    PayloadSize,
+    PushValidator,
     notification,
     ios,
     android,
@@ -174,6 +231,7 @@ __all__: List[Any] = [
     best_time,
     named_user,
     merge_data,
+    render_template,
     recurring_schedule,
     schedule_exclusion,
     static_list,
@@ -209,13 +267,24 @@ __all__: List[Any] = [
     StaticLists,
     Template,
     TemplateList,
+    TemplateCache,
+    CompiledTemplate,
     ScheduledList,
+    BulkSchedules,
+    ScheduleResult,
+    SchedulePlanner,
     Automation,
     Pipeline,
     Email,
     EmailTags,
     EmailAttachment,
     CreateAndSendPush,
+    CreateAndSendStream,
+    ChunkResult,
+    SendCheckpoint,
+    MemoryCheckpoint,
+    FileCheckpoint,
+    read_channels_csv,
     date_attribute,
     text_attribute,
     number_attribute,
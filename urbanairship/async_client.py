@@ -0,0 +1,499 @@
+import asyncio
+import contextlib
+import logging
+import time
+from functools import partial
+from typing import Any, AsyncIterator, ContextManager, Dict, List, Optional
+from urllib.parse import urlencode
+
+from urbanairship.hooks import RequestInfo
+from urbanairship.retry import RetryPolicy
+from urbanairship.token_store import TokenStore, token_cache_key
+from urbanairship.urls import Urls
+
+from . import common
+from .client import (
+    DEFAULT_API_VERSION,
+    DEFAULT_REFRESH_SKEW_S,
+    DEFAULT_REQ_TIMEOUT_S,
+    DEFAULT_TOKEN_MAX_TRIES,
+    DEFAULT_TOKEN_TIMEOUT_S,
+    TOKEN_ENDPOINT,
+    TOKEN_HEADERS,
+    VALID_KEY,
+    BaseClient,
+    _oauth_assertion,
+    _oauth_token_form,
+    _oauth_token_url,
+)
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+logger = logging.getLogger("urbanairship")
+
+
+@contextlib.asynccontextmanager
+async def _store_lock(token_store: TokenStore, cache_key: str) -> AsyncIterator[None]:
+    """Hold ``token_store``'s lock, waiting for it in a worker thread."""
+    lock = token_store.lock(cache_key)
+    entering = asyncio.ensure_future(asyncio.to_thread(lock.__enter__))
+    try:
+        await asyncio.shield(entering)
+    except asyncio.CancelledError:
+        # the worker thread still takes the lock; release it once it has
+        entering.add_done_callback(partial(_release_store_lock, lock))
+        raise
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(lock.__exit__, None, None, None)
+
+
+def _release_store_lock(lock: ContextManager[None], entering: "asyncio.Future[None]") -> None:
+    if not entering.cancelled() and entering.exception() is None:
+        lock.__exit__(None, None, None)
+
+
+class AsyncBaseClient(BaseClient):
+    """Base client class for interacting with the Airship API from asyncio code.
+
+    Requests are made with an ``httpx.AsyncClient``, so a single event loop can keep
+    many requests in flight without a thread per request. Install the ``async``
+    extra (``pip install urbanairship[async]``) to use these clients.
+
+    Resource objects accept an async client in place of a synchronous one; use the
+    ``*_async`` variants of their methods, e.g. ``await push.send_async()``.
+
+    :param key: [required] An airship app key (project key) which identifies the project
+    :param location: [optional] The Airship cloud site the project is located in.
+        May be 'us' or 'eu'. Defaults to 'us'.
+    :param timeout: [optional]  An integer specifying the number of seconds used
+        for a response timeout threshold
+    :param base_url: [optional] A string defining an arbitrary base_url to use
+        for requests to the Airship API. To be used in place of location.
+    :param retries: [optional] An integer specifying the number of times to retry a
+        failed request. Retried requests use exponential backoff between requests.
+        Defaults to 0, no retry.
+    :param kwargs: [optional] Connection pool settings, as for
+        :py:class:`urbanairship.client.BaseClient`. ``pool_maxsize`` bounds the number
+        of keep-alive connections; with ``pool_block`` it also caps the total number of
+        open connections, and requests wait for a free one. ``pool_connections`` has no
+        httpx equivalent and is ignored.
+    """
+
+    session: "httpx.AsyncClient"  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        key: str,
+        location: str = "us",
+        timeout: int = DEFAULT_REQ_TIMEOUT_S,
+        retries: int = 0,
+        base_url: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for async clients. "
+                "Install it with 'pip install urbanairship[async]'."
+            )
+        super().__init__(
+            key=key,
+            location=location,
+            timeout=timeout,
+            retries=retries,
+            base_url=base_url,
+            **kwargs,
+        )
+
+    def _new_session(self) -> "httpx.AsyncClient":  # type: ignore[override]
+        limits = httpx.Limits(
+            max_connections=self.pool_maxsize if self.pool_block else None,
+            max_keepalive_connections=self.pool_maxsize if self.keep_alive else 0,
+        )
+        return httpx.AsyncClient(limits=limits)
+
+    async def __aenter__(self) -> "AsyncBaseClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.session.aclose()
+
+    async def request(  # type: ignore[override]
+        self,
+        method: str,
+        body: Any,
+        url: str,
+        content_type: Optional[str] = None,
+        version: int = DEFAULT_API_VERSION,
+        params: Optional[Dict[str, Any]] = None,
+        encoding: Optional[str] = None,
+    ) -> "httpx.Response":
+        return await self._request(method, body, url, content_type, version, params, encoding)
+
+    async def _request(  # type: ignore[override]
+        self,
+        method: str,
+        body: Any,
+        url: str,
+        content_type: Optional[str] = None,
+        version: int = DEFAULT_API_VERSION,
+        params: Optional[Dict[str, Any]] = None,
+        encoding: Optional[str] = None,
+    ) -> "httpx.Response":
+        body, encoding = self._compress_body(body, content_type, encoding)
+        headers = self._request_headers(content_type, version, encoding)
+        if not self.hooks:
+            return await self.retry_policy.call_async(
+                self._make_request, method, url, body, params, headers
+            )
+        info = self._request_info(method, url, body)
+        return await self.retry_policy.call_async(
+            self._make_request,
+            method,
+            url,
+            body,
+            params,
+            headers,
+            info,
+            on_retry=partial(self._hook_retry, info),
+        )
+
+    async def _make_request(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        body: Any,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, Any],
+        info: Optional[RequestInfo] = None,
+    ) -> "httpx.Response":
+        self._log_request(method, url, headers, body)
+        # requests form-encodes dict bodies; httpx needs them passed as data
+        content = None if isinstance(body, dict) else body
+        data = body if isinstance(body, dict) else None
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+        if info is not None:
+            self._hook_before(info)
+        response: Optional["httpx.Response"] = None
+        try:
+            try:
+                response = await self.session.request(
+                    method,
+                    url,
+                    content=content,
+                    data=data,
+                    params=params,
+                    headers=headers,
+                    timeout=self.timeout,
+                )
+            except (httpx.NetworkError, httpx.ConnectTimeout) as err:
+                raise common.ConnectionFailure(str(err))
+
+            self._log_response(response)
+            self._raise_for_status(response)
+        except Exception as exc:
+            if info is not None:
+                self._hook_error(info, response, exc)
+            raise
+
+        if info is not None:
+            self._hook_after(info, response)
+        return response
+
+
+class AsyncBasicAuthClient(AsyncBaseClient):
+    """
+    Async client class for interacting with the Airship API using either key and
+        master secret or key and application secret, depending on need.
+
+    :param key: [required] An Airship app key (project key) which identifies the project
+    :param secret: [required] An Airship application secret or master secret used to
+        authenticate.
+    :param location: [optional] The Airship cloud site the project is located in.
+        May be 'us' or 'eu'. Defaults to 'us'.
+    :param timeout: [optional]  An integer specifying the number of seconds used
+        for a response timeout threshold
+    :param retries: [optional] An integer specifying the number of times to retry a
+        failed request. Retried requests use exponential backoff between requests.
+        Defaults to 0, no retry.
+    :param kwargs: [optional] Additional :py:class:`AsyncBaseClient` options, such as
+        connection pool settings.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        secret: str,
+        location: str = "us",
+        timeout: int = DEFAULT_REQ_TIMEOUT_S,
+        retries: int = 0,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(key=key, location=location, timeout=timeout, retries=retries, **kwargs)
+        self.secret = secret
+        self.session.auth = (self.key, self.secret)
+
+    @property
+    def secret(self) -> Optional[str]:
+        return self._secret
+
+    @secret.setter
+    def secret(self, value: Optional[str]) -> None:
+        if isinstance(value, str) and not VALID_KEY.match(value):
+            raise ValueError("secrets must be 22 characters")
+        self._secret = value
+
+
+class AsyncBearerTokenClient(AsyncBaseClient):
+    """
+    Async client class for interacting with the Airship API using bearer token
+    authentication
+
+    :param key: [required] An Airship app key (project key) which identifies the project
+    :param token: [required]  An Airship-generated bearer token for the provided key.
+    :param location: [optional] The Airship cloud site the project is located in.
+        May be 'us' or 'eu'. Defaults to 'us'.
+    :param timeout: [optional]  An integer specifying the number of seconds used
+        for a response timeout threshold
+    :param retries: [optional] An integer specifying the number of times to retry a
+        failed request. Retried requests use exponential backoff between requests.
+        Defaults to 0, no retry.
+    :param kwargs: [optional] Additional :py:class:`AsyncBaseClient` options, such as
+        connection pool settings.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        token: str,
+        location: str = "us",
+        timeout: int = DEFAULT_REQ_TIMEOUT_S,
+        retries: int = 0,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(key=key, location=location, timeout=timeout, retries=retries, **kwargs)
+        self.token = token
+
+        self.session.headers.update({"X-UA-Appkey": key, "Authorization": f"Bearer {self.token}"})
+
+    @property
+    def token(self) -> Optional[str]:
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]) -> None:
+        self._token = value
+
+
+class AsyncOAuthClient(AsyncBaseClient):
+    """
+    Async client class for interacting with the Airship API using OAuth2
+    authentication with JWT assertion. See :py:class:`urbanairship.client.OAuthClient`
+    for details on scopes and endpoint support.
+
+    :param key: [required] An Airship app key (project key) which identifies the project
+    :param client_id: [required] An Airship provided client id used to generate OAuth
+        authentication tokens.
+    :param private_key:  [required] The private key required to sign JWT assertions.
+    :param scope: [optional] A list of scopes to which the issued token will be entitled.
+    :param ip_addr: [optional] A list of CIDR representations of valid IP addresses to
+        which the issued token is restricted.
+    :param location: [optional] The Airship cloud site the project is located in.
+        May be 'us' or 'eu'. Defaults to 'us'.
+    :param timeout: [optional]  An integer specifying the number of seconds used
+        for a response timeout threshold
+    :param retries: [optional] An integer specifying the number of times to retry a
+        failed request. Retried requests use exponential backoff between requests.
+        Defaults to 0, no retry.
+    :param refresh_skew: [optional] Number of seconds before the access token expires
+        at which it is refreshed. Defaults to 60.
+    :param background_refresh: [optional] When True, a task on the event loop
+        refreshes the token ahead of expiry so requests never wait for a refresh. It
+        is cancelled by :py:meth:`aclose`. Defaults to False.
+    :param token_store: [optional] A :py:class:`urbanairship.token_store.TokenStore`
+        shared with other clients, as for :py:class:`urbanairship.client.OAuthClient`.
+        Async clients take the store's lock and call the store in a worker thread, so
+        waiting on another process or on file I/O doesn't block the event loop.
+    :param token_timeout: [optional] Number of seconds to wait for the token endpoint
+        to respond. Defaults to 60.
+    :param token_retry_policy: [optional] A :py:class:`urbanairship.retry.RetryPolicy`
+        for token requests. Defaults to up to 5 attempts with exponential backoff.
+    :param kwargs: [optional] Additional :py:class:`AsyncBaseClient` options, such as
+        connection pool settings. Pool settings also apply to the token endpoint.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        client_id: str,
+        private_key: str,
+        location: str = "us",
+        scope: Optional[List[str]] = None,
+        ip_addr: Optional[List[str]] = None,
+        timeout: int = DEFAULT_REQ_TIMEOUT_S,
+        retries: int = 0,
+        refresh_skew: int = DEFAULT_REFRESH_SKEW_S,
+        background_refresh: bool = False,
+        token_store: Optional[TokenStore] = None,
+        token_timeout: int = DEFAULT_TOKEN_TIMEOUT_S,
+        token_retry_policy: Optional[RetryPolicy] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(key, location, timeout, retries, **kwargs)
+        self.client_id = client_id
+        self.scope = scope
+        self.ip_addr = ip_addr
+        self.private_key = private_key
+        self.token_url: str = _oauth_token_url(self.location)
+        self.token: Optional[str] = None
+        self.urls = Urls(location=self.location, oauth_base=True)
+        self.access_token_expires_at: int = 0
+        self.refresh_skew = refresh_skew
+        self.background_refresh = background_refresh
+        self.token_store = token_store
+        self.token_timeout = token_timeout
+        self.token_retry_policy = token_retry_policy or RetryPolicy(
+            max_tries=DEFAULT_TOKEN_MAX_TRIES
+        )
+        self.token_session = self._new_session()
+        self._token_lock = asyncio.Lock()
+        self._refresh_task: Optional["asyncio.Task[None]"] = None
+
+    async def aclose(self) -> None:
+        """Stop background token refresh and close the underlying connection pools."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        await self.token_session.aclose()
+        await super().aclose()
+
+    def _token_is_fresh(self) -> bool:
+        return bool(self.token) and time.time() < self.access_token_expires_at - self.refresh_skew
+
+    async def _update_session_oauth_token(self) -> None:
+        if self._token_is_fresh():
+            return
+
+        async with self._token_lock:
+            # another task may have refreshed the token while this one waited
+            if self._token_is_fresh():
+                return
+            if not self.token:
+                logger.debug("No OAuth2 access token found. Getting new token.")
+            else:
+                logger.debug("OAuth access token expiring. Refreshing token.")
+            await self._acquire_token()
+
+        if self.background_refresh and self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        while True:
+            await asyncio.sleep(
+                max(self.access_token_expires_at - self.refresh_skew - time.time(), 1)
+            )
+            try:
+                async with self._token_lock:
+                    logger.debug("Refreshing OAuth access token in the background.")
+                    await self._acquire_token()
+            except Exception:
+                # requests will refresh the token themselves once it goes stale
+                logger.exception("Background OAuth token refresh failed")
+
+    async def _acquire_token(self) -> None:
+        """Take a fresh token from the token store, or fetch and store a new one."""
+        if self.token_store is None:
+            await self._refresh_token()
+            return
+
+        cache_key = token_cache_key(self.key, self.client_id, self.scope)
+        async with _store_lock(self.token_store, cache_key):
+            stored = await asyncio.to_thread(self.token_store.get, cache_key)
+            if stored is not None and stored[1] - self.refresh_skew > time.time():
+                logger.debug("Using OAuth access token from token store.")
+                self.token, self.access_token_expires_at = stored
+                return
+            await self._refresh_token()
+            if self.token:
+                await asyncio.to_thread(
+                    self.token_store.set, cache_key, (self.token, self.access_token_expires_at)
+                )
+
+    async def _refresh_token(self) -> None:
+        """Fetch a new access token. Called with the token lock held."""
+        info = RequestInfo("POST", self.token_url, TOKEN_ENDPOINT) if self.hooks else None
+        response = await self.token_retry_policy.call_async(
+            self._post_token,
+            info,
+            on_retry=partial(self._hook_retry, info) if info is not None else None,
+        )
+        resp_data = self.codec.loads(response.content)
+        self.token = resp_data.get("access_token")
+        self.access_token_expires_at = int(time.time()) + int(resp_data.get("expires_in"))
+
+    async def _post_token(self, info: Optional[RequestInfo] = None) -> "httpx.Response":
+        # a fresh assertion per attempt, as each carries a single-use nonce
+        form = _oauth_token_form(
+            _oauth_assertion(
+                key=self.key,
+                client_id=self.client_id,
+                private_key=self.private_key,
+                token_url=self.token_url,
+                scope=self.scope,
+                ip_addr=self.ip_addr,
+            )
+        )
+        if info is not None:
+            info.request_bytes = len(urlencode(form))
+            self._hook_before(info)
+        response: Optional["httpx.Response"] = None
+        try:
+            try:
+                response = await self.token_session.post(
+                    self.token_url, data=form, headers=TOKEN_HEADERS, timeout=self.token_timeout
+                )
+            except (httpx.TimeoutException, httpx.NetworkError) as err:
+                raise common.ConnectionFailure(str(err))
+            if not (200 <= response.status_code < 300):
+                raise common.AirshipFailure.from_response(response, self.codec)
+        except Exception as exc:
+            if info is not None:
+                self._hook_error(info, response, exc)
+            raise
+
+        if info is not None:
+            self._hook_after(info, response)
+        return response
+
+    def _request_headers(
+        self,
+        content_type: Optional[str] = None,
+        version: Optional[int] = DEFAULT_API_VERSION,
+        encoding: Optional[str] = None,
+    ) -> Dict[str, str]:
+        headers = dict(super()._request_headers(content_type, version, encoding))
+        headers["X-UA-Appkey"] = self.key
+        headers["Authorization"] = f"Bearer {self.token}"
+        return headers
+
+    async def _request(  # type: ignore[override]
+        self,
+        method: str,
+        body: Any,
+        url: str,
+        content_type: Optional[str] = None,
+        version: int = DEFAULT_API_VERSION,
+        params: Optional[Dict[str, Any]] = None,
+        encoding: Optional[str] = None,
+    ) -> "httpx.Response":
+        await self._update_session_oauth_token()
+        return await super()._request(method, body, url, content_type, version, params, encoding)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING, List, Optional, Union
 
 from requests import Response
@@ -28,7 +27,7 @@ class Automation(object):
         :keyword pipelines: A single Pipeline payload or list of Pipeline payloads
         """
         url = self.airship.urls.get("pipelines_url")
-        body = json.dumps(pipelines)
+        body = self.airship.codec.dumps(pipelines)
         response = self.airship.request(
             method="POST",
             body=body,
@@ -45,7 +44,7 @@ class Automation(object):
         :keyword pipelines: A single Pipeline payload or list of Pipeline payloads
         """
         url = self.airship.urls.get("pipelines_url") + "validate/"
-        body = json.dumps(pipelines)
+        body = self.airship.codec.dumps(pipelines)
         response = self.airship.request(
             method="POST",
             body=body,
@@ -63,7 +62,7 @@ class Automation(object):
         :keyword pipeline: Full Pipeline payload; partial updates are not supported
         """
         url = self.airship.urls.get("pipelines_url") + pipeline_id
-        body = json.dumps(pipeline)
+        body = self.airship.codec.dumps(pipeline)
         response = self.airship.request(
             method="PUT", body=body, url=url, content_type="application/json", version=3
         )
@@ -1,14 +1,23 @@
+import gzip
 import logging
 import re
+import threading
 import time
 import uuid
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode
 
-import backoff
 import jwt
 import requests
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
 from requests.exceptions import ConnectionError, Timeout
 
+from urbanairship.codec import JsonCodec, default_codec
+from urbanairship.hooks import RequestHook, RequestInfo, body_size
+from urbanairship.ratelimit import RateLimiter
+from urbanairship.retry import RetryPolicy
+from urbanairship.token_store import TokenStore, token_cache_key
 from urbanairship.urls import Urls
 
 from . import __about__, common
@@ -20,10 +29,63 @@ VALID_LOCATIONS = ["eu", "us", None]
 DEFAULT_REQ_TIMEOUT_S = 60
 DEFAULT_API_VERSION = 3
 DEFAULT_ASSERTION_EXPIRY = 61
+DEFAULT_REFRESH_SKEW_S = 60
+DEFAULT_TOKEN_TIMEOUT_S = 60
+DEFAULT_TOKEN_MAX_TRIES = 5
+DEFAULT_COMPRESS_LEVEL = 6
+TOKEN_ENDPOINT = "oauth_token"
+TOKEN_HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Accept": "application/json",
+}
+REDACTED_HEADERS = frozenset({"authorization", "proxy-authorization", "cookie", "set-cookie"})
 US_OAUTH_URL = "https://oauth2.asnapius.com"
 EU_OAUTH_URL = "https://oauth2.asnapieu.com"
 
 
+def _oauth_assertion(
+    key: str,
+    client_id: str,
+    private_key: str,
+    token_url: str,
+    scope: Optional[List[str]] = None,
+    ip_addr: Optional[List[str]] = None,
+) -> str:
+    """Build and sign the ES384 JWT assertion exchanged for an OAuth access token."""
+    assertion_expires_at = int(time.time()) + DEFAULT_ASSERTION_EXPIRY
+    headers = {
+        "alg": "ES384",
+        "kid": client_id,
+    }
+    claims: Dict[str, Any] = {
+        "aud": token_url,
+        "exp": assertion_expires_at,
+        "iat": int(time.time()),
+        "iss": client_id,
+        "nonce": str(uuid.uuid4()),
+        "sub": f"app:{key}",
+    }
+    if scope:
+        claims["scope"] = scope
+    if ip_addr:
+        claims["ipaddr"] = ip_addr
+
+    return jwt.encode(
+        payload=claims,
+        key=private_key,
+        algorithm="ES384",
+        headers=headers,
+    )
+
+
+def _oauth_token_form(assertion: str) -> Dict[str, str]:
+    return {"grant_type": "client_credentials", "assertion": assertion}
+
+
+def _oauth_token_url(location: Optional[str]) -> str:
+    return f"{US_OAUTH_URL if location == 'us' else EU_OAUTH_URL}/token"
+
+
 class BaseClient:
     """Base client class for interacting with the Airship API
 
@@ -37,8 +99,56 @@ class BaseClient:
     :param retries: [optional] An integer specifying the number of times to retry a
         failed request. Retried requests use exponential backoff between requests.
         Defaults to 0, no retry.
+    :param retry_policy: [optional] A :py:class:`urbanairship.retry.RetryPolicy`
+        controlling retry count, delays, jitter and an overall deadline. Takes
+        precedence over ``retries`` when both are given.
+    :param pool_connections: [optional] The number of per-host connection pools to
+        cache. Defaults to 10.
+    :param pool_maxsize: [optional] The maximum number of connections kept open per
+        host. Raise this to at least the number of threads sharing the client to avoid
+        "Connection pool is full" warnings and repeated TLS handshakes. Defaults to 10.
+    :param pool_block: [optional] When True, a request made while all connections to
+        a host are in use waits for a free connection instead of opening an extra,
+        discarded one. Defaults to False.
+    :param keep_alive: [optional] When False, connections are closed after each
+        request instead of being returned to the pool. Defaults to True.
+    :param rate_limiter: [optional] A :py:class:`urbanairship.ratelimit.RateLimiter`
+        shared by every request this client makes. Requests wait for a token before
+        they are sent, and a ``Retry-After`` on a 429 or 503 response pauses the
+        limiter. The same limiter may be passed to several clients.
+    :param log_redact: [optional] When True, credentials such as the ``Authorization``
+        header are replaced with ``[REDACTED]`` in debug logs. Defaults to True.
+    :param log_body_limit: [optional] The maximum number of characters of a request
+        or response body to include in debug logs. Defaults to None, no limit.
+    :param hooks: [optional] A list of :py:class:`urbanairship.hooks.RequestHook`
+        objects, such as a :py:class:`urbanairship.metrics.MetricsCollector`, called
+        before and after each attempt of every request.
+    :param codec: [optional] The :py:class:`urbanairship.codec.JsonCodec` used to
+        encode request payloads and decode response bodies. Defaults to
+        :py:class:`urbanairship.codec.OrjsonCodec` when orjson is installed, and the
+        standard library ``json`` module otherwise.
+    :param compress_threshold: [optional] JSON request bodies of at least this many
+        bytes are sent gzip compressed with ``Content-Encoding: gzip``. Defaults to
+        None, no compression.
+    :param compress_level: [optional] The gzip compression level, from 1 (fastest) to
+        9 (smallest). Defaults to 6.
+
+    Request and response details are logged to the ``urbanairship`` logger at
+    DEBUG level. Nothing is formatted unless that level is enabled.
+
+    Clients are thread-safe: per-request headers are passed with each request rather
+    than set on the shared session, so a single client and its connection pool can
+    be shared by every thread in a pool.
     """
 
+    rate_limiter: Optional[RateLimiter] = None
+    log_redact: bool = True
+    log_body_limit: Optional[int] = None
+    hooks: Sequence[RequestHook] = ()
+    codec: JsonCodec = default_codec()
+    compress_threshold: Optional[int] = None
+    compress_level: int = DEFAULT_COMPRESS_LEVEL
+
     def __init__(
         self,
         key: str,
@@ -46,14 +156,41 @@ class BaseClient:
         timeout: int = DEFAULT_REQ_TIMEOUT_S,
         retries: int = 0,
         base_url: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        keep_alive: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        log_redact: bool = True,
+        log_body_limit: Optional[int] = None,
+        hooks: Optional[Iterable[RequestHook]] = None,
+        codec: Optional[JsonCodec] = None,
+        compress_threshold: Optional[int] = None,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
     ) -> None:
         self.key = key
         self.location = location
         self.timeout = timeout
-        self.retries = retries
+        self.retry_policy = retry_policy or RetryPolicy()
+        if retry_policy is None:
+            self.retries = retries
         self.base_url = base_url
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.rate_limiter = rate_limiter
+        self.log_redact = log_redact
+        self.log_body_limit = log_body_limit
+        self.hooks = list(hooks or ())
+        if codec is not None:
+            self.codec = codec
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
         self.urls: Urls = Urls(location=self.location, base_url=self.base_url)
-        self.session = requests.Session()
+        self.session = self._new_session()
+        self._header_cache: Dict[Tuple, Dict[str, str]] = {}
 
     @property
     def key(self) -> str:
@@ -78,11 +215,11 @@ class BaseClient:
 
     @property
     def retries(self) -> int:
-        return self._retries
+        return self.retry_policy.max_tries - 1
 
     @retries.setter
     def retries(self, value: int):
-        self._retries = value
+        self.retry_policy = self.retry_policy.replace(max_tries=value + 1)
 
     @property
     def timeout(self) -> Optional[int]:
@@ -94,6 +231,20 @@ class BaseClient:
             raise ValueError("Timeout must be an integer")
         self._timeout = value
 
+    def _new_session(self) -> requests.Session:
+        """Create a session whose connection pools use this client's pool settings."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
     def request(
         self,
         method: str,
@@ -106,6 +257,26 @@ class BaseClient:
     ) -> requests.Response:
         return self._request(method, body, url, content_type, version, params, encoding)
 
+    def _request_headers(
+        self,
+        content_type: Optional[str] = None,
+        version: Optional[int] = DEFAULT_API_VERSION,
+        encoding: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """Headers for a request. The returned dict is shared and must not be modified."""
+        cache_key = (self.key, content_type, version, encoding)
+        headers = self._header_cache.get(cache_key)
+        if headers is None:
+            headers = {"User-agent": "UAPythonLib/{0} {1}".format(__about__.__version__, self.key)}
+            if content_type:
+                headers["Content-type"] = content_type
+            if version:
+                headers["Accept"] = "application/vnd.urbanairship+json; " f"version={version};"
+            if encoding:
+                headers["Content-Encoding"] = encoding
+            self._header_cache[cache_key] = headers
+        return headers
+
     def _request(
         self,
         method: str,
@@ -116,64 +287,170 @@ class BaseClient:
         params: Optional[Dict[str, Any]] = None,
         encoding: Optional[str] = None,
     ) -> requests.Response:
-        headers: Dict[str, str] = {
-            "User-agent": "UAPythonLib/{0} {1}".format(__about__.__version__, self.key)
-        }
-        if content_type:
-            headers["Content-type"] = content_type
-        if version:
-            headers["Accept"] = "application/vnd.urbanairship+json; " f"version={version};"
-        if encoding:
-            headers["Content-Encoding"] = encoding
-        self.session.headers.update(headers)
-
-        @backoff.on_exception(
-            backoff.expo,
-            (common.AirshipFailure, common.ConnectionFailure),
-            max_tries=(self.retries + 1),
+        body, encoding = self._compress_body(body, content_type, encoding)
+        headers = self._request_headers(content_type, version, encoding)
+        if not self.hooks:
+            return self.retry_policy.call(self._make_request, method, url, body, params, headers)
+        info = self._request_info(method, url, body)
+        return self.retry_policy.call(
+            self._make_request,
+            method,
+            url,
+            body,
+            params,
+            headers,
+            info,
+            on_retry=partial(self._hook_retry, info),
         )
-        def make_retryable_request(
-            method: str,
-            url: str,
-            body: Any,
-            params: Optional[Dict[str, Any]],
-            headers: Dict[str, Any],
-        ) -> requests.Response:
-            self.session.headers.update(headers)
-            logger.debug(
-                "Making %s request to %s. Headers:\n\t%s\nBody:\n\t%s",
-                method,
-                url,
-                "\n\t".join("%s: %s" % (key, value) for (key, value) in headers.items()),
-                body,
-            )
+
+    def _compress_body(
+        self, body: Any, content_type: Optional[str], encoding: Optional[str]
+    ) -> Tuple[Any, Optional[str]]:
+        """Gzip a JSON body of at least ``compress_threshold`` bytes.
+
+        Compression happens once per request, so retries resend the same bytes.
+        Returns the body and content encoding to send.
+        """
+        threshold = self.compress_threshold
+        if (
+            threshold is None
+            or encoding is not None
+            or not isinstance(body, (str, bytes))
+            or (content_type is not None and "json" not in content_type)
+        ):
+            return body, encoding
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        if len(body) < threshold:
+            return body, encoding
+        compressed = gzip.compress(body, compresslevel=self.compress_level, mtime=0)
+        if len(compressed) >= len(body):
+            return body, encoding
+        return compressed, "gzip"
+
+    def _make_request(
+        self,
+        method: str,
+        url: str,
+        body: Any,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, Any],
+        info: Optional[RequestInfo] = None,
+    ) -> requests.Response:
+        self._log_request(method, url, headers, body)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        if info is not None:
+            self._hook_before(info)
+        response: Optional[requests.Response] = None
+        try:
             try:
-                response: requests.Response = self.session.request(
+                response = self.session.request(
                     method,
                     url,
                     data=body,
                     params=params,
+                    headers=headers,
                     timeout=self.timeout,
                 )
             except requests.exceptions.ConnectionError as err:
                 raise common.ConnectionFailure(str(err))
 
-            logger.debug(
-                "Received %s response. Headers:\n\t%s\nBody:\n\t%s",
-                response.status_code,
-                "\n\t".join("%s: %s" % (key, value) for (key, value) in response.headers.items()),
-                response.content,
-            )
+            self._log_response(response)
+            self._raise_for_status(response)
+        except Exception as exc:
+            if info is not None:
+                self._hook_error(info, response, exc)
+            raise
+
+        if info is not None:
+            self._hook_after(info, response)
+        return response
+
+    def _log_request(self, method: str, url: str, headers: Dict[str, Any], body: Any) -> None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        if isinstance(body, bytes) and headers.get("Content-Encoding") == "gzip":
+            body = "[gzip, %d bytes]" % len(body)
+        logger.debug(
+            "Making %s request to %s. Headers:\n\t%s\nBody:\n\t%s",
+            method,
+            url,
+            self._format_headers(headers),
+            self._format_body(body),
+        )
+
+    def _log_response(self, response: Any) -> None:
+        # Checked first so the headers and body are only touched when debugging
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug(
+            "Received %s response. Headers:\n\t%s\nBody:\n\t%s",
+            response.status_code,
+            self._format_headers(response.headers),
+            self._format_body(response.content),
+        )
+
+    def _format_headers(self, headers: Any) -> str:
+        return "\n\t".join(
+            "%s: %s"
+            % (key, "[REDACTED]" if self.log_redact and key.lower() in REDACTED_HEADERS else value)
+            for (key, value) in headers.items()
+        )
 
-            if response.status_code == 401:
-                raise common.Unauthorized
-            elif not (200 <= response.status_code < 300):
-                raise common.AirshipFailure.from_response(response)
+    def _format_body(self, body: Any) -> Any:
+        limit = self.log_body_limit
+        if limit is None or not isinstance(body, (str, bytes)) or len(body) <= limit:
+            return body
+        return "%r... [%d more]" % (body[:limit], len(body) - limit)
 
-            result: requests.Response = response
-            return result
+    def _request_info(self, method: str, url: str, body: Any) -> RequestInfo:
+        return RequestInfo(method, url, self.urls.endpoint_for(url), body_size(body))
 
-        return make_retryable_request(method, url, body, params, headers)
+    def _call_hooks(self, name: str, *args: Any) -> None:
+        for hook in self.hooks:
+            try:
+                getattr(hook, name)(*args)
+            except Exception:
+                logger.exception("Request hook %r failed in %s", hook, name)
+
+    def _hook_before(self, info: RequestInfo) -> None:
+        info.attempt += 1
+        info.elapsed = info.status_code = info.response_bytes = None
+        info.started = time.monotonic()
+        self._call_hooks("before_request", info)
+
+    def _finish_attempt(self, info: RequestInfo, response: Any) -> None:
+        info.elapsed = time.monotonic() - info.started
+        if response is not None:
+            info.status_code = response.status_code
+            info.response_bytes = len(response.content)
+
+    def _hook_after(self, info: RequestInfo, response: Any) -> None:
+        self._finish_attempt(info, response)
+        self._call_hooks("after_response", info, response)
+
+    def _hook_error(self, info: RequestInfo, response: Any, exc: Exception) -> None:
+        self._finish_attempt(info, response)
+        self._call_hooks("on_error", info, exc)
+
+    def _hook_retry(self, info: RequestInfo, attempt: int, exc: Exception, delay: float) -> None:
+        self._call_hooks("on_retry", info, exc, delay)
+
+    def _raise_for_status(self, response: Any) -> None:
+        """Raise the appropriate exception for an error response.
+
+        A ``Retry-After`` on a rate limited or unavailable response also pauses the
+        client's rate limiter, so other requests sharing it back off too.
+        """
+        if response.status_code == 401:
+            raise common.Unauthorized
+        elif not (200 <= response.status_code < 300):
+            failure = common.AirshipFailure.from_response(response, self.codec)
+            retry_after = self.retry_policy.retry_after(failure)
+            if self.rate_limiter is not None and retry_after is not None:
+                self.rate_limiter.pause(retry_after)
+            raise failure
 
 
 class BasicAuthClient(BaseClient):
@@ -191,6 +468,8 @@ class BasicAuthClient(BaseClient):
     :param retries: [optional] An integer specifying the number of times to retry a
         failed request. Retried requests use exponential backoff between requests.
         Defaults to 0, no retry.
+    :param kwargs: [optional] Additional :py:class:`BaseClient` options, such as
+        connection pool settings.
     """
 
     def __init__(
@@ -200,8 +479,9 @@ class BasicAuthClient(BaseClient):
         location: str = "us",
         timeout: int = DEFAULT_REQ_TIMEOUT_S,
         retries: int = 0,
+        **kwargs: Any,
     ) -> None:
-        super().__init__(key=key, location=location, timeout=timeout, retries=retries)
+        super().__init__(key=key, location=location, timeout=timeout, retries=retries, **kwargs)
         self.secret = secret
         self.session.auth = (self.key, self.secret)
 
@@ -229,6 +509,8 @@ class BearerTokenClient(BaseClient):
     :param retries: [optional] An integer specifying the number of times to retry a
         failed request. Retried requests use exponential backoff between requests.
         Defaults to 0, no retry.
+    :param kwargs: [optional] Additional :py:class:`BaseClient` options, such as
+        connection pool settings.
     """
 
     def __init__(
@@ -238,8 +520,9 @@ class BearerTokenClient(BaseClient):
         location: str = "us",
         timeout: int = DEFAULT_REQ_TIMEOUT_S,
         retries: int = 0,
+        **kwargs: Any,
     ) -> None:
-        super().__init__(key=key, location=location, timeout=timeout, retries=retries)
+        super().__init__(key=key, location=location, timeout=timeout, retries=retries, **kwargs)
         self.token = token
 
         self.session.headers.update({"X-UA-Appkey": key, "Authorization": f"Bearer {self.token}"})
@@ -275,6 +558,30 @@ class OAuthClient(BaseClient):
     :param retries: [optional] An integer specifying the number of times to retry a
         failed request. Retried requests use exponential backoff between requests.
         Defaults to 0, no retry.
+    :param refresh_skew: [optional] Number of seconds before the access token expires
+        at which it is refreshed, so requests never go out with a token that is about
+        to expire. Defaults to 60.
+    :param background_refresh: [optional] When True, a daemon thread refreshes the
+        token ahead of expiry so requests never wait for a refresh. Call
+        :py:meth:`close` to stop it. Defaults to False.
+    :param token_store: [optional] A :py:class:`urbanairship.token_store.TokenStore`
+        in which access tokens are shared with other clients using the same app key,
+        client id and scope. A client reuses a valid stored token instead of fetching
+        its own; use a :py:class:`urbanairship.token_store.FileTokenStore` to share
+        tokens between processes on a host. Defaults to None, no sharing.
+    :param token_timeout: [optional] Number of seconds to wait for the token endpoint
+        to respond. Defaults to 60.
+    :param token_retry_policy: [optional] A :py:class:`urbanairship.retry.RetryPolicy`
+        for token requests. Defaults to up to 5 attempts with exponential backoff.
+    :param kwargs: [optional] Additional :py:class:`BaseClient` options, such as
+        connection pool settings. Pool settings also apply to the token endpoint.
+
+    Token requests go through their own pooled session and are reported to the
+    client's ``hooks`` under the 'oauth_token' endpoint.
+
+    Token refreshes are single-flight: when the token needs refreshing, one thread
+    fetches a new token while other threads wait for it rather than each fetching
+    their own.
     """
 
     def __init__(
@@ -287,78 +594,163 @@ class OAuthClient(BaseClient):
         ip_addr: Optional[List[str]] = None,
         timeout: int = DEFAULT_REQ_TIMEOUT_S,
         retries: int = 0,
+        refresh_skew: int = DEFAULT_REFRESH_SKEW_S,
+        background_refresh: bool = False,
+        token_store: Optional[TokenStore] = None,
+        token_timeout: int = DEFAULT_TOKEN_TIMEOUT_S,
+        token_retry_policy: Optional[RetryPolicy] = None,
+        **kwargs: Any,
     ) -> None:
-        super().__init__(key, location, timeout, retries)
+        super().__init__(key, location, timeout, retries, **kwargs)
         self.key = key
         self.client_id = client_id
         self.scope = scope
         self.ip_addr = ip_addr
         self.private_key = private_key
-        self.token_url: str = f"{US_OAUTH_URL if self.location == 'us' else EU_OAUTH_URL}/token"
+        self.token_url: str = _oauth_token_url(self.location)
         self.token: Optional[str] = None
         self.urls = Urls(location=self.location, oauth_base=True)
         self.access_token_expires_at: int = 0
-
-    def _update_session_oauth_token(self) -> None:
-        @backoff.on_exception(
-            backoff.expo,
-            (Timeout, ConnectionError),
-            max_tries=5,
+        self.refresh_skew = refresh_skew
+        self.background_refresh = background_refresh
+        self.token_store = token_store
+        self.token_timeout = token_timeout
+        self.token_retry_policy = token_retry_policy or RetryPolicy(
+            max_tries=DEFAULT_TOKEN_MAX_TRIES
         )
-        def _get_or_refresh_token() -> None:
-            assertion_expires_at = int(time.time()) + DEFAULT_ASSERTION_EXPIRY
-            headers = {
-                "alg": "ES384",
-                "kid": self.client_id,
-            }
-            claims = {
-                "aud": self.token_url,
-                "exp": assertion_expires_at,
-                "iat": int(time.time()),
-                "iss": self.client_id,
-                "nonce": str(uuid.uuid4()),
-                "sub": f"app:{self.key}",
-            }
-            if self.scope:
-                claims["scope"] = self.scope
-            if self.ip_addr:
-                claims["ipaddr"] = self.ip_addr
-
-            encoded_jwt = jwt.encode(
-                payload=claims,
-                key=self.private_key,
-                algorithm="ES384",
-                headers=headers,
-            )
-
-            resp = requests.post(
-                self.token_url,
-                data={
-                    "grant_type": "client_credentials",
-                    "assertion": encoded_jwt,
-                },
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded",
-                    "Accept": "application/json",
-                },
-                timeout=60,
-            )
-            resp_data = resp.json()
-            self.token = resp_data.get("access_token")
-            self.access_token_expires_at = int(time.time()) + int(resp_data.get("expires_in"))
-            self.session.headers.update(
-                {"X-UA-Appkey": self.key, "Authorization": f"Bearer {self.token}"}
-            )
+        self.token_session = self._new_session()
+        self._token_lock = threading.Lock()
+        self._refresh_timer: Optional[threading.Timer] = None
+        self._closed = False
+
+    def close(self) -> None:
+        """Stop background token refresh and close the underlying connection pools."""
+        with self._token_lock:
+            self._closed = True
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+        self.token_session.close()
+        self.session.close()
+
+    def _token_is_fresh(self) -> bool:
+        return bool(self.token) and time.time() < self.access_token_expires_at - self.refresh_skew
 
-        if not self.token:
-            logger.debug("No OAuth2 access token found. Getting new token.")
-            _get_or_refresh_token()
+    def _update_session_oauth_token(self) -> None:
+        if self._token_is_fresh():
             return
 
-        if self.access_token_expires_at < int(time.time()):
-            logger.debug("OAuth access token expired. Refreshing token.")
-            _get_or_refresh_token()
-            return
+        with self._token_lock:
+            # another thread may have refreshed the token while this one waited
+            if self._token_is_fresh():
+                return
+            if not self.token:
+                logger.debug("No OAuth2 access token found. Getting new token.")
+            else:
+                logger.debug("OAuth access token expiring. Refreshing token.")
+            self._acquire_token()
+
+    def _background_refresh(self) -> None:
+        try:
+            with self._token_lock:
+                if self._closed:
+                    return
+                logger.debug("Refreshing OAuth access token in the background.")
+                self._acquire_token()
+        except Exception:
+            # requests will refresh the token themselves once it goes stale
+            logger.exception("Background OAuth token refresh failed")
+
+    def _schedule_refresh(self) -> None:
+        """Start a timer to refresh the token ``refresh_skew`` seconds before expiry.
+
+        Called with the token lock held.
+        """
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        delay = max(self.access_token_expires_at - self.refresh_skew - time.time(), 1)
+        self._refresh_timer = threading.Timer(delay, self._background_refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _acquire_token(self) -> None:
+        """Take a fresh token from the token store, or fetch and store a new one.
+
+        Called with the token lock held.
+        """
+        if self.token_store is None:
+            self._refresh_token()
+        else:
+            cache_key = token_cache_key(self.key, self.client_id, self.scope)
+            with self.token_store.lock(cache_key):
+                stored = self.token_store.get(cache_key)
+                if stored is not None and stored[1] - self.refresh_skew > time.time():
+                    logger.debug("Using OAuth access token from token store.")
+                    self.token, self.access_token_expires_at = stored
+                else:
+                    self._refresh_token()
+                    if self.token:
+                        self.token_store.set(cache_key, (self.token, self.access_token_expires_at))
+
+        if self.background_refresh and not self._closed:
+            self._schedule_refresh()
+
+    def _refresh_token(self) -> None:
+        """Fetch a new access token. Called with the token lock held."""
+        info = RequestInfo("POST", self.token_url, TOKEN_ENDPOINT) if self.hooks else None
+        response = self.token_retry_policy.call(
+            self._post_token,
+            info,
+            on_retry=partial(self._hook_retry, info) if info is not None else None,
+        )
+        resp_data = self.codec.loads(response.content)
+        self.token = resp_data.get("access_token")
+        self.access_token_expires_at = int(time.time()) + int(resp_data.get("expires_in"))
+
+    def _post_token(self, info: Optional[RequestInfo] = None) -> requests.Response:
+        # a fresh assertion per attempt, as each carries a single-use nonce
+        form = _oauth_token_form(
+            _oauth_assertion(
+                key=self.key,
+                client_id=self.client_id,
+                private_key=self.private_key,
+                token_url=self.token_url,
+                scope=self.scope,
+                ip_addr=self.ip_addr,
+            )
+        )
+        if info is not None:
+            info.request_bytes = len(urlencode(form))
+            self._hook_before(info)
+        response: Optional[requests.Response] = None
+        try:
+            try:
+                response = self.token_session.post(
+                    self.token_url, data=form, headers=TOKEN_HEADERS, timeout=self.token_timeout
+                )
+            except (Timeout, ConnectionError) as err:
+                raise common.ConnectionFailure(str(err))
+            if not (200 <= response.status_code < 300):
+                raise common.AirshipFailure.from_response(response, self.codec)
+        except Exception as exc:
+            if info is not None:
+                self._hook_error(info, response, exc)
+            raise
+
+        if info is not None:
+            self._hook_after(info, response)
+        return response
+
+    def _request_headers(
+        self,
+        content_type: Optional[str] = None,
+        version: Optional[int] = DEFAULT_API_VERSION,
+        encoding: Optional[str] = None,
+    ) -> Dict[str, str]:
+        headers = dict(super()._request_headers(content_type, version, encoding))
+        headers["X-UA-Appkey"] = self.key
+        headers["Authorization"] = f"Bearer {self.token}"
+        return headers
 
     def _request(
         self,
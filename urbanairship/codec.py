@@ -0,0 +1,74 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+class JsonCodec:
+    """Base class for the JSON codec a client uses for request and response bodies.
+
+    Every payload the library sends is encoded with the client's codec, and every
+    response body it reads is decoded with it. Subclasses implement :py:meth:`dumps`
+    and :py:meth:`loads`.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode ``obj`` as UTF-8 JSON. Raises TypeError for unsupported types."""
+        raise NotImplementedError
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decode a JSON document. Raises ValueError if ``data`` isn't valid JSON."""
+        raise NotImplementedError
+
+
+class StdlibJsonCodec(JsonCodec):
+    """JSON codec built on the standard library :py:mod:`json` module."""
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec built on `orjson`_, several times faster than the standard library.
+
+    Values orjson can't encode the same way, such as integers beyond 64 bits or
+    dictionaries with non-string keys, are encoded with the standard library
+    instead, so both codecs accept the same payloads. Requires the ``orjson``
+    extra::
+
+        $ pip install urbanairship[orjson]
+
+    .. _orjson: https://github.com/ijl/orjson
+    """
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires the orjson package")
+        # datetimes and dataclasses are passed to the stdlib, which rejects them, so
+        # a payload that encodes with one codec encodes the same with the other
+        self._options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        self._fallback = StdlibJsonCodec()
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=self._options)
+        except TypeError:
+            return self._fallback.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+
+def default_codec() -> JsonCodec:
+    """The fastest available codec: :py:class:`OrjsonCodec` when orjson is
+    installed, otherwise :py:class:`StdlibJsonCodec`.
+    """
+    if orjson is not None:
+        return OrjsonCodec()
+    return StdlibJsonCodec()
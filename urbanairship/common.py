@@ -1,4 +1,5 @@
 import datetime
+import email.utils
 import logging
 from typing import Any, Dict, Optional, Union
 
@@ -7,6 +8,28 @@ import six
 logger = logging.getLogger("urbanairship")
 
 
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Parse a ``Retry-After`` header value into a number of seconds.
+
+    :param value: The header value, either a number of seconds or an HTTP date.
+    :returns: The number of seconds to wait, or None if the value can't be parsed.
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    delta = retry_at - datetime.datetime.now(datetime.timezone.utc)
+    return max(delta.total_seconds(), 0.0)
+
+
 class Unauthorized(Exception):
     """Raised when we get a 401 from the server"""
 
@@ -43,18 +66,20 @@ class AirshipFailure(Exception):
         super(AirshipFailure, self).__init__(*args)
 
     @classmethod
-    def from_response(cls, response):
+    def from_response(cls, response, codec=None):
         """
         Instantiate a ValidationFailure from a Response object
         :param response: response object used to create failure obj
+        :param codec: [optional] The JSON codec used to decode the response body
         """
         try:
-            payload = response.json()
+            payload = codec.loads(response.content) if codec else response.json()
             error = payload.get("error")
             error_code = payload.get("error_code")
             details = payload.get("details")
         except (ValueError, TypeError, KeyError):
-            error = response.reason
+            # httpx responses name this reason_phrase
+            error = getattr(response, "reason", None) or getattr(response, "reason_phrase", None)
             error_code = response.status_code
             details = response.content
 
@@ -68,6 +93,20 @@ class AirshipFailure(Exception):
 
         return cls(error, error_code, details, response, response.status_code, response.content)
 
+    @property
+    def status_code(self) -> Optional[int]:
+        """The HTTP status of the failed response, if known."""
+        status = getattr(self.response, "status_code", None)
+        return status if isinstance(status, int) else None
+
+    @property
+    def retry_after(self) -> Optional[float]:
+        """Seconds the server asked us to wait, from the ``Retry-After`` header."""
+        headers = getattr(self.response, "headers", None)
+        if headers is None:
+            return None
+        return parse_retry_after(headers.get("Retry-After"))
+
 
 class IteratorDataObj(object):
     airship = None
@@ -139,7 +178,7 @@ class IteratorParent(six.Iterator):
             method="GET", body=None, url=self.next_url, version=3, params=self.params
         )
         self.params = None
-        self._page = response.json()
+        self._page = self.airship.codec.loads(response.content)
         check_url = self._page.get("next_page")
         if check_url == self.next_url:
             return False
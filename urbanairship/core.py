@@ -3,10 +3,10 @@ import re
 import warnings
 from typing import Any, Dict, Optional
 
-import backoff
 import requests
 
-from . import __about__, client, common
+from . import __about__, client
+from .retry import RetryPolicy
 from .urls import Urls
 
 logger = logging.getLogger("urbanairship")
@@ -80,6 +80,7 @@ class Airship(client.BaseClient):
     @retries.setter
     def retries(self, value: int):
         self._retries = value
+        self.retry_policy = RetryPolicy(max_tries=value + 1)
 
     @property
     def timeout(self) -> Optional[int]:
@@ -161,51 +162,4 @@ class Airship(client.BaseClient):
         if encoding:
             headers["Content-Encoding"] = encoding
 
-        @backoff.on_exception(
-            backoff.expo,
-            (common.AirshipFailure, common.ConnectionFailure),
-            max_tries=(self.retries + 1),
-        )
-        def make_retryable_request(
-            method: str,
-            url: str,
-            body: Any,
-            params: Optional[Dict[str, Any]],
-            headers: Dict[str, Any],
-        ) -> requests.Response:
-            try:
-                response: requests.Response = self.session.request(
-                    method,
-                    url,
-                    data=body,
-                    params=params,
-                    headers=headers,
-                    timeout=self.timeout,
-                )
-            except requests.exceptions.ConnectionError as err:
-                raise common.ConnectionFailure(str(err))
-
-            logger.debug(
-                "Making %s request to %s. Headers:\n\t%s\nBody:\n\t%s",
-                method,
-                url,
-                "\n\t".join("%s: %s" % (key, value) for (key, value) in headers.items()),
-                body,
-            )
-
-            logger.debug(
-                "Received %s response. Headers:\n\t%s\nBody:\n\t%s",
-                response.status_code,
-                "\n\t".join("%s: %s" % (key, value) for (key, value) in response.headers.items()),
-                response.content,
-            )
-
-            if response.status_code == 401:
-                raise common.Unauthorized
-            elif not (200 <= response.status_code < 300):
-                raise common.AirshipFailure.from_response(response)
-
-            result: requests.Response = response
-            return result
-
-        return make_retryable_request(method, url, body, params, headers)
+        return self.retry_policy.call(self._make_request, method, url, body, params, headers)
@@ -1,7 +1,7 @@
 import datetime
-import json
 from typing import Any, Dict, Optional, Union, cast
 
+from urbanairship.async_client import AsyncBaseClient
 from urbanairship.client import BaseClient
 
 
@@ -167,10 +167,22 @@ class CustomEvent:
         """
         response = self.airship.request(
             method="POST",
-            body=json.dumps(self._payload),
+            body=self.airship.codec.dumps(self._payload),
             url=self.airship.urls.get("custom_events_url"),
             content_type="application/json",
             version=3,
         )
 
-        return cast(Dict[Any, Any], response.json())
+        return cast(Dict[Any, Any], self.airship.codec.loads(response.content))
+
+    async def send_async(self) -> Dict:
+        """Async variant of :py:meth:`send`, for use with an async client."""
+        response = await cast(AsyncBaseClient, self.airship).request(
+            method="POST",
+            body=self.airship.codec.dumps(self._payload),
+            url=self.airship.urls.get("custom_events_url"),
+            content_type="application/json",
+            version=3,
+        )
+
+        return cast(Dict[Any, Any], self.airship.codec.loads(response.content))
@@ -1,14 +1,19 @@
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
 
 from requests import Response
 
+from urbanairship.async_client import AsyncBaseClient
 from urbanairship.client import BaseClient
+from urbanairship.codec import JsonCodec
 
 from .static_lists import GzipCompressReadStream
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger("urbanairship")
 
 
@@ -84,7 +89,18 @@ class Attribute(object):
 
 
 class AttributeResponse(object):
-    def __init__(self, response: Response):
+    """Response to a :py:class:`ModifyAttributes` request.
+
+    Only the response body is kept, and it is decoded once, when ``response``,
+    ``ok`` or ``warning`` is first read.
+    """
+
+    __slots__ = ("_content", "_codec", "_data")
+
+    def __init__(
+        self, response: Union[Response, "httpx.Response"], codec: Optional[JsonCodec] = None
+    ):
+        self._codec = codec
         self.response = response
 
     def __str__(self) -> str:
@@ -92,11 +108,18 @@ class AttributeResponse(object):
 
     @property
     def response(self):
-        return self._response.json()
+        if self._data is None:
+            if self._codec is None:
+                self._data = json.loads(self._content)
+            else:
+                self._data = self._codec.loads(self._content)
+            self._content = b""
+        return self._data
 
     @response.setter
     def response(self, value):
-        self._response = value
+        self._content = value.content
+        self._data = None
 
     @property
     def ok(self):
@@ -178,12 +201,23 @@ class ModifyAttributes(object):
         """
         response = self.airship.request(
             method="POST",
-            body=json.dumps(self.payload).encode("UTF-8"),
+            body=self.airship.codec.dumps(self.payload),
+            url=self.airship.urls.get("attributes_url"),
+            version=3,
+        )
+
+        return AttributeResponse(response=response, codec=self.airship.codec)
+
+    async def send_async(self) -> AttributeResponse:
+        """Async variant of :py:meth:`send`, for use with an async client."""
+        response = await cast(AsyncBaseClient, self.airship).request(
+            method="POST",
+            body=self.airship.codec.dumps(self.payload),
             url=self.airship.urls.get("attributes_url"),
             version=3,
         )
 
-        return AttributeResponse(response=response)
+        return AttributeResponse(response=response, codec=self.airship.codec)
 
 
 class AttributeList(object):
@@ -224,7 +258,7 @@ class AttributeList(object):
         response = self.airship.request(
             method="POST",
             url=self.airship.urls.get("attributes_list_url"),
-            body=json.dumps(self._create_payload),
+            body=self.airship.codec.dumps(self._create_payload),
             content_type="application/json",
             version=3,
         )
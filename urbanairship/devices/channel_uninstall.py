@@ -1,4 +1,3 @@
-import json
 import logging
 from typing import List
 
@@ -34,7 +33,7 @@ class ChannelUninstall(object):
                 )
             )
 
-        body = json.dumps(channels)
+        body = self._airship.codec.dumps(channels)
         url = self._airship.urls.get("channel_url") + "uninstall/"
 
         response = self._airship._request("POST", body, url, version=3)
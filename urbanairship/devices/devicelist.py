@@ -118,7 +118,7 @@ class ChannelInfo(object):
         response = self.airship._request(
             method="GET", body=None, url=url, version=3, params=params
         )
-        payload = response.json()
+        payload = self.airship.codec.loads(response.content)
         return self.from_payload(payload[data_attribute], id_key, self.airship)
 
 
@@ -1,13 +1,16 @@
 import base64
-import json
 import logging
 import re
-from typing import Any, Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
 from requests import Response
 
+from urbanairship.async_client import AsyncBaseClient
 from urbanairship.client import BaseClient
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger("urbanairship")
 
 VALID_EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
@@ -227,16 +230,16 @@ class Email(object):
 
         response = self.airship.request(
             method="POST",
-            body=json.dumps(self._registration_payload).encode("utf-8"),
+            body=self.airship.codec.dumps(self._registration_payload),
             url=url,
             version=3,
         )
 
         if response.status_code == 201:
-            self.channel_id = response.json().get("channel_id")
+            self.channel_id = self.airship.codec.loads(response.content).get("channel_id")
             logger.info("Successfully created channel with channel_id %s" % (self.channel_id))
         elif response.status_code == 200:
-            self.channel_id = response.json().get("channel_id")
+            self.channel_id = self.airship.codec.loads(response.content).get("channel_id")
             logger.info("Successful registration call made to channel_id %s" % (self.channel_id))
 
         return response
@@ -259,7 +262,7 @@ class Email(object):
 
         response = self.airship.request(
             method="PUT",
-            body=json.dumps(self._update_payload),
+            body=self.airship.codec.dumps(self._update_payload),
             url=self.airship.urls.get("email_url") + self.channel_id,
             version=3,
         )
@@ -279,7 +282,7 @@ class Email(object):
         url = self.airship.urls.get("email_uninstall_url")
         uninstall_payload = {"email_address": self.address}
 
-        body = json.dumps(uninstall_payload).encode("utf-8")
+        body = self.airship.codec.dumps(uninstall_payload)
 
         response = self.airship.request(method="POST", body=body, url=url, version=3)
 
@@ -365,6 +368,23 @@ class EmailTags(object):
 
         :return: the response object from the api
         """
+        body = self.airship.codec.dumps(self._build_payload())
+
+        response = self.airship.request(method="POST", body=body, url=self.url, version=3)
+
+        return response
+
+    async def send_async(self) -> "httpx.Response":
+        """Async variant of :py:meth:`send`, for use with an async client."""
+        body = self.airship.codec.dumps(self._build_payload())
+
+        response = await cast(AsyncBaseClient, self.airship).request(
+            method="POST", body=body, url=self.url, version=3
+        )
+
+        return response
+
+    def _build_payload(self) -> Dict[str, Any]:
         if not self.add_group and not self.remove_group and not self.set_group:
             raise ValueError("at least one add, remove or set group must exist")
         self._payload["audience"] = {"email_address": self.address}
@@ -380,11 +400,7 @@ class EmailTags(object):
         if self.remove_group:
             self._payload["remove"] = self.remove_group
 
-        body = json.dumps(self._payload).encode("utf-8")
-
-        response = self.airship.request(method="POST", body=body, url=self.url, version=3)
-
-        return response
+        return self._payload
 
 
 class EmailAttachment(object):
@@ -454,10 +470,10 @@ class EmailAttachment(object):
     def post(self) -> Dict:
         response = self.airship.request(
             method="POST",
-            body=json.dumps(self.req_payload),
+            body=self.airship.codec.dumps(self.req_payload),
             url=self.airship.urls.get("attachment_url"),
             content_type="application/json",
             version=3,
         )
 
-        return cast(Dict[Any, Any], response.json())
+        return cast(Dict[Any, Any], self.airship.codec.loads(response.content))
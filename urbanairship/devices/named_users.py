@@ -1,13 +1,16 @@
-import json
 import logging
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
 
 from requests import Response
 
 from urbanairship import common
+from urbanairship.async_client import AsyncBaseClient
 from urbanairship.client import BaseClient
 from urbanairship.devices.tag import ChannelTags
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger("urbanairship")
 
 
@@ -50,7 +53,7 @@ class NamedUser(object):
     def _dis_associate(self, url: str, body: Dict) -> Response:
         response = self._airship.request(
             method="POST",
-            body=json.dumps(body),
+            body=self._airship.codec.dumps(body),
             url=url,
             content_type="application/json",
             version=3,
@@ -152,7 +155,7 @@ class NamedUser(object):
             version=3,
             params={"id": self.named_user_id},
         )
-        return cast(Union[Dict, str], response.json())
+        return cast(Union[Dict, str], self._airship.codec.loads(response.content))
 
     def tag(
         self,
@@ -168,6 +171,43 @@ class NamedUser(object):
         :param set: A list of tags to set
         :param group: The Tag group for the add, remove, and set operations
         """
+        body = self._airship.codec.dumps(self._tag_payload(group, add, remove, set))
+        response = self._airship._request(
+            "POST",
+            body,
+            self._airship.urls.get("named_user_tag_url"),
+            "application/json",
+            version=3,
+        )
+
+        return cast(Dict[Any, Any], self._airship.codec.loads(response.content))
+
+    async def tag_async(
+        self,
+        group: str,
+        add: Optional[List] = None,
+        remove: Optional[List] = None,
+        set: Optional[List] = None,
+    ) -> Dict:
+        """Async variant of :py:meth:`tag`, for use with an async client."""
+        body = self._airship.codec.dumps(self._tag_payload(group, add, remove, set))
+        response = await cast(AsyncBaseClient, self._airship)._request(
+            "POST",
+            body,
+            self._airship.urls.get("named_user_tag_url"),
+            "application/json",
+            version=3,
+        )
+
+        return cast(Dict[Any, Any], self._airship.codec.loads(response.content))
+
+    def _tag_payload(
+        self,
+        group: str,
+        add: Optional[List],
+        remove: Optional[List],
+        set: Optional[List],
+    ) -> Dict[str, Any]:
         if self.named_user_id:
             payload: Dict[str, Any] = {"audience": {"named_user_id": self.named_user_id}}
         else:
@@ -194,16 +234,7 @@ class NamedUser(object):
         if not add and not remove and not set:
             raise ValueError("An add, remove, or set field was not set")
 
-        body = json.dumps(payload).encode("utf-8")
-        response = self._airship._request(
-            "POST",
-            body,
-            self._airship.urls.get("named_user_tag_url"),
-            "application/json",
-            version=3,
-        )
-
-        return cast(Dict[Any, Any], response.json())
+        return payload
 
     def update(
         self,
@@ -234,6 +265,45 @@ class NamedUser(object):
 
         :return:
         """
+        response = self._airship.request(
+            method="POST",
+            body=self._airship.codec.dumps(
+                self._update_payload(associate, disassociate, tags, attributes)
+            ),
+            url=f'{self._airship.urls.get("named_user_url")}{self.named_user_id}',
+            content_type="application/json",
+            version=3,
+        )
+
+        return response
+
+    async def update_async(
+        self,
+        associate: Optional[List] = None,
+        disassociate: Optional[List] = None,
+        tags: Optional[Dict] = None,
+        attributes: Optional[List] = None,
+    ) -> "httpx.Response":
+        """Async variant of :py:meth:`update`, for use with an async client."""
+        response = await cast(AsyncBaseClient, self._airship).request(
+            method="POST",
+            body=self._airship.codec.dumps(
+                self._update_payload(associate, disassociate, tags, attributes)
+            ),
+            url=f'{self._airship.urls.get("named_user_url")}{self.named_user_id}',
+            content_type="application/json",
+            version=3,
+        )
+
+        return response
+
+    def _update_payload(
+        self,
+        associate: Optional[List],
+        disassociate: Optional[List],
+        tags: Optional[Dict],
+        attributes: Optional[List],
+    ) -> Dict[str, Any]:
         if not any([associate, disassociate, tags, attributes]):
             raise ValueError(
                 "At least one of associate, disassociate, tags, or attributes must be included"
@@ -250,15 +320,7 @@ class NamedUser(object):
         if attributes:
             body["attributes"] = attributes
 
-        response = self._airship.request(
-            method="POST",
-            body=json.dumps(body),
-            url=f'{self._airship.urls.get("named_user_url")}{self.named_user_id}',
-            content_type="application/json",
-            version=3,
-        )
-
-        return response
+        return body
 
     def attributes(self, attributes: Optional[List]) -> Response:
         """
@@ -281,7 +343,7 @@ class NamedUser(object):
 
         response = self._airship.request(
             method="POST",
-            body=json.dumps({"attributes": attributes}),
+            body=self._airship.codec.dumps({"attributes": attributes}),
             url=f'{self._airship.urls.get("named_user_url")}{self.named_user_id}{attributes}',
             content_type="application/json",
             version=3,
@@ -310,7 +372,7 @@ class NamedUser(object):
 
         response = airship.request(
             method="POST",
-            body=json.dumps({"named_user_id": named_users}),
+            body=airship.codec.dumps({"named_user_id": named_users}),
             url=airship.urls.get("named_user_uninstall_url"),
             content_type="application/json",
             version=3,
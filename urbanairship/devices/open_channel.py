@@ -1,5 +1,4 @@
 import datetime
-import json
 import logging
 import re
 from typing import Any, Dict, List, Optional
@@ -77,10 +76,10 @@ class OpenChannel(object):
         if self.identifiers:
             channel_data["open"]["identifiers"] = self.identifiers
 
-        body = json.dumps({"channel": channel_data})
+        body = self.airship.codec.dumps({"channel": channel_data})
         response = self.airship.request(method="POST", body=body, url=url, version=3)
 
-        self.channel_id = response.json().get("channel_id")
+        self.channel_id = self.airship.codec.loads(response.content).get("channel_id")
 
         logger.info(
             "Successful open channel creation: %s (%s)", self.channel_id, self.address
@@ -119,10 +118,10 @@ class OpenChannel(object):
         if self.identifiers:
             channel_data["open"]["identifiers"] = self.identifiers
 
-        body = json.dumps({"channel": channel_data})
+        body = self.airship.codec.dumps({"channel": channel_data})
         response = self.airship.request(method="POST", body=body, url=url, version=3)
 
-        self.channel_id = response.json().get("channel_id")
+        self.channel_id = self.airship.codec.loads(response.content).get("channel_id")
 
         logger.info(
             "Successful open channel update: %s (%s)", self.channel_id, self.address
@@ -156,7 +155,7 @@ class OpenChannel(object):
         """Retrieves an open channel from the provided channel ID."""
         url = self.airship.urls.get("channel_url") + channel_id
         response = self.airship._request(method="GET", body=None, url=url, version=3)
-        payload = response.json().get("channel")
+        payload = self.airship.codec.loads(response.content).get("channel")
 
         return self.from_payload(payload, self.airship)
 
@@ -171,7 +170,7 @@ class OpenChannel(object):
             "open_platform_name": self.open_platform,
         }
 
-        body = json.dumps(channel_data)
+        body = self.airship.codec.dumps(channel_data)
         response = self.airship.request(method="POST", body=body, url=url, version=3)
 
         logger.info(
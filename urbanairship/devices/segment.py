@@ -1,4 +1,3 @@
-import json
 import logging
 from typing import Dict, Optional
 
@@ -24,13 +23,11 @@ class Segment(object):
 
         url = airship.urls.get("segments_url")
 
-        body = json.dumps(
-            {"display_name": self.display_name, "criteria": self.criteria}
-        )
+        body = airship.codec.dumps({"display_name": self.display_name, "criteria": self.criteria})
         response = airship._request(method="POST", body=body, url=url, version=3)
         logger.info("Successful segment creation: {0}".format(self.display_name))
 
-        payload = response.json()
+        payload = airship.codec.loads(response.content)
         seg_id = payload.get("segment_id")
 
         self.id = seg_id
@@ -45,7 +42,7 @@ class Segment(object):
         url = airship.urls.get("segments_url") + seg_id
         response = airship._request(method="GET", body=None, url=url, version=3)
 
-        payload = response.json()
+        payload = airship.codec.loads(response.content)
         cls.id = seg_id
         cls.from_payload(payload)
 
@@ -68,7 +65,7 @@ class Segment(object):
         data["criteria"] = self.criteria
 
         url = f'{airship.urls.get("segments_url")}{self.id}'
-        body = json.dumps(data)
+        body = airship.codec.dumps(data)
         response = airship._request(method="PUT", body=body, url=url, version=3)
         logger.info("Successful segment update: '{0}'".format(self.display_name))
 
@@ -1,4 +1,3 @@
-import json
 import logging
 import re
 from datetime import datetime
@@ -280,14 +279,15 @@ class Sms(object):
             self.opted_in = opted_in
 
         url = self.airship.urls.get("sms_url")
-        body = json.dumps(self._registration_payload)
+        body = self.airship.codec.dumps(self._registration_payload)
 
         response = self.airship.request(method="POST", body=body, url=url, version=3)
 
-        if response.json().get("status") == "pending":
+        data = self.airship.codec.loads(response.content)
+        if data.get("status") == "pending":
             logger.info("Channel creation for msisdn %s pending user opt-in" % (self.msisdn))
-        elif response.json().get("channel_id") is not None:
-            self.channel_id = response.json().get("channel_id")
+        elif data.get("channel_id") is not None:
+            self.channel_id = data.get("channel_id")
             logger.info(
                 "Successfully registered Sms channel with channel_id %s" % (self.channel_id)
             )
@@ -315,7 +315,7 @@ class Sms(object):
 
         response = self.airship.request(
             method="PUT",
-            body=json.dumps(self._update_payload).encode("utf-8"),
+            body=self.airship.codec.dumps(self._update_payload),
             url=self.airship.urls.get("sms_url") + self.channel_id,
             version=3,
         )
@@ -333,7 +333,7 @@ class Sms(object):
 
         response = self.airship.request(
             method="POST",
-            body=json.dumps(self.common_payload).encode("utf-8"),
+            body=self.airship.codec.dumps(self.common_payload),
             url=url,
             version=3,
         )
@@ -355,7 +355,7 @@ class Sms(object):
 
         response = self.airship.request(
             method="POST",
-            body=json.dumps(self.common_payload).encode("utf-8"),
+            body=self.airship.codec.dumps(self.common_payload),
             url=url,
             version=3,
         )
@@ -512,10 +512,10 @@ class SmsCustomResponse:
         """
         response = self.airship.request(
             method="POST",
-            body=json.dumps(self._payload),
+            body=self.airship.codec.dumps(self._payload),
             url=self.airship.urls.get("sms_custom_response_url"),
             content_type="application/json",
             version=3,
         )
 
-        return cast(Dict[Any, Any], response.json())
+        return cast(Dict[Any, Any], self.airship.codec.loads(response.content))
@@ -1,7 +1,6 @@
 import collections
 import datetime
 import gzip
-import json
 from io import TextIOWrapper
 from typing import Any, Dict, Optional, cast
 
@@ -28,7 +27,7 @@ class StaticList:
         if self.extra:
             payload["extra"] = self.extra
 
-        body = json.dumps(payload)
+        body = self.airship.codec.dumps(payload)
         response = self.airship._request(
             method="POST",
             body=body,
@@ -36,7 +35,7 @@ class StaticList:
             content_type="application/json",
             version=3,
         )
-        result = response.json()
+        result = self.airship.codec.loads(response.content)
         return cast(Dict[Any, Any], result)
 
     def upload(self, csv_file: TextIOWrapper) -> Dict[Any, Any]:
@@ -58,7 +57,7 @@ class StaticList:
             version=3,
             encoding="gzip",
         )
-        return cast(Dict[Any, Any], response.json())
+        return cast(Dict[Any, Any], self.airship.codec.loads(response.content))
 
     def update(self) -> Dict[Any, Any]:
         """Update the metadata in a static list
@@ -76,11 +75,11 @@ class StaticList:
         if self.extra is not None:
             payload["extra"] = self.extra
 
-        body = json.dumps(payload).encode("utf-8")
+        body = self.airship.codec.dumps(payload)
         url = self.airship.urls.get("lists_url") + self.name
 
         response = self.airship._request("PUT", body, url, "application/json", version=3)
-        result = response.json()
+        result = self.airship.codec.loads(response.content)
         return cast(Dict[Any, Any], result)
 
     @classmethod
@@ -119,7 +118,7 @@ class StaticList:
 
         url = self.airship.urls.get("lists_url") + self.name
         response = self.airship._request("GET", None, url, version=3)
-        payload = response.json()
+        payload = self.airship.codec.loads(response.content)
         return self.from_payload(payload, self.airship)
 
     def delete(self) -> Response:
@@ -1,4 +1,3 @@
-import json
 from typing import Dict
 
 from requests import Response
@@ -34,7 +33,7 @@ class SubscriptionList(object):
 
         response = self.airship.request(
             method="POST",
-            body=json.dumps(payload),
+            body=self.airship.codec.dumps(payload),
             url=self.airship.urls.get("subscription_lists_url"),
             version=3,
         )
@@ -56,7 +55,7 @@ class SubscriptionList(object):
 
         response = self.airship.request(
             method="POST",
-            body=json.dumps(payload),
+            body=self.airship.codec.dumps(payload),
             url=self.airship.urls.get("subscription_lists_url"),
             version=3,
         )
@@ -1,7 +1,7 @@
-import json
 import logging
 from typing import Any, Dict, List, Optional, cast
 
+from urbanairship.async_client import AsyncBaseClient
 from urbanairship.client import BaseClient
 
 logger = logging.getLogger("urbanairship")
@@ -75,7 +75,20 @@ class ChannelTags(object):
 
         :returns: JSON response from the API
         """
-        payload = {}
+        body = self._airship.codec.dumps(self._build_payload())
+        response = self._airship._request("POST", body, self.url, "application/json", version=3)
+        return cast(Dict[Any, Any], self._airship.codec.loads(response.content))
+
+    async def send_async(self) -> Dict[Any, Any]:
+        """Async variant of :py:meth:`send`, for use with an async client."""
+        body = self._airship.codec.dumps(self._build_payload())
+        response = await cast(AsyncBaseClient, self._airship)._request(
+            "POST", body, self.url, "application/json", version=3
+        )
+        return cast(Dict[Any, Any], self._airship.codec.loads(response.content))
+
+    def _build_payload(self) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {}
 
         if not self.audience:
             raise ValueError("A audience is required for modifying tags")
@@ -101,9 +114,7 @@ class ChannelTags(object):
         if not self.add_group and not self.remove_group and not self.set_group:
             raise ValueError("An add, remove, or set field was not set")
 
-        body = json.dumps(payload)
-        response = self._airship._request("POST", body, self.url, "application/json", version=3)
-        return cast(Dict[Any, Any], response.json())
+        return payload
 
 
 class OpenChannelTags(object):
@@ -156,7 +167,20 @@ class OpenChannelTags(object):
 
         :returns: JSON response from the API
         """
-        payload = {}
+        body = self._airship.codec.dumps(self._build_payload())
+        response = self._airship._request("POST", body, self.url, "application/json", version=3)
+        return cast(Dict[Any, Any], self._airship.codec.loads(response.content))
+
+    async def send_async(self) -> Dict[Any, Any]:
+        """Async variant of :py:meth:`send`, for use with an async client."""
+        body = self._airship.codec.dumps(self._build_payload())
+        response = await cast(AsyncBaseClient, self._airship)._request(
+            "POST", body, self.url, "application/json", version=3
+        )
+        return cast(Dict[Any, Any], self._airship.codec.loads(response.content))
+
+    def _build_payload(self) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {}
 
         if not self.audience:
             raise ValueError("An audience is required to modify tags")
@@ -176,6 +200,4 @@ class OpenChannelTags(object):
         if self.remove_group:
             payload["remove"] = self.remove_group
 
-        body = json.dumps(payload)
-        response = self._airship._request("POST", body, self.url, "application/json", version=3)
-        return cast(Dict[Any, Any], response.json())
+        return payload
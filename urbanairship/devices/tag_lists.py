@@ -1,4 +1,3 @@
-import json
 from typing import Any, Dict, List, Optional
 
 from requests import Response
@@ -69,7 +68,7 @@ class TagList:
         response = self.airship.request(
             method="POST",
             url=self.airship.urls.get("tag_lists_url"),
-            body=json.dumps(self._create_payload),
+            body=self.airship.codec.dumps(self._create_payload),
             content_type="application/json",
             version=3,
         )
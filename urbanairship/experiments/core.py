@@ -1,4 +1,3 @@
-import json
 from typing import Any, Dict, Optional
 
 from requests import Response
@@ -40,7 +39,7 @@ class ABTest(object):
         """Create an experiment"""
 
         url = self.airship.urls.get("experiments_url")
-        body = json.dumps(experiment.payload)
+        body = self.airship.codec.dumps(experiment.payload)
         response = self.airship.request(
             method="POST",
             body=body,
@@ -77,7 +76,7 @@ class ABTest(object):
         :keyword experiment: Body of the experiment you want to validate
         """
         url = self.airship.urls.get("experiments_validate")
-        body = json.dumps(experiment.payload)
+        body = self.airship.codec.dumps(experiment.payload)
         response = self.airship.request(
             method="POST",
             body=body,
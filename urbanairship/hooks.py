@@ -0,0 +1,71 @@
+from typing import Any, Optional
+
+
+class RequestInfo:
+    """Details of an API request, passed to each :py:class:`RequestHook` callback.
+
+    One ``RequestInfo`` follows a request through all of its attempts; the
+    per-attempt fields are updated at the start and end of each attempt.
+
+    :ivar method: The HTTP method.
+    :ivar url: The full request URL.
+    :ivar endpoint: The :py:class:`urbanairship.urls.Urls` endpoint name the URL
+        belongs to, e.g. 'push_url', or 'other'.
+    :ivar request_bytes: The size of the request body in bytes.
+    :ivar attempt: The number of the current attempt, starting at 1.
+    :ivar started: ``time.monotonic()`` at the start of the current attempt.
+    :ivar elapsed: Seconds the current attempt took, once it has finished.
+    :ivar status_code: The HTTP status of the current attempt's response, if any.
+    :ivar response_bytes: The size of the current attempt's response body, if any.
+    """
+
+    def __init__(self, method: str, url: str, endpoint: str, request_bytes: int = 0) -> None:
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        self.request_bytes = request_bytes
+        self.attempt = 0
+        self.started = 0.0
+        self.elapsed: Optional[float] = None
+        self.status_code: Optional[int] = None
+        self.response_bytes: Optional[int] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestInfo(method={self.method!r}, endpoint={self.endpoint!r}, "
+            f"attempt={self.attempt}, status_code={self.status_code})"
+        )
+
+
+class RequestHook:
+    """Base class for request lifecycle hooks.
+
+    Pass hook instances to a client with ``hooks=[...]``. Override any of the
+    callbacks below; the defaults do nothing. Hooks are called on the thread (or
+    event loop) making the request, so they should be quick and thread-safe.
+    Exceptions raised by a hook are logged and otherwise ignored.
+    """
+
+    def before_request(self, info: RequestInfo) -> None:
+        """Called before each attempt is sent."""
+
+    def after_response(self, info: RequestInfo, response: Any) -> None:
+        """Called after an attempt receives a successful response."""
+
+    def on_error(self, info: RequestInfo, exc: Exception) -> None:
+        """Called after an attempt fails, whether or not it will be retried."""
+
+    def on_retry(self, info: RequestInfo, exc: Exception, delay: float) -> None:
+        """Called after a failed attempt when the request will be retried.
+
+        :param delay: Seconds until the next attempt.
+        """
+
+
+def body_size(body: Any) -> int:
+    """Size in bytes of a request body, as far as it can be told without reading it."""
+    if isinstance(body, bytes):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    return 0
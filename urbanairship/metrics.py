@@ -0,0 +1,155 @@
+import bisect
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from .hooks import RequestHook, RequestInfo
+
+# Latency bucket upper bounds in seconds: 5ms growing by half each step, to ~10 min
+LATENCY_BUCKETS = [0.005 * 1.5**i for i in range(30)]
+
+
+class LatencyHistogram:
+    """Fixed-size histogram of request latencies.
+
+    Samples are counted into exponentially sized buckets, so memory use doesn't grow
+    with the number of requests. Percentiles are accurate to the width of a bucket,
+    about 50% of the value, and never exceed the slowest observed sample.
+    """
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Approximate latency below which ``fraction`` (0 to 1) of samples fall."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if bucket_count and seen >= rank and index < len(LATENCY_BUCKETS):
+                return min(LATENCY_BUCKETS[index], self.max)
+        return self.max
+
+
+class EndpointMetrics:
+    """Counters and latency histogram for one API endpoint."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.attempts = 0
+        self.retries = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.statuses: Counter = Counter()
+        self.latency = LatencyHistogram()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "errors": self.errors,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "statuses": dict(self.statuses),
+            "latency": {
+                "mean": self.latency.mean,
+                "p50": self.latency.percentile(0.5),
+                "p90": self.latency.percentile(0.9),
+                "p99": self.latency.percentile(0.99),
+                "max": self.latency.max if self.latency.count else None,
+            },
+        }
+
+
+class MetricsCollector(RequestHook):
+    """In-memory request metrics, grouped by :py:class:`urbanairship.urls.Urls`
+    endpoint.
+
+    Records, per endpoint, the number of requests, attempts, retries and failed
+    attempts, bytes sent and received, response status counts and a latency histogram
+    of each attempt. A collector is thread-safe and may be shared by several clients.
+
+    .. code-block:: python
+
+        metrics = ua.MetricsCollector()
+        client = ua.client.BasicAuthClient(key, secret, hooks=[metrics])
+        ...
+        metrics.snapshot()["push_url"]["latency"]["p99"]
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+
+    def _metrics(self, endpoint: str) -> EndpointMetrics:
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints[endpoint] = EndpointMetrics()
+        return metrics
+
+    def _record_attempt(self, info: RequestInfo) -> EndpointMetrics:
+        metrics = self._metrics(info.endpoint)
+        metrics.attempts += 1
+        metrics.bytes_sent += info.request_bytes
+        if info.attempt == 1:
+            metrics.requests += 1
+        if info.elapsed is not None:
+            metrics.latency.add(info.elapsed)
+        if info.status_code is not None:
+            metrics.statuses[info.status_code] += 1
+        if info.response_bytes is not None:
+            metrics.bytes_received += info.response_bytes
+        return metrics
+
+    def after_response(self, info: RequestInfo, response: Any) -> None:
+        with self._lock:
+            self._record_attempt(info)
+
+    def on_error(self, info: RequestInfo, exc: Exception) -> None:
+        with self._lock:
+            self._record_attempt(info).errors += 1
+
+    def on_retry(self, info: RequestInfo, exc: Exception, delay: float) -> None:
+        with self._lock:
+            self._metrics(info.endpoint).retries += 1
+
+    @property
+    def endpoints(self) -> List[str]:
+        """Names of the endpoints with recorded requests."""
+        with self._lock:
+            return sorted(self._endpoints)
+
+    def percentile(self, endpoint: str, fraction: float) -> Optional[float]:
+        """Approximate latency, in seconds, below which ``fraction`` of attempts to
+        ``endpoint`` completed. Returns None when nothing has been recorded.
+        """
+        with self._lock:
+            metrics = self._endpoints.get(endpoint)
+            return metrics.latency.percentile(fraction) if metrics else None
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """A copy of the current metrics, keyed by endpoint name."""
+        with self._lock:
+            return {name: metrics.as_dict() for name, metrics in self._endpoints.items()}
+
+    def reset(self) -> None:
+        """Discard all recorded metrics."""
+        with self._lock:
+            self._endpoints.clear()
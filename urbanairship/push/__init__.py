@@ -14,6 +14,7 @@ from .audience import (
     not_,
     number_attribute,
     open_channel,
+    optimize_audience,
     or_,
     segment,
     sms_id,
@@ -25,7 +26,17 @@ from .audience import (
     text_attribute,
     wns,
 )
-from .core import CreateAndSendPush, Push, ScheduledPush, TemplatePush
+from .chunking import MAX_AUDIENCE_IDS, AudienceChunker
+from .core import (
+    CreateAndSendPush,
+    PreparedPush,
+    Push,
+    PushBatch,
+    PushResponse,
+    ScheduledPush,
+    TemplatePush,
+    TemplatePushBatch,
+)
 from .payload import (
     actions,
     amazon,
@@ -53,14 +64,41 @@ from .payload import (
     wns_payload,
 )
 from .schedule import (
+    BulkSchedules,
     ScheduledList,
+    SchedulePlanner,
+    ScheduleResult,
     best_time,
     local_scheduled_time,
     recurring_schedule,
     schedule_exclusion,
     scheduled_time,
 )
-from .template import Template, TemplateList, merge_data
+from .size import (
+    PLATFORM_LIMITS,
+    PayloadSize,
+    estimate_payload_sizes,
+    oversized_platforms,
+)
+from .streaming import (
+    ChunkResult,
+    CreateAndSendStream,
+    FileCheckpoint,
+    MemoryCheckpoint,
+    SendCheckpoint,
+    read_channels_csv,
+)
+from .template import (
+    CompiledTemplate,
+    Template,
+    TemplateCache,
+    TemplateList,
+    TemplatePushResult,
+    TemplateSender,
+    merge_data,
+    render_template,
+)
+from .validation import PushValidator
 
 # Common selector for audience & device_types
 
@@ -74,12 +112,32 @@ Used in both ``audience`` and ``device_types``.
 __all__: List[Any] = [
     all_,
     Push,
+    PushBatch,
+    PreparedPush,
+    AudienceChunker,
+    MAX_AUDIENCE_IDS,
+    PushResponse,
     ScheduledPush,
     ScheduledList,
+    BulkSchedules,
+    ScheduleResult,
+    SchedulePlanner,
     TemplatePush,
+    TemplatePushBatch,
+    TemplateSender,
+    TemplatePushResult,
     Template,
     TemplateList,
+    TemplateCache,
+    CompiledTemplate,
+    render_template,
     CreateAndSendPush,
+    CreateAndSendStream,
+    ChunkResult,
+    SendCheckpoint,
+    MemoryCheckpoint,
+    FileCheckpoint,
+    read_channels_csv,
     ios_channel,
     android_channel,
     amazon_channel,
@@ -97,6 +155,12 @@ __all__: List[Any] = [
     and_,
     or_,
     not_,
+    optimize_audience,
+    estimate_payload_sizes,
+    oversized_platforms,
+    PayloadSize,
+    PLATFORM_LIMITS,
+    PushValidator,
     notification,
     ios,
     android,
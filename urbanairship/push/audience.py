@@ -1,5 +1,6 @@
+import json
 import re
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 DEVICE_TOKEN_FORMAT = re.compile(r"^[0-9a-fA-F]{64}$")
 UUID_FORMAT = re.compile(
@@ -239,3 +240,113 @@ def not_(child: Any) -> Dict[str, Any]:
 
     """
     return {"not": child}
+
+
+# Selectors that accept a list of values, matching devices with any of them
+LIST_SELECTORS = frozenset(
+    [
+        "tag",
+        "named_user",
+        "channel",
+        "ios_channel",
+        "android_channel",
+        "amazon_channel",
+        "open_channel",
+        "device_token",
+        "apid",
+        "wns",
+    ]
+)
+
+
+def optimize_audience(audience: Any) -> Any:
+    """Return an equivalent, smaller audience selector.
+
+    Nested ``and_`` and ``or_`` groups of the same operator are flattened,
+    duplicate selectors are removed, double ``not_`` is dropped, and selectors of
+    the same type inside an ``or_`` are merged into list form. A group left with
+    one selector is replaced by that selector. The given selector isn't changed.
+
+    >>> optimize_audience(or_(tag('a'), or_(tag('b'), tag('a')), not_(not_(segment('s')))))
+    {'or': [{'tag': ['a', 'b']}, {'segment': 's'}]}
+
+    """
+    if not isinstance(audience, dict) or len(audience) != 1:
+        return audience
+    if "not" in audience:
+        child = optimize_audience(audience["not"])
+        if isinstance(child, dict) and len(child) == 1 and "not" in child:
+            return child["not"]
+        return {"not": child}
+    operator = "or" if "or" in audience else "and" if "and" in audience else None
+    if operator is None or not isinstance(audience[operator], list):
+        return audience
+
+    children = []
+    for child in audience[operator]:
+        child = optimize_audience(child)
+        if isinstance(child, dict) and len(child) == 1 and operator in child:
+            children.extend(child[operator])
+        else:
+            children.append(child)
+    if operator == "or":
+        children = _merge_lists(children)
+    children = _unique(children)
+    if len(children) == 1:
+        return children[0]
+    return {operator: children}
+
+
+def _selector_key(selector: Any) -> str:
+    return json.dumps(selector, sort_keys=True, separators=(",", ":"))
+
+
+def _unique(items: List[Any]) -> List[Any]:
+    seen = set()
+    unique = []
+    for item in items:
+        key = _selector_key(item)
+        if key not in seen:
+            seen.add(key)
+            unique.append(item)
+    return unique
+
+
+def _list_selector(selector: Any) -> Optional[Tuple[str, Optional[str]]]:
+    """The (type, tag group) that ``selector`` merges on, or None if it can't be merged."""
+    if not isinstance(selector, dict):
+        return None
+    if len(selector) == 2 and "tag" in selector and "group" in selector:
+        return ("tag", selector["group"])
+    if len(selector) == 1:
+        (name,) = selector
+        if name in LIST_SELECTORS:
+            return (name, None)
+    return None
+
+
+def _merge_lists(children: List[Any]) -> List[Any]:
+    merged: List[Any] = []
+    values: Dict[Tuple[str, Optional[str]], List[Any]] = {}
+    for child in children:
+        key = _list_selector(child)
+        if key is None:
+            merged.append(child)
+            continue
+        value = child[key[0]]
+        if key not in values:
+            values[key] = []
+            merged.append(key)
+        values[key].extend(value if isinstance(value, list) else [value])
+
+    result = []
+    for item in merged:
+        if not isinstance(item, tuple):
+            result.append(item)
+            continue
+        name, group = item
+        items = _unique(values[item])
+        selector: Dict[str, Any] = {} if group is None else {"group": group}
+        selector[name] = items[0] if len(items) == 1 else items
+        result.append(selector)
+    return result
@@ -0,0 +1,161 @@
+import asyncio
+import itertools
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from urbanairship.push import audience
+from urbanairship.push.core import (
+    MAX_BATCH_PUSHES,
+    PreparedPush,
+    Push,
+    PushBatch,
+    PushResponse,
+)
+
+#: The most values one audience selector may list
+MAX_AUDIENCE_IDS = 1000
+
+#: Selectors an AudienceChunker can list ids for, with the function that checks an id
+SELECTORS: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    "channel": audience.channel,
+    "ios_channel": audience.ios_channel,
+    "android_channel": audience.android_channel,
+    "amazon_channel": audience.amazon_channel,
+    "open_channel": audience.open_channel,
+    "device_token": audience.device_token,
+    "apid": audience.apid,
+    "wns": audience.wns,
+    "named_user": audience.named_user,
+}
+
+
+class AudienceChunker(object):
+    """Send a push to any number of explicit ids, split into pushes the API accepts.
+
+    Ids are read lazily from any iterable, such as the lines of a CSV export, and
+    grouped into audiences like ``{"channel": [id, id, ...]}`` of up to ``max_ids``
+    ids, and at most ``max_bytes`` bytes of request body when that is set. The
+    notification is encoded once with a :py:class:`PreparedPush`, and only one
+    batch of pushes is held in memory at a time.
+
+    .. code-block:: python
+
+        chunker = ua.AudienceChunker(push, selector="ios_channel")
+        with open("channels.csv") as export:
+            for response in chunker.send(row[0] for row in csv.reader(export)):
+                ...
+
+    :param push: [required] The :py:class:`Push` to send. Its audience is ignored.
+    :param selector: [optional] The audience selector the ids belong to, one of
+        :py:data:`SELECTORS`. Defaults to 'channel'.
+    :param max_ids: [optional] The most ids in one push. Defaults to 1000.
+    :param max_bytes: [optional] The largest request body in bytes, both for one
+        push and for each batch request of several pushes. Defaults to None, no limit.
+    """
+
+    def __init__(
+        self,
+        push: Push,
+        selector: str = "channel",
+        max_ids: int = MAX_AUDIENCE_IDS,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        if selector not in SELECTORS:
+            raise ValueError("selector must be one of %s" % ", ".join(sorted(SELECTORS)))
+        self.prepared = PreparedPush(push)
+        self.selector = selector
+        self.max_ids = max_ids
+        self.max_bytes = max_bytes
+        self._check = SELECTORS[selector]
+        self._codec = push._airship.codec
+        self._overhead = len(self.prepared._splice(self._audience_bytes([])))
+
+    def _audience_bytes(self, encoded_ids: List[bytes]) -> bytes:
+        return b'{"%s":[%s]}' % (self.selector.encode("utf-8"), b",".join(encoded_ids))
+
+    def chunks(self, ids: Iterable[str]) -> Iterator[Tuple[List[str], bytes]]:
+        """Group ``ids`` into audiences, yielding each chunk's ids with its request body.
+
+        :raises ValueError: An id isn't valid for the selector. Chunks before it have
+            already been yielded.
+        """
+        chunk: List[str] = []
+        encoded: List[bytes] = []
+        size = self._overhead
+        for value in ids:
+            value = self._check(value)[self.selector]
+            item = self._codec.dumps(value)
+            grow = len(item) + (1 if encoded else 0)
+            if chunk and self.max_bytes is not None and size + grow > self.max_bytes:
+                yield chunk, self.prepared._splice(self._audience_bytes(encoded))
+                chunk, encoded, size = [], [], self._overhead
+                grow = len(item)
+            chunk.append(value)
+            encoded.append(item)
+            size += grow
+            if len(chunk) >= self.max_ids:
+                yield chunk, self.prepared._splice(self._audience_bytes(encoded))
+                chunk, encoded, size = [], [], self._overhead
+        if chunk:
+            yield chunk, self.prepared._splice(self._audience_bytes(encoded))
+
+    def pushes(self, ids: Iterable[str]) -> Iterator[Push]:
+        """Yield a :py:class:`Push` for each chunk of ``ids``, ready to send."""
+        for chunk, body in self.chunks(ids):
+            yield self.prepared._push({self.selector: chunk}, body)
+
+    def batches(
+        self, ids: Iterable[str], max_pushes: int = MAX_BATCH_PUSHES
+    ) -> Iterator[PushBatch]:
+        """Yield :py:class:`PushBatch` objects of up to ``max_pushes`` pushes each."""
+        pushes = self.pushes(ids)
+        while True:
+            group = list(itertools.islice(pushes, max_pushes))
+            if not group:
+                return
+            yield PushBatch(
+                self.prepared._airship, group, max_pushes=max_pushes, max_bytes=self.max_bytes
+            )
+
+    def send(
+        self, ids: Iterable[str], max_pushes: int = MAX_BATCH_PUSHES
+    ) -> Iterator[PushResponse]:
+        """Send the push to every id, yielding a :py:class:`PushResponse` per chunk.
+
+        Pushes are sent in :py:class:`PushBatch` requests as the responses are
+        consumed, so the generator must be iterated for anything to be sent.
+        """
+        for batch in self.batches(ids, max_pushes):
+            yield from batch.send()
+
+    async def send_async(
+        self, ids: Iterable[str], max_pushes: int = MAX_BATCH_PUSHES, concurrency: int = 4
+    ) -> List[PushResponse]:
+        """Send the push to every id with an async client, with up to
+        ``concurrency`` batch requests in flight at once.
+
+        :returns: A :py:class:`PushResponse` per chunk, in order.
+        """
+        results: List[List[PushResponse]] = []
+        pending: Set["asyncio.Task[None]"] = set()
+
+        async def run(index: int, batch: PushBatch) -> None:
+            results[index] = await batch.send_async()
+
+        try:
+            for index, batch in enumerate(self.batches(ids, max_pushes)):
+                if len(pending) >= concurrency:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        task.result()
+                results.append([])
+                pending.add(asyncio.ensure_future(run(index, batch)))
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            # a batch or an id failed, or the caller cancelled; don't leave requests running
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return [response for batch_results in results for response in batch_results]
@@ -1,14 +1,60 @@
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from requests import Response
 
-from urbanairship import devices
+from urbanairship import common, devices
+from urbanairship.async_client import AsyncBaseClient
 from urbanairship.client import BaseClient
+from urbanairship.codec import JsonCodec
+from urbanairship.push.validation import default_validator
+
+if TYPE_CHECKING:
+    import httpx
 
 logger = logging.getLogger("urbanairship")
 
+#: The most push objects sent in one request by a :py:class:`PushBatch`
+MAX_BATCH_PUSHES = 100
+
+
+def _sent(push_response: "PushResponse") -> "PushResponse":
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Push successful. push_ids: %s", ", ".join(push_response.push_ids or []))
+    return push_response
+
+
+def _failure(exc: Exception) -> "PushResponse":
+    """A failed :py:class:`PushResponse` carrying ``exc``."""
+    data: Dict[str, Any] = {"ok": False}
+    if isinstance(exc, common.AirshipFailure):
+        data.update(error=exc.error, error_code=exc.error_code, details=exc.details)
+    else:
+        data["error"] = str(exc) or exc.__class__.__name__
+    return PushResponse(None, data, error=exc)
+
+
+def _push_from_payload(airship: BaseClient, payload: Dict[str, Any]) -> "Push":
+    """Rebuild a :py:class:`Push` from a push object returned by the API."""
+    push = Push(airship)
+    push.audience = payload["audience"]
+    push.device_types = payload["device_types"]
+    for key in ("notification", "options", "campaigns", "message", "in_app", "localizations"):
+        if key in payload:
+            setattr(push, key, payload[key])
+    return push
+
 
 class PushResponse(object):
     """Response to a successful push notification send or schedule.
@@ -17,30 +63,96 @@ class PushResponse(object):
     but making it an object gives us some flexibility to add functionality
     later.
 
+    Only the response body is kept, and it isn't decoded until one of the fields
+    is first read, so holding many responses costs little more than their bodies.
+
+    :param response: The HTTP response to the request, if there was one.
+    :param data: [optional] The response body, if it has already been decoded with
+        the client's codec. Otherwise it is decoded from ``response``.
+    :param error: [optional] For a push sent with a :py:class:`PushBatch`, the
+        exception that stopped it being sent. ``ok`` is False when this is set.
+    :param codec: [optional] The :py:class:`JsonCodec` to decode ``response`` with.
+        Defaults to the standard library ``json`` module.
     """
 
-    ok: Optional[bool] = None
-    localized_ids: Optional[List] = None
-    push_ids: Optional[List] = None
-    schedule_url: Optional[str] = None
-    operation_id: Optional[str] = None
-    payload: Optional[Dict] = None
-
-    def __init__(self, response: Response):
-        data = response.json()
-        self.localized_ids = data.get("localized_ids", [])
-        self.push_ids = data.get("push_ids")
-        self.schedule_url = data.get("schedule_urls", [])
-        self.operation_id = data.get("operation_id")
-        self.ok = data.get("ok")
-        self.payload = data
+    __slots__ = ("_data", "_content", "_codec", "error")
+
+    def __init__(
+        self,
+        response: Optional[Union[Response, "httpx.Response"]],
+        data: Optional[Dict] = None,
+        error: Optional[Exception] = None,
+        codec: Optional[JsonCodec] = None,
+    ) -> None:
+        self.error = error
+        self._data = data
+        self._codec = codec
+        self._content: Optional[bytes] = None
+        if data is None and response is not None:
+            self._content = response.content
+
+    @property
+    def payload(self) -> Dict:
+        """The decoded response body."""
+        if self._data is None:
+            if self._content is None:
+                self._data = {}
+            elif self._codec is None:
+                self._data = json.loads(self._content)
+            else:
+                self._data = self._codec.loads(self._content)
+            self._content = None
+        return self._data
+
+    @property
+    def ok(self) -> Optional[bool]:
+        return self.payload.get("ok")
+
+    @property
+    def push_ids(self) -> Optional[List]:
+        return self.payload.get("push_ids")
+
+    @property
+    def localized_ids(self) -> Optional[List]:
+        return cast(Optional[List], self.payload.get("localized_ids", []))
+
+    @property
+    def schedule_url(self) -> Optional[List]:
+        return cast(Optional[List], self.payload.get("schedule_urls", []))
+
+    @property
+    def operation_id(self) -> Optional[str]:
+        return self.payload.get("operation_id")
 
     def __str__(self) -> str:
         return "Response Payload: {0}".format(self.payload)
 
 
 class Push(object):
-    """A push notification. Set audience, message, etc, and send."""
+    """A push notification. Set audience, message, etc, and send.
+
+    The payload is built, checked and encoded once, and the encoded bytes are
+    reused by later calls to :py:meth:`validate` and :py:meth:`send` until one of the
+    push's fields is assigned again. Changing a value in place, such as
+    ``push.notification["alert"] = "Hi"``, isn't noticed: assign the field again or
+    call :py:meth:`invalidate` afterwards.
+    """
+
+    _payload_fields = frozenset(
+        {
+            "audience",
+            "notification",
+            "options",
+            "campaigns",
+            "message",
+            "in_app",
+            "localizations",
+            "_device_types",
+        }
+    )
+    _cached_payload: Optional[Dict[str, Any]] = None
+    _cached_body: Optional[bytes] = None
+    _checked: bool = False
 
     def __init__(self, airship: BaseClient) -> None:
         self._airship = airship
@@ -52,8 +164,22 @@ class Push(object):
         self.in_app: Optional[Dict[str, Any]] = None
         self.localizations: Optional[Dict[str, Any]] = None
 
-    @property
-    def payload(self) -> Dict[str, Any]:
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._payload_fields:
+            self.invalidate()
+        super().__setattr__(name, value)
+
+    def invalidate(self) -> None:
+        """Discard the cached payload and encoded body, so they are rebuilt on the
+        next send. Only needed after changing a field's contents in place.
+        """
+        self._cached_payload = None
+        self._cached_body = None
+        self._checked = False
+
+    def _build_payload(self) -> Dict[str, Any]:
+        if self._cached_payload is not None:
+            return self._cached_payload
         data: Dict[str, Any] = {
             "audience": self.audience,
             "device_types": self.device_types,
@@ -70,8 +196,19 @@ class Push(object):
             data["in_app"] = self.in_app
         if self.localizations is not None:
             data["localizations"] = self.localizations
+        self._cached_payload = data
         return data
 
+    @property
+    def payload(self) -> Dict[str, Any]:
+        return dict(self._build_payload())
+
+    def _encoded(self) -> bytes:
+        """The payload encoded with the client's codec, cached until a field changes."""
+        if self._cached_body is None:
+            self._cached_body = self._airship.codec.dumps(self._build_payload())
+        return self._cached_body
+
     @property
     def device_types(self) -> List:
         return self._device_types
@@ -80,21 +217,61 @@ class Push(object):
     def device_types(self, types: List) -> None:
         self._device_types = types
 
-    def validate(self) -> PushResponse:
+    def validate(self, remote: bool = True) -> PushResponse:
         """
         Test push payload against the validate endpoint. No sends will result from this
         method being called. This method is otherwise identical to the `send` method.
+
+        :param remote: [optional] If False, check the payload locally with a
+            :py:class:`PushValidator` instead of making a request. Defaults to True.
+        :raises ValueError: Local validation failed.
         """
+        if not remote:
+            return self._validate_local()
 
         response = self._airship._request(
             method="POST",
-            body=json.dumps(self.payload),
+            body=self._encoded(),
             url=self._airship.urls.get("validate_url"),
             content_type="application/json",
             version=3,
         )
 
-        return PushResponse(response)
+        return PushResponse(response, codec=self._airship.codec)
+
+    async def validate_async(self, remote: bool = True) -> PushResponse:
+        """Async variant of :py:meth:`validate`, for use with an async client."""
+        if not remote:
+            return self._validate_local()
+
+        response = await cast(AsyncBaseClient, self._airship)._request(
+            method="POST",
+            body=self._encoded(),
+            url=self._airship.urls.get("validate_url"),
+            content_type="application/json",
+            version=3,
+        )
+
+        return PushResponse(response, codec=self._airship.codec)
+
+    def _validate_local(self) -> PushResponse:
+        default_validator.validate(self._build_payload())
+        return PushResponse(None, {"ok": True})
+
+    def _check_email_override(self) -> None:
+        if self._checked:
+            return
+        payload = self._build_payload()
+        if self.notification is not None and "email" in self.notification:
+            if payload["device_types"] == "all":
+                raise ValueError("device_types cannot be all when including an email override")
+            if "email" not in payload["device_types"]:
+                raise ValueError("email must be in device_types if email override is included")
+        if "email" in payload["device_types"] and (
+            self.notification is None or "email" not in self.notification
+        ):
+            raise ValueError("email override must be included when email is in device_types")
+        self._checked = True
 
     def send(self) -> PushResponse:
         """Send the notification.
@@ -106,29 +283,31 @@ class Push(object):
         :raises ValueError: Required keys missing or incorrect values included.
         :raises ConnectionFailure: Connection failed.
         """
-        if self.notification is not None and "email" in self.notification:
-            if self.payload["device_types"] == "all":
-                raise ValueError("device_types cannot be all when including an email override")
-            if "email" not in self.payload["device_types"]:
-                raise ValueError("email must be in device_types if email override is included")
-        if "email" in self.payload["device_types"] and (
-            self.notification is None or "email" not in self.notification
-        ):
-            raise ValueError("email override must be included when email is in device_types")
+        self._check_email_override()
 
-        body = json.dumps(self.payload)
         response = self._airship._request(
             method="POST",
-            body=body,
+            body=self._encoded(),
             url=self._airship.urls.get("push_url"),
             content_type="application/json",
             version=3,
         )
 
-        data = response.json()
-        logger.info("Push successful. push_ids: %s", ", ".join(data.get("push_ids", [])))
+        return _sent(PushResponse(response, codec=self._airship.codec))
+
+    async def send_async(self) -> PushResponse:
+        """Async variant of :py:meth:`send`, for use with an async client."""
+        self._check_email_override()
+
+        response = await cast(AsyncBaseClient, self._airship)._request(
+            method="POST",
+            body=self._encoded(),
+            url=self._airship.urls.get("push_url"),
+            content_type="application/json",
+            version=3,
+        )
 
-        return PushResponse(response)
+        return _sent(PushResponse(response, codec=self._airship.codec))
 
     @classmethod
     def message_center_delete(cls, airship: BaseClient, push_id: str) -> Response:
@@ -159,6 +338,264 @@ class Push(object):
         return response
 
 
+class PreparedPush(object):
+    """A push sent to many audiences, with everything but the audience encoded once.
+
+    The notification, device types, options and other fields of ``push`` are
+    checked and encoded when the prepared push is created. Each send only encodes
+    its audience, and its localizations when they are given, and splices them into
+    the pre-encoded bytes, so the cost of a send depends on the size of its audience
+    rather than of the notification.
+
+    .. code-block:: python
+
+        push = ua.Push(airship)
+        push.notification = ua.notification(alert="Sale starts now")
+        push.device_types = ua.device_types("ios", "android")
+        prepared = ua.PreparedPush(push)
+
+        for channel_ids in audiences:
+            prepared.send(ua.or_(*[ua.channel(c) for c in channel_ids]))
+
+    :param push: [required] The :py:class:`Push` to use as a template. Its audience
+        is ignored. Later changes to it don't affect the prepared push.
+    """
+
+    def __init__(self, push: Push) -> None:
+        push._check_email_override()
+        self._airship = push._airship
+        self._fields = {name: getattr(push, name) for name in Push._payload_fields}
+        rest = push.payload
+        del rest["audience"]
+        localizations = rest.pop("localizations", None)
+        # the encoded object without its braces, ready to follow the audience
+        self._rest = self._airship.codec.dumps(rest)[1:-1]
+        self._localizations = self._encode_localizations(localizations)
+
+    def _encode_localizations(self, localizations: Any) -> bytes:
+        if localizations is None:
+            return b""
+        return b',"localizations":' + self._airship.codec.dumps(localizations)
+
+    def encode(self, audience: Any, localizations: Any = None) -> bytes:
+        """The request body for a push to ``audience``.
+
+        :param audience: [required] The audience selector for this send.
+        :param localizations: [optional] Localizations for this send, replacing any
+            set on the template push.
+        """
+        return self._splice(self._airship.codec.dumps(audience), localizations)
+
+    def _splice(self, audience: bytes, localizations: Any = None) -> bytes:
+        parts = [b'{"audience":', audience]
+        if self._rest:
+            parts += [b",", self._rest]
+        if localizations is not None:
+            parts.append(self._encode_localizations(localizations))
+        else:
+            parts.append(self._localizations)
+        parts.append(b"}")
+        return b"".join(parts)
+
+    def for_audience(self, audience: Any, localizations: Any = None) -> Push:
+        """A :py:class:`Push` to ``audience`` that sends the spliced body, for use
+        with :py:class:`PushBatch` or on its own.
+        """
+        return self._push(audience, self.encode(audience, localizations), localizations)
+
+    def _push(self, audience: Any, body: bytes, localizations: Any = None) -> Push:
+        push = Push(self._airship)
+        for name, value in self._fields.items():
+            setattr(push, name, value)
+        push.audience = audience
+        if localizations is not None:
+            push.localizations = localizations
+        push._cached_body = body
+        push._checked = True
+        return push
+
+    def send(self, audience: Any, localizations: Any = None) -> PushResponse:
+        """Send the notification to ``audience``. See :py:meth:`Push.send`."""
+        return self.for_audience(audience, localizations).send()
+
+    async def send_async(self, audience: Any, localizations: Any = None) -> PushResponse:
+        """Async variant of :py:meth:`send`, for use with an async client."""
+        return await self.for_audience(audience, localizations).send_async()
+
+
+class PushBatch(object):
+    """Several push notifications, sent in as few requests as possible.
+
+    The push endpoint accepts an array of push objects, so a batch packs its
+    pushes into requests of up to ``max_pushes`` pushes (and ``max_bytes`` bytes,
+    when set) instead of making one request per push.
+
+    Sending returns one :py:class:`PushResponse` per push, in the order the pushes
+    were added. A push that couldn't be sent has ``ok`` set to False and the
+    exception in ``error``; the others are still sent. When the API rejects a
+    request as invalid, nothing in it was sent, so its pushes are split into
+    smaller requests until the invalid pushes are isolated.
+
+    :param airship: [required] An urbanairship client object.
+    :param pushes: [optional] The :py:class:`Push` objects to send.
+    :param max_pushes: [optional] The maximum number of pushes per request.
+        Defaults to 100.
+    :param max_bytes: [optional] The maximum size of a request body in bytes.
+        Defaults to None, no limit.
+    """
+
+    #: Statuses meaning the whole request was rejected, so it can be split and resent
+    split_statuses = frozenset({400, 413})
+
+    def __init__(
+        self,
+        airship: BaseClient,
+        pushes: Optional[Iterable[Union[Push, "TemplatePush"]]] = None,
+        max_pushes: int = MAX_BATCH_PUSHES,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self._airship = airship
+        self.pushes: List[Union[Push, "TemplatePush"]] = list(pushes or [])
+        self.max_pushes = max_pushes
+        self.max_bytes = max_bytes
+
+    def __len__(self) -> int:
+        return len(self.pushes)
+
+    def add(self, push: Union[Push, "TemplatePush"]) -> None:
+        """Add a push to the batch."""
+        self.pushes.append(push)
+
+    def _encode(self, push: Any) -> bytes:
+        """Check a push and return its encoded payload."""
+        push._check_email_override()
+        return cast(bytes, push._encoded())
+
+    def _url(self) -> str:
+        return self._airship.urls.get("push_url")
+
+    def _chunks(self, results: List[Optional[PushResponse]]) -> List[List[Tuple[int, bytes]]]:
+        """Encode each push once and pack them into request-sized chunks.
+
+        Pushes that fail local checks get their error response in ``results``.
+        """
+        chunks: List[List[Tuple[int, bytes]]] = []
+        chunk: List[Tuple[int, bytes]] = []
+        chunk_bytes = 1
+        for index, push in enumerate(self.pushes):
+            try:
+                body = self._encode(push)
+            except (ValueError, TypeError) as exc:
+                results[index] = _failure(exc)
+                continue
+            size = len(body) + 1
+            if chunk and (
+                len(chunk) >= self.max_pushes
+                or (self.max_bytes is not None and chunk_bytes + size > self.max_bytes)
+            ):
+                chunks.append(chunk)
+                chunk, chunk_bytes = [], 1
+            chunk.append((index, body))
+            chunk_bytes += size
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _request_args(self, chunk: List[Tuple[int, bytes]]) -> Dict[str, Any]:
+        return {
+            "method": "POST",
+            "body": b"[" + b",".join(body for _, body in chunk) + b"]",
+            "url": self._url(),
+            "content_type": "application/json",
+            "version": 3,
+        }
+
+    def _split(self, chunk: List[Tuple[int, bytes]], exc: Exception) -> bool:
+        return (
+            len(chunk) > 1
+            and isinstance(exc, common.AirshipFailure)
+            and exc.status_code in self.split_statuses
+        )
+
+    def _record(
+        self,
+        chunk: List[Tuple[int, bytes]],
+        response: Union[Response, "httpx.Response"],
+        results: List[Optional[PushResponse]],
+    ) -> None:
+        data = self._airship.codec.loads(response.content)
+        push_ids = data.get("push_ids") or []
+        logger.info("Batch of %d pushes successful. push_ids: %s", len(chunk), ", ".join(push_ids))
+        for position, (index, _) in enumerate(chunk):
+            item = {"ok": data.get("ok"), "operation_id": data.get("operation_id")}
+            # one push id per push object, in request order
+            if len(push_ids) == len(chunk):
+                item["push_ids"] = [push_ids[position]]
+            else:
+                item["push_ids"] = push_ids
+            results[index] = PushResponse(response, item)
+
+    def _record_failure(
+        self,
+        chunk: List[Tuple[int, bytes]],
+        exc: Exception,
+        results: List[Optional[PushResponse]],
+    ) -> None:
+        logger.warning("Batch of %d pushes failed: %r", len(chunk), exc)
+        for index, _ in chunk:
+            results[index] = _failure(exc)
+
+    def send(self) -> List[PushResponse]:
+        """Send every push in the batch.
+
+        :returns: A :py:class:`PushResponse` for each push, in the order they were
+            added. Failed pushes have ``ok`` False and the exception in ``error``.
+        """
+        results: List[Optional[PushResponse]] = [None] * len(self.pushes)
+        for chunk in self._chunks(results):
+            self._send_chunk(chunk, results)
+        return cast(List[PushResponse], results)
+
+    def _send_chunk(
+        self, chunk: List[Tuple[int, bytes]], results: List[Optional[PushResponse]]
+    ) -> None:
+        try:
+            response = self._airship._request(**self._request_args(chunk))
+        except (common.AirshipFailure, common.ConnectionFailure, common.Unauthorized) as exc:
+            if self._split(chunk, exc):
+                middle = len(chunk) // 2
+                self._send_chunk(chunk[:middle], results)
+                self._send_chunk(chunk[middle:], results)
+            else:
+                self._record_failure(chunk, exc, results)
+            return
+        self._record(chunk, response, results)
+
+    async def send_async(self) -> List[PushResponse]:
+        """Async variant of :py:meth:`send`, for use with an async client."""
+        results: List[Optional[PushResponse]] = [None] * len(self.pushes)
+        for chunk in self._chunks(results):
+            await self._send_chunk_async(chunk, results)
+        return cast(List[PushResponse], results)
+
+    async def _send_chunk_async(
+        self, chunk: List[Tuple[int, bytes]], results: List[Optional[PushResponse]]
+    ) -> None:
+        try:
+            response = await cast(AsyncBaseClient, self._airship)._request(
+                **self._request_args(chunk)
+            )
+        except (common.AirshipFailure, common.ConnectionFailure, common.Unauthorized) as exc:
+            if self._split(chunk, exc):
+                middle = len(chunk) // 2
+                await self._send_chunk_async(chunk[:middle], results)
+                await self._send_chunk_async(chunk[middle:], results)
+            else:
+                self._record_failure(chunk, exc, results)
+            return
+        self._record(chunk, response, results)
+
+
 class ScheduledPush(object):
     """A scheduled push notification. Set schedule, push, and send."""
 
@@ -176,17 +613,10 @@ class ScheduledPush(object):
 
         sched = cls(airship)
         response = sched._airship._request(method="GET", body=None, url=url, version=3)
-        payload = response.json()
+        payload = airship.codec.loads(response.content)
         sched.name = payload.get("name")
         sched.schedule = payload["schedule"]
-        sched.push = Push(airship)
-        sched.push.audience = payload["push"]["audience"]
-        sched.push.notification = payload["push"]["notification"]
-        sched.push.device_types = payload["push"]["device_types"]
-        if "message" in payload["push"]:
-            sched.push.message = payload["push"]["message"]
-        if "options" in payload["push"]:
-            sched.push.options = payload["push"]["options"]
+        sched.push = _push_from_payload(airship, payload["push"])
         sched.url = url
         return sched
 
@@ -244,12 +674,28 @@ class ScheduledPush(object):
         """
         response = self._airship._request(
             method="POST",
-            body=json.dumps(self.payload),
+            body=self._airship.codec.dumps(self.payload),
+            url=self.api_url,
+            content_type="application/json",
+            version=3,
+        )
+
+        return self._handle_send_response(response)
+
+    async def send_async(self) -> PushResponse:
+        """Async variant of :py:meth:`send`, for use with an async client."""
+        response = await cast(AsyncBaseClient, self._airship)._request(
+            method="POST",
+            body=self._airship.codec.dumps(self.payload),
             url=self.api_url,
             content_type="application/json",
             version=3,
         )
-        data = response.json()
+
+        return self._handle_send_response(response)
+
+    def _handle_send_response(self, response: Union[Response, "httpx.Response"]) -> PushResponse:
+        data = self._airship.codec.loads(response.content)
 
         urls = data.get("schedule_urls", [])
         if urls:
@@ -262,19 +708,30 @@ class ScheduledPush(object):
         else:
             logger.info("Scheduled push resulted in zero messages scheduled.")
 
-        return PushResponse(response)
+        return PushResponse(response, data)
+
+    def validate(self, remote: bool = True) -> PushResponse:
+        """Validates a scheduled push for sending
+
+        :param remote: [optional] If False, check the schedule and push locally with
+            a :py:class:`PushValidator` instead of making a request. Defaults to True.
+        :raises ValueError: Local validation failed.
+        """
+        if not remote:
+            errors = default_validator.schedule_errors(self.payload)
+            if errors:
+                raise ValueError("Invalid scheduled push: " + "; ".join(errors))
+            return PushResponse(None, {"ok": True})
 
-    def validate(self) -> PushResponse:
-        """Validates a scheduled push for sending"""
         response = self._airship._request(
             method="POST",
-            body=json.dumps(self.payload),
+            body=self._airship.codec.dumps(self.payload),
             url=self.api_url,
             content_type="application/json",
             version=3,
         )
 
-        return PushResponse(response)
+        return PushResponse(response, codec=self._airship.codec)
 
     def pause(self) -> Response:
         """Pause a recurring schedule"""
@@ -310,7 +767,7 @@ class ScheduledPush(object):
     def update(self) -> PushResponse:
         if not self.url:
             raise ValueError("Cannot update ScheduledPush without url.")
-        body = json.dumps(self.payload)
+        body = self._airship.codec.dumps(self.payload)
         response = self._airship._request(
             method="PUT",
             body=body,
@@ -319,13 +776,13 @@ class ScheduledPush(object):
             version=3,
         )
 
-        data = response.json()
+        data = self._airship.codec.loads(response.content)
         logger.info(
             "Scheduled push update successful. schedule_urls: %s",
             ", ".join(data.get("schedule_urls", [])),
         )
 
-        return PushResponse(response)
+        return PushResponse(response, data)
 
 
 class TemplatePush(object):
@@ -358,13 +815,9 @@ class TemplatePush(object):
 
         """
 
-        if not self.audience:
-            raise ValueError("Must set audience for template push.")
-
-        if not self.device_types:
-            raise ValueError("Must set device_types for template push.")
+        self._check_required()
 
-        body = json.dumps(self.payload)
+        body = self._airship.codec.dumps(self.payload)
         response = self._airship._request(
             method="POST",
             body=body,
@@ -373,10 +826,52 @@ class TemplatePush(object):
             version=3,
         )
 
-        data = response.json()
-        logger.info("Push successful. push_ids: %s", ", ".join(data.get("push_ids", [])))
+        return _sent(PushResponse(response, codec=self._airship.codec))
+
+    async def send_async(self) -> PushResponse:
+        """Async variant of :py:meth:`send`, for use with an async client."""
+        self._check_required()
+
+        body = self._airship.codec.dumps(self.payload)
+        response = await cast(AsyncBaseClient, self._airship)._request(
+            method="POST",
+            body=body,
+            url=self._airship.urls.get("templates_url") + "push",
+            content_type="application/json",
+            version=3,
+        )
+
+        return _sent(PushResponse(response, codec=self._airship.codec))
+
+    def _check_required(self) -> None:
+        if not self.audience:
+            raise ValueError("Must set audience for template push.")
+
+        if not self.device_types:
+            raise ValueError("Must set device_types for template push.")
+
 
-        return PushResponse(response)
+class TemplatePushBatch(PushBatch):
+    """Several template pushes, sent to the template push endpoint in as few
+    requests as possible.
+
+    Works like :py:class:`PushBatch`, one :py:class:`PushResponse` per
+    :py:class:`TemplatePush`, in the order they were added.
+
+    :param airship: [required] An urbanairship client object.
+    :param pushes: [optional] The :py:class:`TemplatePush` objects to send.
+    :param max_pushes: [optional] The maximum number of pushes per request.
+        Defaults to 100.
+    :param max_bytes: [optional] The maximum size of a request body in bytes.
+        Defaults to None, no limit.
+    """
+
+    def _encode(self, push: Any) -> bytes:
+        push._check_required()
+        return self._airship.codec.dumps(push.payload)
+
+    def _url(self) -> str:
+        return self._airship.urls.get("templates_url") + "push"
 
 
 class CreateAndSendPush(object):
@@ -492,7 +987,7 @@ class CreateAndSendPush(object):
         :raises ConnectionFailure: Connection failed.
 
         """
-        body = json.dumps(self.payload)
+        body = self._airship.codec.dumps(self.payload)
         response = self._airship._request(
             method="POST",
             body=body,
@@ -503,4 +998,19 @@ class CreateAndSendPush(object):
 
         logger.info("Create and Send successful")
 
-        return PushResponse(response)
+        return PushResponse(response, codec=self._airship.codec)
+
+    async def send_async(self) -> PushResponse:
+        """Async variant of :py:meth:`send`, for use with an async client."""
+        body = self._airship.codec.dumps(self.payload)
+        response = await cast(AsyncBaseClient, self._airship)._request(
+            method="POST",
+            body=body,
+            url=self._airship.urls.get("create_and_send_url"),
+            content_type="application/json",
+            version=3,
+        )
+
+        logger.info("Create and Send successful")
+
+        return PushResponse(response, codec=self._airship.codec)
@@ -1,9 +1,24 @@
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Type
+import calendar
+import fnmatch
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from urbanairship import common
 from urbanairship.client import BaseClient
-from urbanairship.push.core import ScheduledPush
+from urbanairship.push.core import ScheduledPush, TemplatePush, _push_from_payload
 
 VALID_DAYS: List[str] = [
     "monday",
@@ -169,3 +184,358 @@ def recurring_schedule(
         recurring["paused"] = paused
 
     return {"recurring": recurring}
+
+
+class ScheduleResult(object):
+    """The result of one operation run by :py:class:`BulkSchedules`.
+
+    :ivar schedule: The :py:class:`ScheduledPush` the operation ran on.
+    :ivar response: The operation's return value, if it succeeded.
+    :ivar error: The exception it raised, if it failed.
+    """
+
+    __slots__ = ("schedule", "response", "error")
+
+    def __init__(
+        self, schedule: ScheduledPush, response: Any = None, error: Optional[Exception] = None
+    ) -> None:
+        self.schedule = schedule
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return f"ScheduleResult(url={self.schedule.url!r}, ok={self.ok})"
+
+
+class BulkSchedules(object):
+    """Create, update, cancel, pause or resume many scheduled pushes at once.
+
+    Each operation runs on up to ``concurrency`` schedules at a time and returns a
+    :py:class:`ScheduleResult` per schedule, in order. A schedule that fails
+    doesn't stop the rest. To stay within the API rate limit, give the client a
+    :py:class:`urbanairship.ratelimit.RateLimiter`; it is shared by every thread.
+
+    .. code-block:: python
+
+        bulk = ua.BulkSchedules(airship, concurrency=16)
+        bulk.send(schedules)
+        bulk.cancel(bulk.select(name="spring-sale-*", scheduled_before=datetime(2030, 4, 1)))
+
+    :param airship: [required] An urbanairship client object.
+    :param concurrency: [optional] The most requests in flight at once. Defaults to 8.
+    """
+
+    def __init__(self, airship: BaseClient, concurrency: int = 8) -> None:
+        self.airship = airship
+        self.concurrency = concurrency
+
+    def select(
+        self,
+        name: Optional[str] = None,
+        scheduled_after: Optional[datetime] = None,
+        scheduled_before: Optional[datetime] = None,
+    ) -> Iterator[ScheduledPush]:
+        """Yield the listed scheduled pushes matching every filter given.
+
+        Each schedule's push is rebuilt as a :py:class:`Push` or
+        :py:class:`TemplatePush`, so the schedules can be passed to :py:meth:`update`.
+
+        :param name: [optional] A schedule name, or a shell-style pattern such as
+            ``"spring-sale-*"``.
+        :param scheduled_after: [optional] Only schedules sending at or after this
+            time. Recurring schedules, which have no single send time, never match.
+            Timezone aware times are compared in UTC; naive times, and
+            ``local_scheduled_time`` schedules, are compared as given.
+        :param scheduled_before: [optional] Only schedules sending before this time.
+        """
+        after = _naive_utc(scheduled_after)
+        before = _naive_utc(scheduled_before)
+        for schedule in ScheduledList(self.airship):
+            if name is not None and not fnmatch.fnmatchcase(schedule.name or "", name):
+                continue
+            if after is not None or before is not None:
+                send_time = _send_time(schedule.schedule)
+                if send_time is None:
+                    continue
+                if after is not None and send_time < after:
+                    continue
+                if before is not None and send_time >= before:
+                    continue
+            if isinstance(schedule.push, dict):
+                schedule.push = self._push(schedule.push)
+            yield schedule
+
+    def _push(self, payload: Dict[str, Any]) -> Any:
+        """Rebuild a listed schedule's push object. Create and send pushes, whose
+        channels can't be rebuilt, are left as they are.
+        """
+        if "merge_data" in payload:
+            push = TemplatePush(self.airship)
+            push.audience = payload.get("audience")
+            push.device_types = payload.get("device_types")
+            push.merge_data = payload["merge_data"]
+            return push
+        if "create_and_send" in (payload.get("audience") or {}):
+            return payload
+        return _push_from_payload(self.airship, payload)
+
+    def _run(
+        self, operation: Callable[[ScheduledPush], Any], schedules: Iterable[ScheduledPush]
+    ) -> List[ScheduleResult]:
+        def run(schedule: ScheduledPush) -> ScheduleResult:
+            try:
+                return ScheduleResult(schedule, operation(schedule))
+            except Exception as exc:
+                # one bad schedule mustn't lose the results of the others
+                return ScheduleResult(schedule, error=exc)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            return list(pool.map(run, schedules))
+
+    def send(self, schedules: Iterable[ScheduledPush]) -> List[ScheduleResult]:
+        """Create each schedule with :py:meth:`ScheduledPush.send`."""
+        return self._run(ScheduledPush.send, schedules)
+
+    def update(self, schedules: Iterable[ScheduledPush]) -> List[ScheduleResult]:
+        """Update each schedule with :py:meth:`ScheduledPush.update`."""
+        return self._run(ScheduledPush.update, schedules)
+
+    def cancel(self, schedules: Iterable[ScheduledPush]) -> List[ScheduleResult]:
+        """Cancel each schedule."""
+        return self._run(ScheduledPush.cancel, schedules)
+
+    def pause(self, schedules: Iterable[ScheduledPush]) -> List[ScheduleResult]:
+        """Pause each recurring schedule."""
+        return self._run(ScheduledPush.pause, schedules)
+
+    def resume(self, schedules: Iterable[ScheduledPush]) -> List[ScheduleResult]:
+        """Resume each paused recurring schedule."""
+        return self._run(ScheduledPush.resume, schedules)
+
+
+def _naive_utc(when: Optional[datetime]) -> Optional[datetime]:
+    if when is None or when.tzinfo is None:
+        return when
+    return when.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _send_time(schedule: Optional[Dict[str, Any]]) -> Optional[datetime]:
+    """The time a one-off schedule sends, in its own (UTC or device local) time."""
+    if not schedule or "recurring" in schedule:
+        return None
+    for key in ("scheduled_time", "local_scheduled_time"):
+        if key in schedule:
+            return datetime.strptime(schedule[key][:19], DT_FORMAT_STR)
+    if "best_time" in schedule:
+        return datetime.strptime(schedule["best_time"]["send_date"], "%Y-%m-%d")
+    return None
+
+
+class SchedulePlanner(object):
+    """Expand campaign windows into the one-off schedules they send at, locally.
+
+    Each window is a start time and, optionally, a recurrence from
+    :py:func:`recurring_schedule` and exclusions from :py:func:`schedule_exclusion`.
+    The planner expands every recurrence up to its end time, drops the times an
+    exclusion covers, and merges times that collapse to the same instant, so a
+    multi-region campaign can be checked before anything is scheduled.
+
+    Timezone aware start times are expanded on their own wall clock (a daily 9:00 in
+    ``America/New_York`` stays at 9:00 across daylight saving changes) and planned as
+    ``scheduled_time`` in UTC. Exclusion hour ranges are UTC for these, as in the API.
+    Naive start times are planned as given, as ``scheduled_time`` or, with
+    ``local=True``, as ``local_scheduled_time`` in each device's time zone.
+
+    .. code-block:: python
+
+        planner = ua.SchedulePlanner()
+        for tz in ("America/New_York", "Europe/Berlin"):
+            planner.add(
+                datetime(2030, 3, 1, 9, tzinfo=ZoneInfo(tz)),
+                recurring=ua.recurring_schedule(1, "daily"),
+                end_time=datetime(2030, 3, 31, tzinfo=ZoneInfo(tz)),
+                exclusions=[ua.schedule_exclusion(days_of_week=["sunday"], ...)],
+            )
+        schedules = planner.scheduled_pushes(airship, push)
+        ua.BulkSchedules(airship).send(schedules)
+
+    :param max_schedules: [optional] The most schedules a plan may hold. Adding a
+        window that goes over it raises ``ValueError``. Defaults to 10000.
+    """
+
+    def __init__(self, max_schedules: int = 10000) -> None:
+        self.max_schedules = max_schedules
+        self._planned: Dict[Tuple[str, str], datetime] = {}
+
+    def add(
+        self,
+        start: datetime,
+        recurring: Optional[Dict[str, Any]] = None,
+        end_time: Optional[datetime] = None,
+        exclusions: Optional[List[Dict[str, Any]]] = None,
+        local: bool = False,
+    ) -> "SchedulePlanner":
+        """Add a campaign window to the plan.
+
+        :param start: [required] A ``datetime.datetime``; the first send time.
+        :param recurring: [optional] A recurrence from :py:func:`recurring_schedule`.
+            Without one the window sends once, at ``start``.
+        :param end_time: [optional] When the recurrence stops, inclusive. Overrides the
+            recurrence's own ``end_time``, which is read as UTC for aware start times.
+            One of the two is required to recur. Must be timezone aware if and only if
+            ``start`` is.
+        :param exclusions: [optional] A list of :py:func:`schedule_exclusion` objects,
+            in addition to any in the recurrence. A time is excluded when it falls in
+            every range an exclusion gives.
+        :param local: [optional] Plan naive times as ``local_scheduled_time``.
+            Defaults to False.
+        :returns: The planner, so calls can be chained.
+        """
+        aware = start.tzinfo is not None
+        if local and aware:
+            raise ValueError("local schedules need a naive start time")
+        if end_time is not None and (end_time.tzinfo is not None) != aware:
+            raise ValueError("start and end_time must both be timezone aware or both naive")
+        recurrence = (recurring or {}).get("recurring", recurring) or {}
+        if end_time is None and "end_time" in recurrence:
+            end_time = datetime.strptime(recurrence["end_time"], DT_FORMAT_STR)
+            if aware:
+                end_time = end_time.replace(tzinfo=timezone.utc)
+        if recurrence and end_time is None:
+            raise ValueError("a recurring window needs an end_time")
+        rules = [
+            _Exclusion(exclusion)
+            for exclusion in list(exclusions or []) + recurrence.get("exclusions", [])
+        ]
+
+        key = "local_scheduled_time" if local else "scheduled_time"
+        planned = dict(self._planned)
+        for occurrence in _occurrences(start, recurrence.get("cadence"), end_time):
+            if aware:
+                occurrence = occurrence.astimezone(timezone.utc).replace(tzinfo=None)
+            if any(rule.covers(occurrence) for rule in rules):
+                continue
+            planned[(key, occurrence.strftime(DT_FORMAT_STR))] = occurrence
+            if len(planned) > self.max_schedules:
+                raise ValueError("plan exceeds max_schedules (%d)" % self.max_schedules)
+        self._planned = planned
+        return self
+
+    def __len__(self) -> int:
+        return len(self._planned)
+
+    def schedules(self) -> List[Dict[str, Any]]:
+        """Return the planned schedule objects, earliest first, without duplicates."""
+        return [{key: value} for key, value in sorted(self._planned, key=_plan_order)]
+
+    def scheduled_pushes(
+        self, airship: BaseClient, push: Any, name: Optional[str] = None
+    ) -> List[ScheduledPush]:
+        """Return a :py:class:`ScheduledPush` for each planned schedule, ready to send
+        with :py:class:`BulkSchedules`.
+
+        :param airship: [required] An urbanairship client object.
+        :param push: [required] The push to schedule, such as a :py:class:`Push`.
+        :param name: [optional] A name for every schedule.
+        """
+        scheduled_pushes = []
+        for schedule in self.schedules():
+            scheduled = ScheduledPush(airship)
+            scheduled.schedule = schedule
+            scheduled.push = push
+            scheduled.name = name
+            scheduled_pushes.append(scheduled)
+        return scheduled_pushes
+
+
+class _Exclusion(object):
+    """A parsed :py:func:`schedule_exclusion`, all of whose ranges must match."""
+
+    __slots__ = ("hours", "dates", "days")
+
+    def __init__(self, exclusion: Dict[str, Any]) -> None:
+        self.hours: Optional[Tuple[int, int]] = None
+        self.dates: Optional[Tuple[datetime, datetime]] = None
+        self.days: Optional[Set[int]] = None
+        if "hour_range" in exclusion:
+            start, end = exclusion["hour_range"].split("-")
+            self.hours = (int(start), int(end))
+        if "date_range" in exclusion:
+            start, end = exclusion["date_range"].split("/")
+            self.dates = (
+                datetime.strptime(start, DT_FORMAT_STR),
+                datetime.strptime(end, DT_FORMAT_STR),
+            )
+        if "days_of_week" in exclusion:
+            self.days = {VALID_DAYS.index(day) for day in exclusion["days_of_week"]}
+
+    def covers(self, when: datetime) -> bool:
+        if self.hours is not None:
+            start, end = self.hours
+            if start <= end and not start <= when.hour <= end:
+                return False
+            if start > end and end < when.hour < start:
+                return False
+        if self.dates is not None and not self.dates[0] <= when <= self.dates[1]:
+            return False
+        if self.days is not None and when.weekday() not in self.days:
+            return False
+        return True
+
+
+def _occurrences(
+    start: datetime, cadence: Optional[Dict[str, Any]], end_time: Optional[datetime]
+) -> Iterator[datetime]:
+    """Yield the send times of a window in order, on the start time's wall clock."""
+    if not cadence:
+        yield start
+        return
+    if end_time is None:
+        raise ValueError("a recurring window needs an end_time")
+    count = cadence.get("count", 1)
+    if count < 1:
+        raise ValueError("cadence count must be at least 1")
+    cadence_type = cadence["type"]
+    if cadence_type == "weekly" and cadence.get("days_of_week"):
+        days = sorted(VALID_DAYS.index(day) for day in cadence["days_of_week"])
+        week = start - timedelta(days=start.weekday())
+        while week <= end_time:
+            for day in days:
+                occurrence = week + timedelta(days=day)
+                if start <= occurrence <= end_time:
+                    yield occurrence
+            week += timedelta(weeks=count)
+        return
+    for step in itertools.count():
+        if cadence_type == "hourly":
+            occurrence = start + timedelta(hours=step * count)
+        elif cadence_type == "daily":
+            occurrence = start + timedelta(days=step * count)
+        elif cadence_type == "weekly":
+            occurrence = start + timedelta(weeks=step * count)
+        elif cadence_type == "monthly":
+            occurrence = _add_months(start, step * count)
+        elif cadence_type == "yearly":
+            occurrence = _add_months(start, 12 * step * count)
+        else:
+            raise ValueError("type must be one of {}".format(VALID_RECURRING_TYPES))
+        if occurrence > end_time:
+            return
+        yield occurrence
+
+
+def _add_months(when: datetime, months: int) -> datetime:
+    """Add months to a datetime, keeping to the last day of shorter months."""
+    year, month = divmod(when.month - 1 + months, 12)
+    year += when.year
+    day = min(when.day, calendar.monthrange(year, month + 1)[1])
+    return when.replace(year=year, month=month + 1, day=day)
+
+
+def _plan_order(planned: Tuple[str, str]) -> Tuple[str, str]:
+    key, value = planned
+    return value, key
@@ -0,0 +1,135 @@
+from typing import Any, Dict, List, Optional
+
+from urbanairship.codec import JsonCodec, default_codec
+
+#: Known payload limits per platform: bytes of the platform payload, or characters
+#: of the alert for SMS. Platforms without a fixed limit are left out.
+PLATFORM_LIMITS: Dict[str, int] = {
+    "ios": 4096,
+    "android": 4096,
+    "amazon": 6144,
+    "web": 4096,
+    "wns": 5120,
+    "sms": 1600,
+}
+
+PUSH_PLATFORMS = ("ios", "android", "amazon", "web", "wns")
+
+
+class PayloadSize:
+    """The estimated size of one platform's payload.
+
+    :ivar platform: The platform, e.g. 'ios', 'sms', 'mms' or 'open::toaster'.
+    :ivar size: The estimated size, in ``unit``.
+    :ivar limit: The platform's limit in the same unit, or None if it has none.
+    :ivar unit: 'bytes', or 'characters' for the SMS alert.
+    """
+
+    def __init__(self, platform: str, size: int, limit: Optional[int], unit: str = "bytes"):
+        self.platform = platform
+        self.size = size
+        self.limit = limit
+        self.unit = unit
+
+    @property
+    def over_limit(self) -> bool:
+        """True if the payload is larger than the platform's limit."""
+        return self.limit is not None and self.size > self.limit
+
+    def __repr__(self) -> str:
+        return (
+            f"PayloadSize(platform={self.platform!r}, size={self.size}, "
+            f"limit={self.limit}, unit={self.unit!r})"
+        )
+
+
+def estimate_payload_sizes(
+    push: Any,
+    limits: Optional[Dict[str, int]] = None,
+    codec: Optional[JsonCodec] = None,
+) -> Dict[str, PayloadSize]:
+    """Estimate the size of each platform payload in a notification, without any
+    API request.
+
+    Each platform override is encoded with the top level alert filled in where
+    the override doesn't set its own, which is what the platform is sent. The
+    sizes are estimates: Airship adds a few fields of its own when delivering, so
+    a payload just under its limit can still be rejected.
+
+    >>> sizes = ua.estimate_payload_sizes(ua.notification(alert='Hi', ios=ua.ios(badge=1)))
+    >>> sizes['ios']
+    PayloadSize(platform='ios', size=24, limit=4096, unit='bytes')
+
+    :param push: [required] A :py:class:`Push`, or a notification as built by
+        :py:func:`notification`. For a push, platforms in its ``device_types``
+        without an override are estimated from the top level alert.
+    :param limits: [optional] Limits to use instead of, or in addition to,
+        :py:data:`PLATFORM_LIMITS`, e.g. ``{"email": 102400}``.
+    :param codec: [optional] The :py:class:`JsonCodec` to encode with. Defaults to
+        the push's client codec, or the default codec for a notification.
+    :returns: A :py:class:`PayloadSize` for each platform, keyed by platform.
+    """
+    device_types: List[str] = []
+    if isinstance(push, dict):
+        notification = push
+    else:
+        notification = push.notification or {}
+        if codec is None:
+            codec = push._airship.codec
+        if isinstance(getattr(push, "device_types", None), list):
+            device_types = push.device_types
+    codec = codec or default_codec()
+    all_limits = dict(PLATFORM_LIMITS, **(limits or {}))
+    alert = notification.get("alert")
+
+    sizes: Dict[str, PayloadSize] = {}
+    for platform, override in notification.items():
+        if platform in PUSH_PLATFORMS or platform.startswith("open::"):
+            payload = dict(override)
+            if alert is not None:
+                payload.setdefault("alert", alert)
+            size = len(codec.dumps(payload))
+        elif platform == "sms" and "mms" in override:
+            platform = "mms"
+            size = len(codec.dumps(override["mms"]))
+        elif platform == "sms":
+            text = override.get("alert")
+            if text is None:
+                text = override.get("template", {}).get("fields", {}).get("alert", "")
+            sizes[platform] = PayloadSize(
+                platform, len(text), all_limits.get(platform), "characters"
+            )
+            continue
+        elif platform == "email":
+            size = len(codec.dumps(override))
+        else:
+            continue
+        sizes[platform] = PayloadSize(platform, size, all_limits.get(platform))
+
+    if alert is not None:
+        for platform in device_types:
+            if platform in PUSH_PLATFORMS and platform not in sizes:
+                size = len(codec.dumps({"alert": alert}))
+                sizes[platform] = PayloadSize(platform, size, all_limits.get(platform))
+            elif platform == "sms" and platform not in sizes and "mms" not in sizes:
+                sizes[platform] = PayloadSize(
+                    platform, len(alert), all_limits.get(platform), "characters"
+                )
+    return sizes
+
+
+def oversized_platforms(
+    push: Any,
+    limits: Optional[Dict[str, int]] = None,
+    codec: Optional[JsonCodec] = None,
+) -> List[PayloadSize]:
+    """The platform payloads of ``push`` that are over their limits.
+
+    Takes the same arguments as :py:func:`estimate_payload_sizes`.
+
+    >>> ua.oversized_platforms(ua.notification(sms=ua.sms(alert='x' * 2000)))
+    [PayloadSize(platform='sms', size=2000, limit=1600, unit='characters')]
+    """
+    return [
+        size for size in estimate_payload_sizes(push, limits, codec).values() if size.over_limit
+    ]
@@ -0,0 +1,302 @@
+import asyncio
+import csv
+import itertools
+import json
+import logging
+import os
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from urbanairship import common
+from urbanairship.client import BaseClient
+from urbanairship.push.core import CreateAndSendPush, PushResponse, _failure
+
+logger = logging.getLogger("urbanairship")
+
+#: The most channels one create and send request may include
+MAX_CREATE_AND_SEND_CHANNELS = 1000
+
+Chunk = Tuple[int, List[Any]]
+
+
+class SendCheckpoint:
+    """Base class for recording which chunks of a :py:class:`CreateAndSendStream`
+    have been accepted, so an interrupted send can be resumed.
+
+    Subclasses implement :py:meth:`load` and :py:meth:`save`.
+    """
+
+    def load(self) -> Set[int]:
+        """Return the indexes of the chunks already accepted."""
+        raise NotImplementedError
+
+    def save(self, done: Set[int]) -> None:
+        """Record that the chunks in ``done`` have been accepted."""
+        raise NotImplementedError
+
+
+class MemoryCheckpoint(SendCheckpoint):
+    """Checkpoint kept in memory, for resuming within one process."""
+
+    def __init__(self) -> None:
+        self._done: Set[int] = set()
+
+    def load(self) -> Set[int]:
+        return set(self._done)
+
+    def save(self, done: Set[int]) -> None:
+        self._done = set(done)
+
+
+class FileCheckpoint(SendCheckpoint):
+    """Checkpoint kept in a JSON file, for resuming after the process exits.
+
+    The file is replaced atomically after each accepted chunk. It stores the
+    number of leading chunks accepted, plus any later chunks that finished first.
+
+    :param path: [required] Path of the checkpoint file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def load(self) -> Set[int]:
+        try:
+            with open(self.path) as checkpoint_file:
+                data = json.load(checkpoint_file)
+        except FileNotFoundError:
+            return set()
+        return set(range(data["acknowledged"])) | set(data["also"])
+
+    def save(self, done: Set[int]) -> None:
+        acknowledged = 0
+        while acknowledged in done:
+            acknowledged += 1
+        data = {"acknowledged": acknowledged, "also": sorted(i for i in done if i > acknowledged)}
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".urbanairship-checkpoint-")
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(data, tmp_file)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class ChunkResult(object):
+    """The result of sending one chunk of a :py:class:`CreateAndSendStream`.
+
+    :ivar index: The chunk's position in the stream, starting at 0.
+    :ivar size: The number of channels in the chunk.
+    :ivar response: A :py:class:`PushResponse`. If the chunk couldn't be sent,
+        ``ok`` is False and ``error`` holds the exception.
+    """
+
+    __slots__ = ("index", "size", "response")
+
+    def __init__(self, index: int, size: int, response: PushResponse) -> None:
+        self.index = index
+        self.size = size
+        self.response = response
+
+    @property
+    def ok(self) -> bool:
+        return self.response.error is None and bool(self.response.ok)
+
+    def __repr__(self) -> str:
+        return f"ChunkResult(index={self.index}, size={self.size}, ok={self.ok})"
+
+
+def read_channels_csv(csv_file: IO[str], record: Callable[[Dict[str, str]], Any]) -> Iterator[Any]:
+    """Read channel objects from a CSV file with a header row, one row at a time.
+
+    :param csv_file: [required] An open text file.
+    :param record: [required] Called with each row as a dict of column values;
+        returns the :py:class:`Sms`, :py:class:`Email` or :py:class:`OpenChannel`
+        for that row.
+    """
+    for row in csv.DictReader(csv_file):
+        yield record(row)
+
+
+class CreateAndSendStream(object):
+    """Create and send to any number of SMS, email or open channels.
+
+    Channels are read lazily from any iterable, such as :py:func:`read_channels_csv`, and
+    sent as :py:class:`CreateAndSendPush` requests of up to ``chunk_size``
+    channels, with up to ``concurrency`` requests in flight. Sending yields a
+    :py:class:`ChunkResult` per chunk as each one finishes.
+
+    With a ``checkpoint``, each accepted chunk is recorded, and sending the same
+    channels again skips the chunks already accepted, so an interrupted send can
+    be resumed. The channels must be read in the same order, with the same
+    ``chunk_size``, for a checkpoint to match.
+
+    .. code-block:: python
+
+        stream = ua.CreateAndSendStream(
+            airship,
+            device_types=ua.device_types("sms"),
+            notification=ua.notification(sms=ua.sms(alert="Hello")),
+            checkpoint=ua.FileCheckpoint("opt-ins.checkpoint"),
+        )
+        with open("opt-ins.csv") as opt_ins:
+            channels = ua.read_channels_csv(opt_ins, lambda row: ua.Sms(airship, ...))
+            for result in stream.send(channels):
+                if not result.ok:
+                    print(result.index, result.response.error)
+
+    :param airship: [required] An urbanairship client object.
+    :param device_types: [required] A single device type, as for
+        :py:class:`CreateAndSendPush`.
+    :param notification: [required] The notification payload.
+    :param campaigns: [optional] A campaigns payload.
+    :param chunk_size: [optional] Channels per request, at most 1000. Defaults to 1000.
+    :param concurrency: [optional] The most requests in flight at once. Defaults to 4.
+    :param checkpoint: [optional] A :py:class:`SendCheckpoint` recording accepted
+        chunks. Defaults to None, no checkpoint.
+    """
+
+    def __init__(
+        self,
+        airship: BaseClient,
+        device_types: List[str],
+        notification: Dict[str, Any],
+        campaigns: Optional[Dict[str, Any]] = None,
+        chunk_size: int = MAX_CREATE_AND_SEND_CHANNELS,
+        concurrency: int = 4,
+        checkpoint: Optional[SendCheckpoint] = None,
+    ) -> None:
+        if not 1 <= chunk_size <= MAX_CREATE_AND_SEND_CHANNELS:
+            raise ValueError("chunk_size must be between 1 and %d" % MAX_CREATE_AND_SEND_CHANNELS)
+        self._airship = airship
+        self.device_types = device_types
+        self.notification = notification
+        self.campaigns = campaigns
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.checkpoint = checkpoint
+
+    def chunks(self, channels: Iterable[Any], skip: Optional[Set[int]] = None) -> Iterator[Chunk]:
+        """Yield ``(index, channels)`` for each chunk not in ``skip``."""
+        skip = skip or set()
+        iterator = iter(channels)
+        for index in itertools.count():
+            chunk = list(itertools.islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            if index not in skip:
+                yield index, chunk
+
+    def _push(self, chunk: List[Any]) -> CreateAndSendPush:
+        push = CreateAndSendPush(self._airship, chunk)
+        push.device_types = self.device_types
+        push.notification = self.notification
+        push.campaigns = self.campaigns
+        return push
+
+    def _send_chunk(self, index: int, chunk: List[Any]) -> ChunkResult:
+        try:
+            response = self._push(chunk).send()
+        except (
+            common.AirshipFailure,
+            common.ConnectionFailure,
+            common.Unauthorized,
+            ValueError,
+            TypeError,
+        ) as exc:
+            logger.warning("Create and send chunk %d failed: %s", index, exc)
+            response = _failure(exc)
+        return ChunkResult(index, len(chunk), response)
+
+    async def _send_chunk_async(self, index: int, chunk: List[Any]) -> ChunkResult:
+        try:
+            response = await self._push(chunk).send_async()
+        except (
+            common.AirshipFailure,
+            common.ConnectionFailure,
+            common.Unauthorized,
+            ValueError,
+            TypeError,
+        ) as exc:
+            logger.warning("Create and send chunk %d failed: %s", index, exc)
+            response = _failure(exc)
+        return ChunkResult(index, len(chunk), response)
+
+    def _load(self) -> Set[int]:
+        return self.checkpoint.load() if self.checkpoint is not None else set()
+
+    def _finish(self, result: ChunkResult, done: Set[int]) -> ChunkResult:
+        if result.ok and self.checkpoint is not None:
+            done.add(result.index)
+            self.checkpoint.save(done)
+        return result
+
+    def send(self, channels: Iterable[Any]) -> Iterator[ChunkResult]:
+        """Send to every channel, yielding a :py:class:`ChunkResult` per chunk as
+        each finishes. Chunks are sent as the results are consumed; if iteration stops
+        early, chunks not yet started are dropped and those already sent are still
+        checkpointed.
+        """
+        done = self._load()
+        pending: Set["Future[ChunkResult]"] = set()
+        finished: Set["Future[ChunkResult]"] = set()
+        pool = ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            for index, chunk in self.chunks(channels, done):
+                if len(pending) >= self.concurrency:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    while finished:
+                        yield self._finish(finished.pop().result(), done)
+                pending.add(pool.submit(self._send_chunk, index, chunk))
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                while finished:
+                    yield self._finish(finished.pop().result(), done)
+        finally:
+            # the consumer stopped early or a checkpoint failed; drop chunks that haven't
+            # started and checkpoint every chunk that reached the server
+            pool.shutdown(wait=True, cancel_futures=True)
+            for future in finished | pending:
+                if not future.cancelled() and future.exception() is None:
+                    self._finish(future.result(), done)
+
+    async def send_async(self, channels: Iterable[Any]) -> AsyncIterator[ChunkResult]:
+        """Async variant of :py:meth:`send`, for use with an async client."""
+        done = self._load()
+        pending: Set["asyncio.Task[ChunkResult]"] = set()
+        try:
+            for index, chunk in self.chunks(channels, done):
+                if len(pending) >= self.concurrency:
+                    finished, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in finished:
+                        yield self._finish(task.result(), done)
+                pending.add(asyncio.ensure_future(self._send_chunk_async(index, chunk)))
+            while pending:
+                finished, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in finished:
+                    yield self._finish(task.result(), done)
+        finally:
+            # the consumer stopped early or a checkpoint failed; don't leave requests running
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -1,13 +1,36 @@
+import asyncio
+import collections
 import datetime
-import json
+import itertools
 import logging
-from typing import Any, Dict, List, Optional, Type
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 
 from requests import Response
 
 from urbanairship import common
 from urbanairship.client import BaseClient
-from urbanairship.push.core import Push
+from urbanairship.push.core import (
+    MAX_BATCH_PUSHES,
+    Push,
+    PushResponse,
+    TemplatePush,
+    TemplatePushBatch,
+)
 
 logger = logging.getLogger("urbanairship")
 
@@ -95,7 +118,7 @@ class Template(object):
         if not self.push:
             raise ValueError("Must set push before template creation.")
 
-        body = json.dumps(self.payload)
+        body = self.airship.codec.dumps(self.payload)
         response = self.airship._request(
             method="POST",
             body=body,
@@ -103,7 +126,7 @@ class Template(object):
             content_type="application/json",
             version=3,
         )
-        self._template_id = response.json().get("template_id")
+        self._template_id = self.airship.codec.loads(response.content).get("template_id")
         logger.info("Successful template creation for template %s", self.template_id)
 
         return response
@@ -147,7 +170,7 @@ class Template(object):
         if template_id:
             self._template_id = template_id
 
-        body = json.dumps(update_payload)
+        body = self.airship.codec.dumps(update_payload)
         response = self.airship._request(
             method="POST",
             body=body,
@@ -213,7 +236,7 @@ class Template(object):
         response = self.airship._request(
             method="GET", body=None, url=url, version=3, params=params
         )
-        payload = response.json()
+        payload = self.airship.codec.loads(response.content)
         return self.from_payload(payload[data_attribute], id_key, self.airship)
 
 
@@ -253,3 +276,313 @@ def merge_data(template_id: str, substitutions: Dict[str, Any]) -> Dict[str, Any
     }
 
     return md
+
+
+#: An ``(audience, substitutions)`` pair sent by a :py:class:`TemplateSender`
+Record = Tuple[Dict[str, Any], Dict[str, Any]]
+
+
+class TemplatePushResult(object):
+    """The result of sending one record with a :py:class:`TemplateSender`.
+
+    :ivar push: The :py:class:`TemplatePush` built for the record.
+    :ivar response: Its :py:class:`PushResponse`. If it couldn't be sent, ``ok``
+        is False and ``error`` holds the exception.
+    """
+
+    __slots__ = ("push", "response")
+
+    def __init__(self, push: TemplatePush, response: PushResponse) -> None:
+        self.push = push
+        self.response = response
+
+    @property
+    def ok(self) -> bool:
+        return self.response.error is None and bool(self.response.ok)
+
+    def __repr__(self) -> str:
+        return f"TemplatePushResult(audience={self.push.audience!r}, ok={self.ok})"
+
+
+class TemplateSender(object):
+    """Send one template to many audiences, each with its own substitutions.
+
+    Records are read lazily from any iterable of ``(audience, substitutions)``
+    pairs. Each becomes a :py:class:`TemplatePush`, and they are sent in
+    :py:class:`TemplatePushBatch` requests of up to ``max_pushes`` pushes, with up
+    to ``concurrency`` requests in flight. Sending yields a
+    :py:class:`TemplatePushResult` per record, in order.
+
+    .. code-block:: python
+
+        sender = ua.TemplateSender(airship, template_id, ua.device_types("ios"))
+        records = ((ua.named_user(row["id"]), {"FIRST_NAME": row["name"]}) for row in rows)
+        for result in sender.send(records):
+            if not result.ok:
+                print(result.push.audience, result.response.error)
+
+    :param airship: [required] An urbanairship client object.
+    :param template_id: [required] The template to send.
+    :param device_types: [required] The device types to send to.
+    :param max_pushes: [optional] The most pushes per request. Defaults to 100.
+    :param max_bytes: [optional] The largest request body in bytes. Defaults to
+        None, no limit.
+    :param concurrency: [optional] The most requests in flight at once. Defaults to 4.
+    """
+
+    def __init__(
+        self,
+        airship: BaseClient,
+        template_id: str,
+        device_types: List[str],
+        max_pushes: int = MAX_BATCH_PUSHES,
+        max_bytes: Optional[int] = None,
+        concurrency: int = 4,
+    ) -> None:
+        self._airship = airship
+        self.template_id = template_id
+        self.device_types = device_types
+        self.max_pushes = max_pushes
+        self.max_bytes = max_bytes
+        self.concurrency = concurrency
+
+    def pushes(self, records: Iterable[Record]) -> Iterator[TemplatePush]:
+        """Yield a :py:class:`TemplatePush` for each record."""
+        for audience, substitutions in records:
+            push = TemplatePush(self._airship)
+            push.audience = audience
+            push.device_types = self.device_types
+            push.merge_data = merge_data(self.template_id, substitutions)
+            yield push
+
+    def batches(self, records: Iterable[Record]) -> Iterator[TemplatePushBatch]:
+        """Yield :py:class:`TemplatePushBatch` objects of up to ``max_pushes`` pushes."""
+        pushes = self.pushes(records)
+        while True:
+            group = list(itertools.islice(pushes, self.max_pushes))
+            if not group:
+                return
+            yield TemplatePushBatch(self._airship, group, self.max_pushes, self.max_bytes)
+
+    @staticmethod
+    def _results(
+        batch: TemplatePushBatch, responses: List[PushResponse]
+    ) -> Iterator[TemplatePushResult]:
+        for push, response in zip(batch.pushes, responses):
+            yield TemplatePushResult(cast(TemplatePush, push), response)
+
+    def send(self, records: Iterable[Record]) -> Iterator[TemplatePushResult]:
+        """Send every record, yielding a :py:class:`TemplatePushResult` for each, in
+        order. Records are read and sent as the results are consumed.
+        """
+        pending: Deque[Tuple[TemplatePushBatch, "Future[List[PushResponse]]"]] = (
+            collections.deque()
+        )
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for batch in self.batches(records):
+                if len(pending) >= self.concurrency:
+                    done, future = pending.popleft()
+                    yield from self._results(done, future.result())
+                pending.append((batch, pool.submit(batch.send)))
+            while pending:
+                done, future = pending.popleft()
+                yield from self._results(done, future.result())
+
+    async def send_async(self, records: Iterable[Record]) -> AsyncIterator[TemplatePushResult]:
+        """Async variant of :py:meth:`send`, for use with an async client."""
+        pending: Deque[Tuple[TemplatePushBatch, "asyncio.Task[List[PushResponse]]"]] = (
+            collections.deque()
+        )
+        try:
+            for batch in self.batches(records):
+                if len(pending) >= self.concurrency:
+                    done, task = pending.popleft()
+                    for result in self._results(done, await task):
+                        yield result
+                pending.append((batch, asyncio.ensure_future(batch.send_async())))
+            while pending:
+                done, task = pending.popleft()
+                for result in self._results(done, await task):
+                    yield result
+        finally:
+            # the consumer stopped early; don't leave requests running
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+
+#: A ``{{VARIABLE}}`` placeholder in a template
+PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z0-9_]+)\s*\}\}")
+
+
+class _Text(object):
+    """A template string split into literal text (even indexes) and variable keys."""
+
+    __slots__ = ("parts",)
+
+    def __init__(self, parts: List[str]) -> None:
+        self.parts = parts
+
+    def render(self, values: Dict[str, str]) -> str:
+        parts = self.parts
+        return "".join(
+            part if index % 2 == 0 else values.get(part, "") for index, part in enumerate(parts)
+        )
+
+
+def _compile(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _compile(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_compile(item) for item in value]
+    if isinstance(value, str) and "{{" in value:
+        parts = PLACEHOLDER.split(value)
+        if len(parts) > 1:
+            return _Text(parts)
+    return value
+
+
+def _render(compiled: Any, values: Dict[str, str]) -> Any:
+    if isinstance(compiled, _Text):
+        return compiled.render(values)
+    if isinstance(compiled, dict):
+        return {key: _render(item, values) for key, item in compiled.items()}
+    if isinstance(compiled, list):
+        return [_render(item, values) for item in compiled]
+    return compiled
+
+
+class CompiledTemplate(object):
+    """A template's push, parsed once so it can be rendered many times.
+
+    :param template: [required] A :py:class:`Template` with ``push`` and ``variables``.
+    """
+
+    __slots__ = ("template", "defaults", "_push")
+
+    def __init__(self, template: Template) -> None:
+        self.template = template
+        self.defaults: Dict[str, str] = {
+            variable["key"]: str(variable["default_value"])
+            for variable in template.variables or []
+            if variable.get("default_value") is not None
+        }
+        self._push = _compile(template.push or {})
+
+    def render(self, substitutions: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the template's push with each ``{{VARIABLE}}`` replaced.
+
+        :param substitutions: [required] Variable values, as for :py:func:`merge_data`,
+            or a whole merge_data object. Values that are None, and variables not
+            given, take the variable's default value, or are left empty.
+        """
+        if "substitutions" in substitutions and "template_id" in substitutions:
+            substitutions = substitutions["substitutions"]
+        values = dict(self.defaults)
+        values.update((key, str(val)) for key, val in substitutions.items() if val is not None)
+        return cast(Dict[str, Any], _render(self._push, values))
+
+
+def render_template(template: Template, substitutions: Dict[str, Any]) -> Dict[str, Any]:
+    """Render a template's push locally with ``substitutions``.
+
+    To render the same template many times, compile it once with
+    :py:class:`CompiledTemplate`, or use a :py:class:`TemplateCache`.
+    """
+    return CompiledTemplate(template).render(substitutions)
+
+
+class TemplateCache(object):
+    """Templates kept in memory by id, with their compiled renderers.
+
+    :py:meth:`get` fetches a template the first time it is asked for.
+    :py:meth:`refresh` lists the templates once and replaces only those whose
+    ``modified_at`` has changed, dropping any that were deleted. Call it
+    periodically to pick up edits without fetching each template. The cache is
+    safe to share between threads.
+
+    .. code-block:: python
+
+        cache = ua.TemplateCache(airship)
+        preview = cache.render(template_id, {"FIRST_NAME": "Bob"})
+
+    :param airship: [required] An urbanairship client object.
+    """
+
+    def __init__(self, airship: BaseClient) -> None:
+        self.airship = airship
+        self._entries: Dict[str, CompiledTemplate] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, template_id: object) -> bool:
+        return template_id in self._entries
+
+    def get(self, template_id: str) -> Template:
+        """Return a template, fetching it with :py:meth:`Template.lookup` if it isn't
+        cached.
+        """
+        return self._compiled(template_id).template
+
+    def put(self, template: Template) -> bool:
+        """Cache a template unless the cached copy has the same ``modified_at``.
+
+        :returns: True if the template was stored.
+        """
+        if template.template_id is None:
+            raise ValueError("Cannot cache a template without an ID.")
+        with self._lock:
+            cached = self._entries.get(template.template_id)
+            if cached is not None and not _modified(cached.template, template):
+                return False
+        compiled = CompiledTemplate(template)
+        with self._lock:
+            self._entries[template.template_id] = compiled
+        return True
+
+    def invalidate(self, template_id: Optional[str] = None) -> None:
+        """Drop one template, or every template, from the cache."""
+        with self._lock:
+            if template_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(template_id, None)
+
+    def refresh(self) -> List[str]:
+        """List the templates and update the cache from the listing.
+
+        :returns: The ids of the cached templates that were replaced or removed.
+        """
+        listed: Dict[str, Template] = {
+            template.template_id: template for template in TemplateList(self.airship)
+        }
+        changed = []
+        with self._lock:
+            cached = list(self._entries)
+        for template_id in cached:
+            if template_id not in listed:
+                self.invalidate(template_id)
+                changed.append(template_id)
+            elif self.put(listed[template_id]):
+                changed.append(template_id)
+        return changed
+
+    def render(self, template_id: str, substitutions: Dict[str, Any]) -> Dict[str, Any]:
+        """Render a cached template's push locally, as :py:meth:`CompiledTemplate.render`."""
+        return self._compiled(template_id).render(substitutions)
+
+    def _compiled(self, template_id: str) -> CompiledTemplate:
+        compiled = self._entries.get(template_id)
+        if compiled is None:
+            self.put(Template(self.airship).lookup(template_id))
+            compiled = self._entries[template_id]
+        return compiled
+
+
+def _modified(cached: Template, template: Template) -> bool:
+    """Whether ``template`` differs from ``cached``, judged by ``modified_at``."""
+    if not isinstance(template.modified_at, datetime.datetime):
+        return True
+    return cached.modified_at != template.modified_at
@@ -0,0 +1,353 @@
+import re
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from urbanairship.push.audience import DEVICE_TOKEN_FORMAT, LIST_SELECTORS, UUID_FORMAT
+
+DEVICE_TYPES = frozenset(["ios", "android", "amazon", "wns", "web", "sms", "email"])
+
+# Keys allowed in each part of a push object
+PUSH_KEYS = frozenset(
+    [
+        "audience",
+        "device_types",
+        "notification",
+        "options",
+        "campaigns",
+        "message",
+        "in_app",
+        "localizations",
+    ]
+)
+NOTIFICATION_KEYS = frozenset(
+    [
+        "alert",
+        "actions",
+        "ios",
+        "android",
+        "amazon",
+        "web",
+        "wns",
+        "sms",
+        "email",
+        "interactive",
+        "in_app",
+    ]
+)
+OPTIONS_KEYS = frozenset(
+    [
+        "expiry",
+        "bypass_frequency_limits",
+        "bypass_holdout_groups",
+        "no_throttle",
+        "omit_from_activity_log",
+        "personalization",
+        "redact_payload",
+    ]
+)
+# Selectors accepted with any value; the validator doesn't check their contents
+OPAQUE_SELECTORS = frozenset(["recency"])
+# The most channels in a create and send audience
+MAX_CREATE_AND_SEND_CHANNELS = 1000
+SCHEDULE_KEYS = frozenset(["scheduled_time", "local_scheduled_time", "best_time", "recurring"])
+ATTRIBUTE_KEYS = frozenset(["attribute", "operator", "value", "precision"])
+
+Check = Callable[[Any, str, List[str]], None]
+
+
+class PushValidator:
+    """Check push objects locally, without a request to the validate endpoint.
+
+    The rules are compiled into lookup tables once, when the validator is created,
+    so one validator can check many thousands of payloads a second. The checks
+    cover the structure of a push: the audience selectors the validator knows
+    (including create and send audiences), device types and their platform
+    overrides, notification keys, options, campaigns, message, in_app and
+    localizations. Any other selector is reported as unknown; name it in
+    ``extra_selectors`` to accept it unchecked. The checks don't know about your
+    project, so a push that passes can still be rejected by the API, e.g. for a
+    segment that doesn't exist.
+
+    >>> validator = ua.PushValidator()
+    >>> validator.errors({"audience": {"tagz": "a"}, "device_types": ["ios"]})
+    ["audience: unknown selector 'tagz'", 'notification, message or in_app is required']
+
+    :param extra_selectors: [optional] Further audience selector names to accept
+        with any value.
+    """
+
+    def __init__(self, extra_selectors: Iterable[str] = ()) -> None:
+        uuid = self._matches(UUID_FORMAT, "a UUID")
+        token = self._matches(DEVICE_TOKEN_FORMAT, "a 64 character hex device token")
+        text = self._string
+        self._leaves: Dict[str, Check] = {
+            "channel": uuid,
+            "ios_channel": uuid,
+            "android_channel": uuid,
+            "amazon_channel": uuid,
+            "open_channel": uuid,
+            "apid": uuid,
+            "wns": uuid,
+            "device_token": token,
+            "tag": text,
+            "named_user": text,
+            "alias": text,
+            "segment": text,
+            "subscription_lists": text,
+            "static_list": text,
+            "sms_sender": text,
+        }
+        self._list_leaves: FrozenSet[str] = LIST_SELECTORS
+        self._opaque: FrozenSet[str] = OPAQUE_SELECTORS | frozenset(extra_selectors)
+        self._sections: Dict[str, Check] = {
+            "notification": self._notification,
+            "options": self._options,
+            "campaigns": self._campaigns,
+            "message": self._message,
+            "in_app": self._in_app,
+            "localizations": self._localizations,
+        }
+
+    def errors(self, payload: Dict[str, Any]) -> List[str]:
+        """Check a push payload, returning a message for each problem found."""
+        errors: List[str] = []
+        if not isinstance(payload, dict):
+            return ["push must be an object"]
+        for key in payload:
+            if key not in PUSH_KEYS:
+                errors.append("unknown push key '%s'" % key)
+        audience = payload.get("audience")
+        if audience is None:
+            errors.append("audience is required")
+        elif isinstance(audience, dict) and "create_and_send" in audience:
+            self._create_and_send(audience, errors)
+        else:
+            self._audience(audience, "audience", errors)
+        device_types = self._device_types(payload.get("device_types"), errors)
+        if not any(payload.get(key) for key in ("notification", "message", "in_app")):
+            errors.append("notification, message or in_app is required")
+        for key, check in self._sections.items():
+            if payload.get(key) is not None:
+                check(payload[key], key, errors)
+        notification = payload.get("notification")
+        if isinstance(notification, dict):
+            if device_types is not None:
+                self._platforms(notification, device_types, errors)
+            elif "email" in notification:
+                errors.append("device_types: can't be all with an email override")
+        return errors
+
+    def validate(self, payload: Dict[str, Any]) -> None:
+        """Check a push payload.
+
+        :raises ValueError: The payload has problems; the message lists them all.
+        """
+        errors = self.errors(payload)
+        if errors:
+            raise ValueError("Invalid push: " + "; ".join(errors))
+
+    def schedule_errors(self, payload: Dict[str, Any]) -> List[str]:
+        """Check a scheduled push payload, including its push if it has one."""
+        errors: List[str] = []
+        schedule = payload.get("schedule")
+        if not isinstance(schedule, dict) or not schedule:
+            errors.append("schedule is required")
+        else:
+            for key in schedule:
+                if key not in SCHEDULE_KEYS:
+                    errors.append("unknown schedule key '%s'" % key)
+            times = [key for key in schedule if key != "recurring"]
+            if len(times) != 1:
+                errors.append(
+                    "schedule must have one of scheduled_time, local_scheduled_time, best_time"
+                )
+        if isinstance(payload.get("push"), dict) and "merge_data" not in payload:
+            errors.extend("push." + error for error in self.errors(payload["push"]))
+        return errors
+
+    @staticmethod
+    def _matches(pattern: "re.Pattern[str]", description: str) -> Check:
+        def check(value: Any, path: str, errors: List[str]) -> None:
+            if not isinstance(value, str) or not pattern.match(value):
+                errors.append("%s: %r is not %s" % (path, value, description))
+
+        return check
+
+    @staticmethod
+    def _string(value: Any, path: str, errors: List[str]) -> None:
+        if not isinstance(value, str) or not value:
+            errors.append("%s: must be a non-empty string" % path)
+
+    def _audience(self, audience: Any, path: str, errors: List[str]) -> None:
+        if audience == "all":
+            return
+        if not isinstance(audience, dict) or not audience:
+            errors.append("%s: must be 'all' or a selector object" % path)
+            return
+        if "attribute" in audience:
+            for key in audience:
+                if key not in ATTRIBUTE_KEYS:
+                    errors.append("%s: unknown attribute selector key '%s'" % (path, key))
+            if "operator" not in audience:
+                errors.append("%s: attribute selector requires an operator" % path)
+            return
+        if "tag" in audience and "group" in audience and len(audience) == 2:
+            self._string(audience["group"], path + ".group", errors)
+            self._leaf("tag", audience["tag"], path, errors)
+            return
+        if len(audience) != 1:
+            errors.append("%s: a selector must have exactly one key" % path)
+            return
+        ((key, value),) = audience.items()
+        if key in ("and", "or"):
+            if not isinstance(value, list) or not value:
+                errors.append("%s.%s: must be a non-empty list" % (path, key))
+                return
+            for index, child in enumerate(value):
+                self._audience(child, "%s.%s[%d]" % (path, key, index), errors)
+        elif key == "not":
+            self._audience(value, path + ".not", errors)
+        elif key == "sms_id":
+            if not isinstance(value, dict) or set(value) != {"sender", "msisdn"}:
+                errors.append("%s.sms_id: must have sender and msisdn" % path)
+        elif key == "location":
+            if not isinstance(value, dict):
+                errors.append("%s.location: must be an object" % path)
+        elif key in self._opaque:
+            return
+        elif key in self._leaves:
+            self._leaf(key, value, path, errors)
+        else:
+            errors.append("%s: unknown selector '%s'" % (path, key))
+
+    def _create_and_send(self, audience: Dict[str, Any], errors: List[str]) -> None:
+        if len(audience) != 1:
+            errors.append("audience: create_and_send can't be combined with other selectors")
+        channels = audience["create_and_send"]
+        if not isinstance(channels, list) or not channels:
+            errors.append("audience.create_and_send: must be a non-empty list")
+            return
+        if len(channels) > MAX_CREATE_AND_SEND_CHANNELS:
+            errors.append(
+                "audience.create_and_send: at most %d channels" % MAX_CREATE_AND_SEND_CHANNELS
+            )
+        for index, channel in enumerate(channels):
+            path = "audience.create_and_send[%d]" % index
+            if not self._object(channel, path, errors):
+                continue
+            if "ua_msisdn" in channel:
+                if "ua_sender" not in channel:
+                    errors.append("%s: ua_sender is required with ua_msisdn" % path)
+            elif "ua_address" not in channel:
+                errors.append("%s: one of ua_address or ua_msisdn is required" % path)
+
+    def _leaf(self, key: str, value: Any, path: str, errors: List[str]) -> None:
+        check = self._leaves[key]
+        if isinstance(value, list) and key in self._list_leaves:
+            if not value:
+                errors.append("%s.%s: must not be empty" % (path, key))
+            for index, item in enumerate(value):
+                check(item, "%s.%s[%d]" % (path, key, index), errors)
+        else:
+            check(value, "%s.%s" % (path, key), errors)
+
+    def _device_types(self, device_types: Any, errors: List[str]) -> Optional[FrozenSet[str]]:
+        if device_types == "all" or device_types == ["all"]:
+            return None
+        if not isinstance(device_types, list) or not device_types:
+            errors.append("device_types: must be 'all' or a non-empty list")
+            return None
+        for device_type in device_types:
+            is_open = isinstance(device_type, str) and device_type.startswith("open::")
+            if device_type not in DEVICE_TYPES and not is_open:
+                errors.append("device_types: invalid device type '%s'" % device_type)
+        return frozenset(device_types)
+
+    def _platforms(
+        self, notification: Dict[str, Any], device_types: FrozenSet[str], errors: List[str]
+    ) -> None:
+        for key in notification:
+            is_platform = key in DEVICE_TYPES or key.startswith("open::")
+            if is_platform and key not in device_types:
+                errors.append(
+                    "notification.%s: override for a device type not in device_types" % key
+                )
+        if "email" in device_types and "email" not in notification:
+            errors.append("notification.email: required when email is in device_types")
+
+    def _object(self, value: Any, path: str, errors: List[str]) -> bool:
+        if not isinstance(value, dict):
+            errors.append("%s: must be an object" % path)
+            return False
+        return True
+
+    def _notification(self, notification: Any, path: str, errors: List[str]) -> None:
+        if not self._object(notification, path, errors):
+            return
+        if not notification:
+            errors.append("%s: must not be empty" % path)
+        for key, value in notification.items():
+            if key.startswith("open::"):
+                self._object(value, "%s.%s" % (path, key), errors)
+            elif key not in NOTIFICATION_KEYS:
+                errors.append("%s: unknown key '%s'" % (path, key))
+            elif key not in ("alert", "actions", "interactive", "in_app"):
+                self._object(value, "%s.%s" % (path, key), errors)
+
+    def _options(self, options: Any, path: str, errors: List[str]) -> None:
+        if not self._object(options, path, errors):
+            return
+        for key, value in options.items():
+            if key not in OPTIONS_KEYS:
+                errors.append("%s: unknown key '%s'" % (path, key))
+            elif key == "expiry":
+                if isinstance(value, bool) or not isinstance(value, (str, int)):
+                    errors.append("%s.expiry: must be a timestamp or seconds" % path)
+            elif not isinstance(value, bool):
+                errors.append("%s.%s: must be a boolean" % (path, key))
+
+    def _campaigns(self, campaigns: Any, path: str, errors: List[str]) -> None:
+        if not self._object(campaigns, path, errors):
+            return
+        categories = campaigns.get("categories")
+        if not isinstance(categories, list) or not 1 <= len(categories) <= 10:
+            errors.append("%s.categories: must be a list of 1 to 10 categories" % path)
+            return
+        for category in categories:
+            if not isinstance(category, str) or not 1 <= len(category) <= 64:
+                errors.append("%s.categories: invalid category %r" % (path, category))
+
+    def _message(self, message: Any, path: str, errors: List[str]) -> None:
+        if not self._object(message, path, errors):
+            return
+        for key in ("title", "body"):
+            if not isinstance(message.get(key), str):
+                errors.append("%s.%s: is required" % (path, key))
+
+    def _in_app(self, in_app: Any, path: str, errors: List[str]) -> None:
+        if not self._object(in_app, path, errors):
+            return
+        for key in ("alert", "display_type"):
+            if not isinstance(in_app.get(key), str):
+                errors.append("%s.%s: is required" % (path, key))
+
+    def _localizations(self, localizations: Any, path: str, errors: List[str]) -> None:
+        if not isinstance(localizations, list):
+            errors.append("%s: must be a list" % path)
+            return
+        for index, localization in enumerate(localizations):
+            item = "%s[%d]" % (path, index)
+            if not self._object(localization, item, errors):
+                continue
+            if "language" not in localization and "country" not in localization:
+                errors.append("%s: one of language or country is required" % item)
+            content = False
+            for key in ("notification", "message", "in_app"):
+                if localization.get(key) is not None:
+                    content = True
+                    self._sections[key](localization[key], "%s.%s" % (item, key), errors)
+            if not content:
+                errors.append("%s: one of notification, message or in_app is required" % item)
+
+
+#: The validator used by ``Push.validate(remote=False)``
+default_validator = PushValidator()
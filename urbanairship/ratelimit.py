@@ -0,0 +1,68 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """Token bucket limiting the rate of requests made by one or more clients.
+
+    A limiter is thread-safe and may be shared by every thread using a client, or by
+    several clients, so that together they stay under an API rate limit. Each request
+    takes one token; tokens are refilled continuously at ``rate`` per second up to
+    ``burst``. When no token is available the request waits for one instead of
+    failing, so bulk jobs slow down smoothly rather than running into 429 responses.
+
+    When the API answers with a ``Retry-After`` header, the client calls
+    :py:meth:`pause` and every request sharing the limiter holds off until then.
+
+    :param rate: [required] The sustained number of requests allowed per second.
+    :param burst: [optional] The number of requests that may be made at once after a
+        quiet period. Defaults to ``rate``, one second's worth of requests.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = max(float(burst if burst is not None else rate), 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(rate={self.rate}, burst={self.burst})"
+
+    def _reserve(self) -> float:
+        """Take a token and return the number of seconds to wait before using it.
+
+        Tokens may be borrowed ahead of time, leaving the bucket negative; later
+        callers then wait proportionally longer, which keeps waiting callers in order.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def acquire(self) -> None:
+        """Block until a request may be made."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request may be made."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold off all requests using this limiter for the given number of seconds."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
@@ -22,7 +22,7 @@ class ExperimentReport(object):
 
         response = self.airship._request("GET", None, url, version=3)
 
-        return cast(Dict[str, Any], response.json())
+        return cast(Dict[str, Any], self.airship.codec.loads(response.content))
 
     def get_variant(self, push_id: str, variant_id: str) -> Dict[str, Any]:
         """Returns statistics and metadata about a specific variant in an experiment (A/B Test).
@@ -38,4 +38,4 @@ class ExperimentReport(object):
 
         response = self.airship._request("GET", None, url, version=3)
 
-        return cast(Dict[str, Any], response.json())
+        return cast(Dict[str, Any], self.airship.codec.loads(response.content))
@@ -16,7 +16,7 @@ class IndividualResponseStats(object):
     def get(self, push_id: str) -> common.IteratorDataObj:
         url = self.airship.urls.get("reports_url") + "responses/" + push_id
         response = self.airship.request(method="GET", body="", url=url, version=3)
-        payload = response.json()
+        payload = self.airship.codec.loads(response.content)
         return common.IteratorDataObj.from_payload(payload)
 
 
@@ -70,7 +70,7 @@ class DevicesReport(object):
         response = self.airship._request(
             method="GET", body="", url=url, version=3, params=params
         )
-        return response.json()
+        return self.airship.codec.loads(response.content)
 
 
 class ReportsList(common.IteratorParent):
@@ -0,0 +1,187 @@
+import asyncio
+import logging
+import random
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from . import common
+
+logger = logging.getLogger("urbanairship")
+
+T = TypeVar("T")
+RetryCallback = Callable[[int, Exception, float], None]
+
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 60.0
+
+
+class RetryPolicy:
+    """Retry schedule for failed API requests.
+
+    A policy is built once and reused for every request a client makes. Failed
+    attempts are retried with exponential backoff: the wait before retry ``n`` is
+    ``base_delay * 2 ** (n - 1)`` seconds, capped at ``max_delay``.
+
+    Client errors that won't succeed on a second try (400, 401, 403 and 404) are
+    raised straight away. When a 429 or 503 response carries a ``Retry-After``
+    header, the policy waits as long as the server asked instead of backing off.
+
+    :param max_tries: [optional] Total number of attempts, including the first.
+        Defaults to 1, no retry.
+    :param base_delay: [optional] Seconds to wait before the first retry.
+        Defaults to 1.
+    :param max_delay: [optional] Upper bound, in seconds, on any single wait.
+        Defaults to 60.
+    :param jitter: [optional] When True, each wait is drawn uniformly between zero and
+        the computed delay ("full jitter"), which spreads out retries from many
+        clients. Defaults to True.
+    :param deadline: [optional] Total number of seconds, measured from the first
+        attempt, after which no further retries are started. Defaults to None, no
+        deadline.
+    """
+
+    retry_on: Tuple[Type[Exception], ...] = (common.AirshipFailure, common.ConnectionFailure)
+    no_retry_statuses: FrozenSet[int] = frozenset({400, 401, 403, 404})
+    retry_after_statuses: FrozenSet[int] = frozenset({429, 503})
+
+    def __init__(
+        self,
+        max_tries: int = 1,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        jitter: bool = True,
+        deadline: Optional[float] = None,
+    ) -> None:
+        if max_tries < 1:
+            raise ValueError("max_tries must be at least 1")
+        self.max_tries = max_tries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.deadline = deadline
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_tries={self.max_tries}, base_delay={self.base_delay}, "
+            f"max_delay={self.max_delay}, jitter={self.jitter}, deadline={self.deadline})"
+        )
+
+    def replace(self, **changes: Any) -> "RetryPolicy":
+        """Return a copy of this policy with the given settings changed."""
+        settings: Dict[str, Any] = {
+            "max_tries": self.max_tries,
+            "base_delay": self.base_delay,
+            "max_delay": self.max_delay,
+            "jitter": self.jitter,
+            "deadline": self.deadline,
+        }
+        settings.update(changes)
+        return self.__class__(**settings)
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Seconds to wait after the given failed attempt (1-based)."""
+        delay = min(self.max_delay, self.base_delay * 2.0 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def should_retry(self, exc: Exception) -> bool:
+        """Whether a request that failed with ``exc`` may succeed if retried."""
+        if isinstance(exc, common.AirshipFailure):
+            return exc.status_code not in self.no_retry_statuses
+        return True
+
+    def retry_after(self, exc: Exception) -> Optional[float]:
+        """Seconds the server asked us to wait before retrying after ``exc``, if any."""
+        if isinstance(exc, common.AirshipFailure) and exc.status_code in self.retry_after_statuses:
+            return exc.retry_after
+        return None
+
+    def next_delay(self, attempt: int, started: float, exc: Exception) -> Optional[float]:
+        """Seconds to wait before retrying after ``exc``, or None to give up.
+
+        :param attempt: The number of the attempt that just failed, starting at 1.
+        :param started: ``time.monotonic()`` at the start of the first attempt.
+        :param exc: The exception raised by the failed attempt.
+        """
+        if attempt >= self.max_tries or not self.should_retry(exc):
+            return None
+        delay = self.retry_after(exc)
+        if delay is None:
+            delay = self.backoff_delay(attempt)
+        if self.deadline is not None and time.monotonic() - started + delay > self.deadline:
+            return None
+        return delay
+
+    def call(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        on_retry: Optional[RetryCallback] = None,
+        **kwargs: Any,
+    ) -> T:
+        """Call ``func``, retrying it according to this policy.
+
+        :param on_retry: [optional] Called with the failed attempt number, the
+            exception and the delay before each retry.
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return func(*args, **kwargs)
+            except self.retry_on as exc:
+                delay = self.next_delay(attempt, started, exc)
+                if delay is None:
+                    raise
+                logger.info(
+                    "Request attempt %d of %d failed, retrying in %.2f seconds",
+                    attempt,
+                    self.max_tries,
+                    delay,
+                )
+                if on_retry is not None:
+                    on_retry(attempt, exc, delay)
+                time.sleep(delay)
+
+    async def call_async(
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
+        on_retry: Optional[RetryCallback] = None,
+        **kwargs: Any,
+    ) -> T:
+        """Await ``func``, retrying it according to this policy.
+
+        :param on_retry: [optional] As for :py:meth:`call`.
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await func(*args, **kwargs)
+            except self.retry_on as exc:
+                delay = self.next_delay(attempt, started, exc)
+                if delay is None:
+                    raise
+                logger.info(
+                    "Request attempt %d of %d failed, retrying in %.2f seconds",
+                    attempt,
+                    self.max_tries,
+                    delay,
+                )
+                if on_retry is not None:
+                    on_retry(attempt, exc, delay)
+                await asyncio.sleep(delay)
@@ -0,0 +1,165 @@
+import contextlib
+import json
+import logging
+import os
+import stat
+import tempfile
+import threading
+import time
+from typing import ContextManager, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger("urbanairship")
+
+#: An access token and the Unix time at which it expires
+StoredToken = Tuple[str, int]
+
+
+def token_cache_key(key: str, client_id: str, scope: Optional[List[str]] = None) -> str:
+    """Key under which the OAuth token for an app key, client id and scope is stored."""
+    return "%s:%s:%s" % (key, client_id, " ".join(sorted(scope or [])))
+
+
+class TokenStore:
+    """Base class for OAuth access token stores.
+
+    A store lets several :py:class:`urbanairship.client.OAuthClient` instances, in
+    the same process or in different ones, share an access token instead of each
+    fetching its own. Subclasses implement :py:meth:`get` and :py:meth:`set`, and may
+    override :py:meth:`lock` to stop clients fetching a token at the same time.
+    """
+
+    def get(self, cache_key: str) -> Optional[StoredToken]:
+        """Return the stored token for ``cache_key``, or None."""
+        raise NotImplementedError
+
+    def set(self, cache_key: str, token: StoredToken) -> None:
+        """Store a token for ``cache_key``."""
+        raise NotImplementedError
+
+    def lock(self, cache_key: str) -> ContextManager[None]:
+        """Context manager held while a client checks for and fetches a token."""
+        return contextlib.nullcontext()
+
+
+class MemoryTokenStore(TokenStore):
+    """Token store shared by the clients in one process."""
+
+    def __init__(self) -> None:
+        self._tokens: Dict[str, StoredToken] = {}
+        self._lock = threading.Lock()
+
+    def get(self, cache_key: str) -> Optional[StoredToken]:
+        return self._tokens.get(cache_key)
+
+    def set(self, cache_key: str, token: StoredToken) -> None:
+        self._tokens[cache_key] = token
+
+    @contextlib.contextmanager
+    def lock(self, cache_key: str) -> Iterator[None]:
+        with self._lock:
+            yield
+
+
+def _default_directory() -> str:
+    """A cache directory only the current user can use, created if needed."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    directory = os.path.join(cache_home, "urbanairship")
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    directory_stat = os.lstat(directory)
+    if stat.S_ISLNK(directory_stat.st_mode):
+        raise PermissionError("Token directory %s is a symlink" % directory)
+    _check_owner(directory_stat, directory)
+    if stat.S_IMODE(directory_stat.st_mode) & 0o077:
+        os.chmod(directory, 0o700)
+    return directory
+
+
+def _check_owner(file_stat: os.stat_result, path: str) -> None:
+    if hasattr(os, "getuid") and file_stat.st_uid != os.getuid():
+        raise PermissionError("%s is not owned by the current user" % path)
+
+
+def _open_owned(path: str, flags: int) -> int:
+    """Open ``path`` without following symlinks, refusing files of other users."""
+    fd = os.open(path, flags | getattr(os, "O_NOFOLLOW", 0), 0o600)
+    try:
+        _check_owner(os.fstat(fd), path)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+class FileTokenStore(TokenStore):
+    """Token store kept in a JSON file, shared by the processes on a host.
+
+    The file is readable only by its owner and is replaced atomically on each write.
+    Fetching a token holds an exclusive ``flock`` on a companion ``.lock`` file, so
+    only one process fetches a token at a time and the rest reuse it. Where
+    ``fcntl`` isn't available the lock only applies within the process.
+
+    The token file and lock file must belong to the current user; a file owned by
+    anyone else, or a symlink, raises ``PermissionError`` rather than being trusted.
+
+    :param path: [optional] Path of the token file. Defaults to ``tokens.json`` in
+        an ``urbanairship`` directory under ``$XDG_CACHE_HOME`` or ``~/.cache``,
+        created readable only by the current user.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or os.path.join(_default_directory(), "tokens.json")
+        self._thread_lock = threading.Lock()
+
+    def _read(self) -> Dict[str, StoredToken]:
+        try:
+            with os.fdopen(_open_owned(self.path, os.O_RDONLY)) as token_file:
+                data = json.load(token_file)
+            return {
+                cache_key: (entry["access_token"], int(entry["expires_at"]))
+                for cache_key, entry in data.items()
+            }
+        except FileNotFoundError:
+            return {}
+        except (ValueError, TypeError, KeyError, AttributeError):
+            logger.warning("Ignoring unreadable OAuth token file %s", self.path)
+            return {}
+
+    def get(self, cache_key: str) -> Optional[StoredToken]:
+        return self._read().get(cache_key)
+
+    def set(self, cache_key: str, token: StoredToken) -> None:
+        now = time.time()
+        tokens = {k: v for k, v in self._read().items() if v[1] > now}
+        tokens[cache_key] = token
+        data = {k: {"access_token": v[0], "expires_at": v[1]} for k, v in tokens.items()}
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".urbanairship-tokens-")
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(data, tmp_file)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @contextlib.contextmanager
+    def lock(self, cache_key: str) -> Iterator[None]:
+        with self._thread_lock:
+            if fcntl is None:  # pragma: no cover
+                yield
+                return
+            fd = _open_owned(self.path + ".lock", os.O_RDWR | os.O_CREAT)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
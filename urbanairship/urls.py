@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional, Tuple
 
 
 class Urls:
@@ -60,6 +60,8 @@ class Urls:
         self.custom_events_url = self.base_url + "custom-events/"
         self.tag_lists_url = self.base_url + "tag-lists/"
 
+        self._endpoints: Optional[List[Tuple[str, str]]] = None
+
     def get(self, endpoint: str) -> str:
         url: str = getattr(self, endpoint)
 
@@ -67,3 +69,25 @@ class Urls:
             raise AttributeError("No url for endpoint %s" % endpoint)
 
         return url
+
+    def endpoint_for(self, url: str) -> str:
+        """Name of the endpoint a request URL belongs to, e.g. 'push_url'.
+
+        The endpoint with the longest URL that prefixes ``url`` wins, so
+        ``channel_url + channel_id`` maps to 'channel_url'. Returns 'other' for URLs
+        outside the API.
+        """
+        if self._endpoints is None:
+            self._endpoints = sorted(
+                (
+                    (value, name)
+                    for name, value in vars(self).items()
+                    if isinstance(value, str) and name != "base_url"
+                ),
+                key=lambda item: len(item[0]),
+                reverse=True,
+            )
+        for prefix, name in self._endpoints:
+            if url.startswith(prefix):
+                return name
+        return "other"